@@ -11,10 +11,14 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from config import Config
 from database import db, init_db
+from metrics import init_metrics
+from profiling import init_profiling
+from sql_monitor import init_sql_monitor
 from routes.auth import auth_bp
 from routes.messages import messages_bp
 from routes.crypto import crypto_bp
 from routes.users import users_bp
+from services.crypto_service import init_dispatch
 
 app = Flask(__name__)
 app.config.from_object(Config)
@@ -22,6 +26,18 @@ app.config.from_object(Config)
 # Initialize database
 init_db(app)
 
+# Request/DB metrics and /metrics endpoint
+init_metrics(app)
+
+# Scalar/vector cipher path thresholds (profile file or startup calibration)
+init_dispatch(app)
+
+# Per-request SQL statistics, slow-query log and N+1 detection
+init_sql_monitor(app)
+
+# Opt-in per-request profiling
+init_profiling(app)
+
 # CORS configuration
 CORS(app, origins=Config.CORS_ORIGINS, supports_credentials=True)
 
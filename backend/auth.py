@@ -1,8 +1,10 @@
 import jwt
+import time
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import wraps, lru_cache
 from flask import request, jsonify
 from config import Config
+from metrics import register_cache
 
 def generate_token(user_id, username):
     """Generate JWT token"""
@@ -13,16 +15,28 @@ def generate_token(user_id, username):
     }
     return jwt.encode(payload, Config.JWT_SECRET, algorithm='HS256')
 
-def verify_token(token):
-    """Verify JWT token and return payload"""
+@lru_cache(maxsize=4096)
+def _decode_token(token):
+    """Decode and verify JWT signature (cached per token string)"""
     try:
-        payload = jwt.decode(token, Config.JWT_SECRET, algorithms=['HS256'])
-        return payload
+        return jwt.decode(token, Config.JWT_SECRET, algorithms=['HS256'])
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
 
+
+register_cache('jwt', _decode_token.cache_info)
+
+
+def verify_token(token):
+    """Verify JWT token and return payload"""
+    payload = _decode_token(token)
+    # Cached payloads may have expired since they were first verified
+    if payload is None or payload['exp'] <= time.time():
+        return None
+    return payload
+
 def get_token_from_header():
     """Extract token from Authorization header"""
     auth_header = request.headers.get('Authorization')
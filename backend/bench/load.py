@@ -0,0 +1,350 @@
+"""
+Load-test harness
+
+Boots the Flask app against a temporary SQLite database, registers N users and
+drives a weighted mix of login / send / list / users / decrypt requests from
+many concurrent clients. Prints throughput and p50/p95/p99 latency per
+endpoint as JSON.
+
+Usage (from the backend directory):
+    python -m bench.load --users 20 --clients 32 --duration 15
+    python -m bench.load --mix login=1,send=4,list=4,users=1,decrypt=2 --output before.json
+    python -m bench.load --url http://localhost:5000   # existing server, no boot
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+import http.client
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MIX = 'login=1,send=3,list=3,users=2,decrypt=2'
+
+
+# ==================== SERVER ====================
+
+class LocalServer:
+    """The backend app served by a threaded werkzeug server on a temp SQLite DB"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self.host = host
+        self.port = port
+        self.tmpdir = None
+        self._server = None
+        self._thread = None
+
+    def start(self) -> str:
+        self.tmpdir = tempfile.mkdtemp(prefix='bench-')
+        # Config reads the environment at import time
+        os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(self.tmpdir, 'bench.db')
+        sys.path.insert(0, BACKEND_DIR)
+
+        from werkzeug.serving import make_server, WSGIRequestHandler
+        from app import app
+
+        class QuietHandler(WSGIRequestHandler):
+            # Keep-alive connections, no per-request access log
+            protocol_version = 'HTTP/1.1'
+
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self._server = make_server(self.host, self.port, app, threaded=True, request_handler=QuietHandler)
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return f'http://{self.host}:{self.port}'
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+        if self.tmpdir:
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+# ==================== CLIENT ====================
+
+class ApiClient:
+    """Minimal JSON client, one keep-alive connection per worker thread"""
+
+    def __init__(self, base_url: str):
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def request(self, method: str, path: str, body=None, token: str = None):
+        headers = {'Content-Type': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        payload = json.dumps(body) if body is not None else None
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                if response.getheader('Connection', '').lower() == 'close' or response.version == 10:
+                    conn.close()
+                    self._local.conn = None
+                return response.status, (json.loads(data) if data else None)
+            except (http.client.HTTPException, ConnectionError):
+                # Stale keep-alive connection: reconnect once
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+
+# ==================== SCENARIO ====================
+
+class Scenario:
+    """Registered users plus the request mix they execute"""
+
+    def __init__(self, client: ApiClient, mix: dict, method: str, key: str):
+        self.client = client
+        self.ops = list(mix.keys())
+        self.weights = list(mix.values())
+        self.method = method
+        self.key = key
+        self.users = []  # (id, username, password, token)
+        self.samples_encrypted = []
+
+    def setup(self, num_users: int, concurrency: int):
+        prefix = f'bench{int(time.time())}_{random.randint(0, 9999)}'
+
+        def register(i):
+            username, password = f'{prefix}_{i}', 'bench-password'
+            status, body = self.client.request('POST', '/api/auth/register',
+                                               {'username': username, 'password': password})
+            if status != 201:
+                raise RuntimeError(f'Registration failed ({status}): {body}')
+            return (body['user']['id'], username, password, body['access_token'])
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            self.users = list(pool.map(register, range(num_users)))
+
+        # Seed one message so decrypt has real ciphertext from the start
+        _, body = self._send(self.users[0])
+        self.samples_encrypted.append(body['encrypted_content'])
+
+    def _send(self, user):
+        receiver = random.choice(self.users)
+        return self.client.request('POST', '/api/messages', {
+            'receiver_id': receiver[0],
+            'text': 'LOAD TEST MESSAGE NUMBER %d' % random.randint(0, 10 ** 6),
+            'method': self.method,
+            'key': self.key,
+        }, user[3])
+
+    def pick(self) -> str:
+        """Randomly choose the next operation according to the mix"""
+        return random.choices(self.ops, self.weights)[0]
+
+    def run(self, op: str) -> int:
+        """Execute one operation; returns the HTTP status"""
+        user = random.choice(self.users)
+
+        if op == 'login':
+            status, _ = self.client.request('POST', '/api/auth/login',
+                                            {'username': user[1], 'password': user[2]})
+        elif op == 'send':
+            status, body = self._send(user)
+            if status == 201 and len(self.samples_encrypted) < 1000:
+                self.samples_encrypted.append(body['encrypted_content'])
+        elif op == 'list':
+            status, _ = self.client.request('GET', '/api/messages', token=user[3])
+        elif op == 'users':
+            status, _ = self.client.request('GET', '/api/users', token=user[3])
+        elif op == 'decrypt':
+            status, _ = self.client.request('POST', '/api/messages/decrypt', {
+                'encrypted': random.choice(self.samples_encrypted),
+                'method': self.method,
+                'key': self.key,
+            })
+        else:
+            raise ValueError(f'Unknown operation: {op}')
+        return status
+
+
+# ==================== STATISTICS ====================
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        'requests': count,
+        'errors': errors,
+        'throughput_rps': round(count / elapsed, 2) if elapsed else 0.0,
+        'mean_ms': round(sum(latencies) / count * 1000, 3) if count else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'max_ms': round(latencies[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+def parse_mix(spec: str) -> dict:
+    """Parse 'login=1,send=3' into {'login': 1.0, 'send': 3.0}"""
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ('login', 'send', 'list', 'users', 'decrypt'):
+            raise ValueError(f'Unknown operation in mix: {name}')
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+# ==================== RUNNER ====================
+
+def run_load(base_url: str, num_users: int, clients: int, duration: float, requests: int,
+             mix: dict, method: str, key: str, warmup: float) -> dict:
+    """
+    Run the load test against base_url
+
+    Stops after `requests` total requests if given, otherwise after
+    `duration` seconds.
+
+    Returns:
+        Result dictionary (see module docstring)
+    """
+    client = ApiClient(base_url)
+    scenario = Scenario(client, mix, method, key)
+    scenario.setup(num_users, clients)
+
+    lock = threading.Lock()
+    latencies = {op: [] for op in mix}
+    errors = {op: 0 for op in mix}
+    issued = [0]
+    measuring = threading.Event()
+    stop = threading.Event()
+
+    def worker():
+        # Per-thread buffers, merged once at the end
+        local_latencies = {op: [] for op in mix}
+        local_errors = {op: 0 for op in mix}
+        while not stop.is_set():
+            if requests:
+                with lock:
+                    if issued[0] >= requests:
+                        break
+                    issued[0] += 1
+            # The operation is chosen first so that exceptions (timeouts,
+            # refused connections) count as errors of that endpoint
+            op = scenario.pick()
+            start = time.perf_counter()
+            try:
+                failed = scenario.run(op) >= 400
+            except Exception:
+                failed = True
+            elapsed = time.perf_counter() - start
+            # Only warm-up samples are dropped
+            if not measuring.is_set():
+                continue
+            if failed:
+                local_errors[op] += 1
+            else:
+                local_latencies[op].append(elapsed)
+        with lock:
+            for op in mix:
+                latencies[op].extend(local_latencies[op])
+                errors[op] += local_errors[op]
+
+    if requests or not warmup:
+        # Fixed request count: everything is measured
+        warmup = 0
+        measuring.set()
+    started = time.perf_counter()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+
+    if warmup:
+        time.sleep(warmup)
+        measuring.set()
+        started = time.perf_counter()
+
+    if not requests:
+        time.sleep(duration)
+        stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        'config': {
+            'users': num_users,
+            'clients': clients,
+            'duration_s': round(elapsed, 3),
+            'mix': mix,
+            'method': method,
+        },
+        'total': summarize(all_latencies, sum(errors.values()), elapsed),
+        'endpoints': {op: summarize(latencies[op], errors[op], elapsed) for op in mix},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Backend load generator')
+    parser.add_argument('--url', help='Target an existing server instead of booting one')
+    parser.add_argument('--users', type=int, default=20, help='Users to register')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=10.0, help='Measured seconds')
+    parser.add_argument('--requests', type=int, default=0, help='Stop after this many requests instead')
+    parser.add_argument('--warmup', type=float, default=1.0, help='Unmeasured warmup seconds')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Weighted operations (default: {DEFAULT_MIX})')
+    parser.add_argument('--method', default='vigenere', help='Cipher used by send/decrypt')
+    parser.add_argument('--key', default='KEY', help='Cipher key used by send/decrypt')
+    parser.add_argument('--output', help='Also write the JSON result to this file')
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        server = LocalServer()
+        base_url = server.start()
+
+    try:
+        result = run_load(base_url, args.users, args.clients, args.duration, args.requests,
+                          parse_mix(args.mix), args.method, args.key, args.warmup)
+    finally:
+        if server is not None:
+            server.stop()
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,4 +10,29 @@ class Config:
     SQLALCHEMY_DATABASE_URI = DATABASE_URL
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     CORS_ORIGINS = ['http://localhost:3000']
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+    # SQL instrumentation (see sql_monitor.py)
+    SQL_SLOW_QUERY_THRESHOLD = float(os.getenv('SQL_SLOW_QUERY_THRESHOLD', '0.1'))  # seconds
+    SQL_EXPLAIN_SLOW_QUERIES = os.getenv('SQL_EXPLAIN_SLOW_QUERIES', 'true').lower() == 'true'
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', '3'))
+    SQL_STATS_HEADER = os.getenv('SQL_STATS_HEADER', 'false').lower() == 'true'  # always on in debug mode
+
+    # On-demand request profiling (see profiling.py)
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+    PROFILING_SECRET = os.getenv('PROFILING_SECRET')
+    PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+    PROFILING_ENGINE = os.getenv('PROFILING_ENGINE', 'cprofile')  # cprofile or sampling
+    PROFILING_INTERVAL = float(os.getenv('PROFILING_INTERVAL', '0.001'))
+    PROFILING_DIR = os.getenv('PROFILING_DIR', 'profiles')
+    PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', '500'))
+
+    # N-gram statistics (see services/stats_service.py)
+    NGRAM_FLUSH_INTERVAL = float(os.getenv('NGRAM_FLUSH_INTERVAL', '1.0'))  # seconds
+    # /api/messages/stats answers only when at least this many messages are counted
+    NGRAM_STATS_MIN_MESSAGES = int(os.getenv('NGRAM_STATS_MIN_MESSAGES', '100'))
+
+    # Scalar/vector cipher path thresholds (see crypto_service.init_dispatch)
+    CIPHER_PROFILE = os.getenv('CIPHER_PROFILE')  # JSON from python -m kriptoloji.bench.calibrate
+    CIPHER_CALIBRATE = os.getenv('CIPHER_CALIBRATE', 'false').lower() == 'true'
 
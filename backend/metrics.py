@@ -0,0 +1,362 @@
+"""
+Prometheus-style metrics
+
+Low-overhead counters and histograms exposed on /metrics in the Prometheus
+text format. Every thread writes into its own shard, so the hot path never
+takes a lock; shards are only merged when /metrics is scraped. When a thread
+exits, its shard is folded into the metric's base totals and dropped.
+"""
+import time
+import weakref
+import threading
+from bisect import bisect_left
+
+from flask import Response, g, request
+
+# Latency buckets (seconds)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Input size buckets (characters, 16 B .. 16 MB)
+SIZE_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Query count buckets (statements per request)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+
+class _ShardHolder:
+    """Thread-local owner of a shard; collected when its thread exits"""
+    __slots__ = ('shard', '__weakref__')
+
+    def __init__(self, shard: dict):
+        self.shard = shard
+
+
+class _Metric:
+    """Base class for sharded metrics"""
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards = []
+        # Totals of shards whose threads have exited
+        self._base = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        """Return the calling thread's shard, creating it on first use"""
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            holder = _ShardHolder({})
+            self._local.holder = holder
+            # The thread-local holder is released when the thread exits
+            weakref.finalize(holder, self._retire, holder.shard)
+            # Only taken once per thread
+            with self._shards_lock:
+                self._shards.append(holder.shard)
+        return holder.shard
+
+    def _retire(self, shard: dict):
+        """Fold a dead thread's shard into the base totals"""
+        with self._shards_lock:
+            for labels, value in shard.items():
+                total = self._base.get(labels)
+                # New values, never mutated in place: scrapes hold shallow copies
+                self._base[labels] = value if total is None else self._combine(total, value)
+            self._shards = [s for s in self._shards if s is not shard]
+
+    def _combine(self, total, value):
+        raise NotImplementedError
+
+    def _snapshot(self):
+        """Copy the base totals and all live shards (dict.copy is atomic under the GIL)"""
+        with self._shards_lock:
+            shards = list(self._shards)
+            base = self._base.copy()
+        return [base] + [shard.copy() for shard in shards]
+
+    def _format_labels(self, labelvalues, extra=None) -> str:
+        pairs = list(zip(self.labelnames, labelvalues))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        body = ','.join(f'{k}="{_escape(str(v))}"' for k, v in pairs)
+        return '{' + body + '}'
+
+    def expose(self) -> list:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.type_name}']
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+    type_name = 'counter'
+
+    def _combine(self, total, value):
+        return total + value
+
+    def inc(self, *labelvalues, amount=1):
+        shard = self._shard()
+        shard[labelvalues] = shard.get(labelvalues, 0) + amount
+
+    def values(self) -> dict:
+        """Merged value per label tuple"""
+        merged = {}
+        for shard in self._snapshot():
+            for labels, value in shard.items():
+                merged[labels] = merged.get(labels, 0) + value
+        return merged
+
+    def _samples(self) -> list:
+        return [f'{self.name}{self._format_labels(labels)} {_fmt(value)}'
+                for labels, value in sorted(self.values().items())]
+
+
+class Gauge(_Metric):
+    """Gauge whose values are computed at scrape time by a callback"""
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), callback=None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _samples(self) -> list:
+        values = self.callback() if self.callback else {}
+        return [f'{self.name}{self._format_labels(labels)} {_fmt(value)}'
+                for labels, value in sorted(values.items())]
+
+
+class CallbackCounter(Gauge):
+    """Counter whose cumulative values are read from elsewhere at scrape time"""
+    type_name = 'counter'
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram"""
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def _combine(self, total, value):
+        return [a + b for a, b in zip(total, value)]
+
+    def observe(self, value, *labelvalues):
+        shard = self._shard()
+        state = shard.get(labelvalues)
+        if state is None:
+            # [bucket counts..., +Inf count, sum]
+            state = [0] * (len(self.buckets) + 2)
+            shard[labelvalues] = state
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def values(self) -> dict:
+        """Merged [bucket counts..., +Inf count, sum] per label tuple"""
+        merged = {}
+        for shard in self._snapshot():
+            for labels, state in shard.items():
+                total = merged.get(labels)
+                if total is None:
+                    merged[labels] = list(state)
+                else:
+                    for i, value in enumerate(state):
+                        total[i] += value
+        return merged
+
+    def _samples(self) -> list:
+        lines = []
+        for labels, state in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), state[:-1]):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else _fmt(bound)
+                lines.append(f'{self.name}_bucket{self._format_labels(labels, ("le", le))} {cumulative}')
+            lines.append(f'{self.name}_sum{self._format_labels(labels)} {_fmt(state[-1])}')
+            lines.append(f'{self.name}_count{self._format_labels(labels)} {cumulative}')
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together on /metrics"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def expose(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+# ==================== METRICS ====================
+
+REGISTRY = Registry()
+
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route',
+    ('route', 'method', 'status'),
+))
+
+CIPHER_LATENCY = REGISTRY.register(Histogram(
+    'cipher_operation_duration_seconds',
+    'Encrypt/decrypt latency by cipher method',
+    ('method', 'operation'),
+))
+
+CIPHER_INPUT_SIZE = REGISTRY.register(Histogram(
+    'cipher_input_size_chars',
+    'Encrypt/decrypt input size by cipher method',
+    ('method', 'operation'),
+    buckets=SIZE_BUCKETS,
+))
+
+CIPHER_PATH = REGISTRY.register(Counter(
+    'cipher_path_total',
+    'Encrypt/decrypt calls by implementation path (scalar, vector, fused)',
+    ('method', 'operation', 'path'),
+))
+
+# Callback set by crypto_service (active thresholds)
+CIPHER_SCALAR_THRESHOLD = REGISTRY.register(Gauge(
+    'cipher_scalar_threshold_letters',
+    'Input letters per key unit below which the scalar path is chosen',
+    ('method', 'operation'),
+))
+
+DB_QUERIES_PER_REQUEST = REGISTRY.register(Histogram(
+    'db_queries_per_request',
+    'Number of SQL statements executed per request',
+    ('route',),
+    buckets=QUERY_COUNT_BUCKETS,
+))
+
+DB_QUERY_DURATION_PER_REQUEST = REGISTRY.register(Histogram(
+    'db_query_duration_per_request_seconds',
+    'Total SQL time spent per request',
+    ('route',),
+))
+
+DB_SLOW_QUERIES = REGISTRY.register(Counter(
+    'db_slow_queries_total',
+    'SQL statements slower than SQL_SLOW_QUERY_THRESHOLD',
+    ('route',),
+))
+
+DB_N_PLUS_ONE = REGISTRY.register(Counter(
+    'db_n_plus_one_total',
+    'Statements repeated within one request (likely N+1 lazy loads)',
+    ('route',),
+))
+
+# name -> function returning (hits, misses)
+_cache_sources = {}
+
+
+def register_cache(name: str, stats):
+    """
+    Register a cache whose hit ratio is exposed on /metrics
+
+    Args:
+        name: Cache label (e.g. 'jwt', 'cipher_key')
+        stats: Callable returning (hits, misses); functools.lru_cache's
+               cache_info works directly
+    """
+    _cache_sources[name] = stats
+
+
+def _cache_counts() -> dict:
+    counts = {}
+    for name, stats in _cache_sources.items():
+        info = stats()
+        counts[name] = (info[0], info[1])
+    return counts
+
+
+def _cache_requests():
+    values = {}
+    for name, (hits, misses) in _cache_counts().items():
+        values[(name, 'hit')] = hits
+        values[(name, 'miss')] = misses
+    return values
+
+
+def _cache_ratio():
+    values = {}
+    for name, (hits, misses) in _cache_counts().items():
+        total = hits + misses
+        values[(name,)] = (hits / total) if total else 0.0
+    return values
+
+
+CACHE_REQUESTS = REGISTRY.register(CallbackCounter(
+    'cache_requests_total',
+    'Cache lookups by result',
+    ('cache', 'result'),
+    callback=_cache_requests,
+))
+
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    'cache_hit_ratio',
+    'Cache hit ratio since process start',
+    ('cache',),
+    callback=_cache_ratio,
+))
+
+
+# ==================== INSTRUMENTATION ====================
+
+def route_label() -> str:
+    """Route template of the current request (never the raw path, to bound cardinality)"""
+    rule = request.url_rule
+    return rule.rule if rule is not None else 'unmatched'
+
+
+def _before_request():
+    g._metrics_start = time.perf_counter()
+
+
+def _after_request(response):
+    start = g.get('_metrics_start')
+    if start is not None:
+        REQUEST_LATENCY.observe(time.perf_counter() - start, route_label(), request.method, str(response.status_code))
+    return response
+
+
+def metrics_view():
+    """Render all metrics in the Prometheus text exposition format"""
+    return Response(REGISTRY.expose(), mimetype='text/plain; version=0.0.4')
+
+
+def init_metrics(app):
+    """Initialize request instrumentation and the /metrics endpoint"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
@@ -3,6 +3,7 @@ Database models
 """
 from .user import User
 from .message import Message
+from .ngram_count import NgramCount
 
-__all__ = ['User', 'Message']
+__all__ = ['User', 'Message', 'NgramCount']
 
@@ -0,0 +1,26 @@
+"""
+N-gram counter model
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import db
+
+
+class NgramCount(db.Model):
+    """
+    How often one letter follows one prefix in one method's stored ciphertext.
+
+    prefix '' -> monograms, 'T' -> bigrams TA..TZ, 'TH' -> trigrams THA..THZ;
+    letter is the index (0-25) of the following letter. The 26 rows of a
+    (method, prefix) are adjacent in the primary key, and a new message only
+    adds to `count` (see services.stats_service.flush_counters). prefix '#'
+    counts messages; method '' with prefix '@' holds the backfill cutoff id.
+    """
+    __tablename__ = 'ngram_counts'
+
+    method = db.Column(db.String(50), primary_key=True)
+    prefix = db.Column(db.String(2), primary_key=True)
+    letter = db.Column(db.SmallInteger, primary_key=True, autoincrement=False)
+    count = db.Column(db.BigInteger, nullable=False)
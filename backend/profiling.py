@@ -0,0 +1,345 @@
+"""
+On-demand request profiling
+
+Opt-in middleware that profiles selected requests and writes one profile per
+request into a rotating directory. A request is profiled when profiling is
+enabled in config and either:
+- it carries a valid signed X-Profile-Token header, or
+- it is picked by the PROFILING_SAMPLE_RATE random sample.
+
+Profiles are pstats-compatible files, so they can be opened with pstats,
+snakeviz, etc. or aggregated with the CLI at the bottom of this module:
+
+    python profiling.py token --ttl 300
+    python profiling.py report --top 25 --route /api/messages
+"""
+import os
+import sys
+import hmac
+import time
+import uuid
+import random
+import marshal
+import hashlib
+import argparse
+import threading
+import cProfile
+import pstats
+
+PROFILE_HEADER = 'X-Profile-Token'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+
+# Modules included in reports by default
+DEFAULT_SCOPES = ('kriptoloji', 'backend')
+
+
+# ==================== SIGNED HEADER ====================
+
+def _sign(secret: str, expires: int) -> str:
+    return hmac.new(secret.encode('utf-8'), str(expires).encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def make_profile_token(secret: str, ttl: int = 300) -> str:
+    """
+    Create a value for the X-Profile-Token header
+
+    Args:
+        secret: PROFILING_SECRET of the target server
+        ttl: Token lifetime in seconds
+
+    Returns:
+        Token in "<expires>:<signature>" format
+    """
+    expires = int(time.time()) + ttl
+    return f'{expires}:{_sign(secret, expires)}'
+
+
+def verify_profile_token(secret: str, token: str) -> bool:
+    """Check signature and expiry of an X-Profile-Token value"""
+    if not secret or not token:
+        return False
+    try:
+        expires_str, signature = token.split(':', 1)
+        expires = int(expires_str)
+    except ValueError:
+        return False
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(signature, _sign(secret, expires))
+
+
+# ==================== PROFILERS ====================
+
+class _CProfileEngine:
+    """Deterministic profiler (cProfile)"""
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    def dump(self, path: str):
+        self._profile.dump_stats(path)
+
+
+class _SamplingEngine:
+    """
+    Statistical profiler
+
+    A background thread samples the request thread's stack every `interval`
+    seconds. Much lower overhead than cProfile on hot loops; the result is
+    written in the same marshal format as cProfile so pstats can read it
+    (call counts are sample counts).
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self._thread_id = None
+        self._stop = threading.Event()
+        self._sampler = None
+        # (file, line, func) -> [self samples, total samples]
+        self._counts = {}
+        # callee -> caller -> samples
+        self._callers = {}
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._sampler = threading.Thread(target=self._run, daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame):
+        seen = set()
+        callee = None
+        first = True
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_filename, code.co_firstlineno, code.co_name)
+            entry = self._counts.setdefault(key, [0, 0])
+            if first:
+                entry[0] += 1
+                first = False
+            # Recursive frames count once towards inclusive time
+            if key not in seen:
+                entry[1] += 1
+                seen.add(key)
+            if callee is not None:
+                callers = self._callers.setdefault(callee, {})
+                callers[key] = callers.get(key, 0) + 1
+            callee = key
+            frame = frame.f_back
+
+    def dump(self, path: str):
+        stats = {}
+        for key, (self_samples, total_samples) in self._counts.items():
+            callers = {
+                caller: (n, n, 0.0, 0.0) for caller, n in self._callers.get(key, {}).items()
+            }
+            stats[key] = (
+                total_samples, total_samples,
+                self_samples * self.interval, total_samples * self.interval,
+                callers,
+            )
+        with open(path, 'wb') as f:
+            marshal.dump(stats, f)
+
+
+def _new_engine(name: str, interval: float):
+    if name == 'sampling':
+        return _SamplingEngine(interval)
+    return _CProfileEngine()
+
+
+# ==================== STORAGE ====================
+
+def _route_slug(route: str) -> str:
+    slug = ''.join(c if c.isalnum() else '_' for c in route).strip('_')
+    return slug or 'root'
+
+
+def _rotate(directory: str, max_files: int):
+    """Delete the oldest profiles so at most max_files remain"""
+    files = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.prof')]
+    if len(files) <= max_files:
+        return
+    files.sort(key=os.path.getmtime)
+    for path in files[:len(files) - max_files]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _profile_path(directory: str, route: str, request_id: str) -> str:
+    # <epoch ms>__<route>__<request id>.prof
+    name = f'{int(time.time() * 1000)}__{_route_slug(route)}__{request_id}.prof'
+    return os.path.join(directory, name)
+
+
+# ==================== MIDDLEWARE ====================
+
+def init_profiling(app):
+    """Register profiling hooks if PROFILING_ENABLED is set"""
+    from flask import g, request
+
+    config = app.config
+    if not config.get('PROFILING_ENABLED'):
+        return
+
+    directory = config.get('PROFILING_DIR', 'profiles')
+    secret = config.get('PROFILING_SECRET')
+    sample_rate = float(config.get('PROFILING_SAMPLE_RATE', 0.0))
+    max_files = int(config.get('PROFILING_MAX_FILES', 500))
+    engine_name = config.get('PROFILING_ENGINE', 'cprofile')
+    interval = float(config.get('PROFILING_INTERVAL', 0.001))
+    os.makedirs(directory, exist_ok=True)
+
+    def should_profile() -> bool:
+        if verify_profile_token(secret, request.headers.get(PROFILE_HEADER)):
+            return True
+        return sample_rate > 0 and random.random() < sample_rate
+
+    @app.before_request
+    def start_profile():
+        if not should_profile():
+            return
+        engine = _new_engine(engine_name, interval)
+        try:
+            engine.start()
+        except ValueError:
+            # Another profiler is already active on this thread
+            return
+        g._profile_engine = engine
+        g._profile_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+
+    @app.after_request
+    def tag_response(response):
+        if g.get('_profile_engine') is not None:
+            response.headers[PROFILE_ID_HEADER] = g._profile_id
+        return response
+
+    @app.teardown_request
+    def stop_profile(exc):
+        engine = g.pop('_profile_engine', None)
+        if engine is None:
+            return
+        engine.stop()
+        rule = request.url_rule
+        route = rule.rule if rule is not None else 'unmatched'
+        engine.dump(_profile_path(directory, route, _route_slug(g._profile_id)))
+        _rotate(directory, max_files)
+
+
+# ==================== REPORT CLI ====================
+
+def _select_files(directory: str, route: str = None) -> list:
+    slug = _route_slug(route) if route else None
+    files = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.prof'):
+            continue
+        parts = name[:-len('.prof')].split('__')
+        if slug and (len(parts) < 3 or parts[1] != slug):
+            continue
+        files.append(os.path.join(directory, name))
+    return files
+
+
+def _in_scope(filename: str, scopes) -> bool:
+    if not scopes:
+        return True
+    normalized = filename.replace('\\', '/')
+    return any(f'/{scope}/' in normalized for scope in scopes)
+
+
+def aggregate_profiles(directory: str, top: int = 20, sort: str = 'tottime', route: str = None, scopes=DEFAULT_SCOPES):
+    """
+    Aggregate profiles into the top-N hot functions
+
+    Args:
+        directory: Profile directory
+        top: Number of functions to return
+        sort: 'tottime' (own time) or 'cumtime' (including callees)
+        route: Only include profiles of this route (e.g. '/api/messages')
+        scopes: Only include functions whose file lives under one of these
+                package directories (empty for everything)
+
+    Returns:
+        (number of profiles, list of dicts sorted by `sort`)
+    """
+    files = _select_files(directory, route)
+    if not files:
+        return 0, []
+
+    stats = pstats.Stats(files[0])
+    for path in files[1:]:
+        stats.add(path)
+
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, _) in stats.stats.items():
+        if not _in_scope(filename, scopes):
+            continue
+        rows.append({
+            'function': f'{filename}:{line}({func})',
+            'calls': nc,
+            'tottime': tt,
+            'cumtime': ct,
+        })
+    rows.sort(key=lambda row: row[sort], reverse=True)
+    return len(files), rows[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Request profiling tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    token_parser = sub.add_parser('token', help='Create an X-Profile-Token header value')
+    token_parser.add_argument('--secret', default=os.getenv('PROFILING_SECRET'))
+    token_parser.add_argument('--ttl', type=int, default=300)
+
+    report_parser = sub.add_parser('report', help='Top-N hot functions across stored profiles')
+    report_parser.add_argument('--dir', default=os.getenv('PROFILING_DIR', 'profiles'))
+    report_parser.add_argument('--top', type=int, default=20)
+    report_parser.add_argument('--sort', choices=['tottime', 'cumtime'], default='tottime')
+    report_parser.add_argument('--route', help='Only profiles of this route, e.g. /api/messages')
+    report_parser.add_argument('--all', action='store_true', help='Include stdlib/third-party functions')
+    report_parser.add_argument('--json', action='store_true', help='Machine-readable output')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'token':
+        if not args.secret:
+            parser.error('--secret or PROFILING_SECRET is required')
+        print(make_profile_token(args.secret, args.ttl))
+        return 0
+
+    scopes = () if args.all else DEFAULT_SCOPES
+    count, rows = aggregate_profiles(args.dir, args.top, args.sort, args.route, scopes)
+
+    if args.json:
+        import json
+        print(json.dumps({'profiles': count, 'functions': rows}, indent=2))
+        return 0
+
+    print(f'{count} profile(s) in {args.dir}')
+    print(f'{"calls":>10} {"tottime":>10} {"cumtime":>10}  function')
+    for row in rows:
+        print(f'{row["calls"]:>10} {row["tottime"]:>10.4f} {row["cumtime"]:>10.4f}  {row["function"]}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,7 +6,12 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from flask import Blueprint, request, jsonify
+from auth import require_auth
 from services.crypto_service import encrypt_text, decrypt_text, get_methods_info
+from services.analysis_service import (
+    analyze_shift, analyze_vigenere, analyze_substitution, analyze_transposition, analyze_hill,
+    identify_ciphertext
+)
 
 crypto_bp = Blueprint('crypto', __name__)
 
@@ -85,3 +90,213 @@ def get_methods():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+
+
+@crypto_bp.route('/api/crypto/analyze/shift', methods=['POST'])
+@require_auth
+def analyze_shift_route():
+    """
+    Break a shift/caesar ciphertext without the key.
+
+    Body:
+        ciphertext: Encrypted text
+        language: 'en' (default) or 'tr'
+        top: Number of candidates to return (default 5)
+
+    Returns:
+        JSON object with candidates ranked by chi-squared distance
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+
+        ciphertext = data.get('ciphertext')
+        if not ciphertext:
+            return jsonify({'error': 'ciphertext is required'}), 400
+
+        candidates = analyze_shift(ciphertext, data.get('language', 'en'), data.get('top'))
+
+        return jsonify({'candidates': candidates}), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@crypto_bp.route('/api/crypto/analyze/vigenere', methods=['POST'])
+@require_auth
+def analyze_vigenere_route():
+    """
+    Recover the key of a vigenere ciphertext.
+
+    Body:
+        ciphertext: Encrypted text
+        language: 'en' (default) or 'tr'
+        max_period: Longest key length to try (default 20)
+        top: Number of key lengths to try (default 5)
+
+    Returns:
+        JSON object with candidate keys ranked by score
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+
+        ciphertext = data.get('ciphertext')
+        if not ciphertext:
+            return jsonify({'error': 'ciphertext is required'}), 400
+
+        candidates = analyze_vigenere(ciphertext, data.get('language', 'en'),
+                                      data.get('max_period'), data.get('top'))
+
+        return jsonify({'candidates': candidates}), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@crypto_bp.route('/api/crypto/analyze/substitution', methods=['POST'])
+@require_auth
+def analyze_substitution_route():
+    """
+    Recover the key of a substitution ciphertext.
+
+    Body:
+        ciphertext: Encrypted text
+        restarts: Number of hill-climbing restarts (default 40)
+        top: Number of candidates to return (default 5)
+
+    Returns:
+        JSON object with candidate keys ranked by quadgram score
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+
+        ciphertext = data.get('ciphertext')
+        if not ciphertext:
+            return jsonify({'error': 'ciphertext is required'}), 400
+
+        candidates = analyze_substitution(ciphertext, data.get('restarts'), data.get('top'))
+
+        return jsonify({'candidates': candidates}), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@crypto_bp.route('/api/crypto/analyze/transposition', methods=['POST'])
+@require_auth
+def analyze_transposition_route():
+    """
+    Search the key of a columnar transposition or rail fence ciphertext.
+
+    Body:
+        ciphertext: Encrypted text
+        method: 'columnar_transposition' or 'rail_fence'
+        max_key: Longest key (columns) or most rails to try
+        top: Number of candidates to return (default 5)
+
+    Returns:
+        JSON object with candidate keys ranked by quadgram score
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+
+        ciphertext = data.get('ciphertext')
+        method = data.get('method')
+        if not ciphertext or not method:
+            return jsonify({'error': 'ciphertext and method are required'}), 400
+
+        candidates = analyze_transposition(ciphertext, method, data.get('max_key'), data.get('top'))
+
+        return jsonify({'candidates': candidates}), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@crypto_bp.route('/api/crypto/analyze/hill', methods=['POST'])
+@require_auth
+def analyze_hill_route():
+    """
+    Recover a hill key matrix from a known plaintext/ciphertext pair.
+
+    Body:
+        plaintext: Known plaintext (at least size*size letters)
+        ciphertext: Encrypted text
+        size: Key matrix size
+
+    Returns:
+        JSON object with the key matrix
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+
+        plaintext = data.get('plaintext')
+        ciphertext = data.get('ciphertext')
+        size = data.get('size')
+        if not plaintext or not ciphertext or size is None:
+            return jsonify({'error': 'plaintext, ciphertext and size are required'}), 400
+
+        key = analyze_hill(plaintext, ciphertext, size)
+
+        return jsonify({'key': key}), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+@crypto_bp.route('/api/crypto/analyze/identify', methods=['POST'])
+@require_auth
+def analyze_identify_route():
+    """
+    Guess the method of a ciphertext received without metadata.
+
+    Body:
+        ciphertext: Encrypted text
+        language: 'en' (default) or 'tr'
+        top: Number of methods to return (default: all 11)
+
+    Returns:
+        JSON object with methods ranked by probability and the features used
+    """
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+
+        ciphertext = data.get('ciphertext')
+        if not ciphertext:
+            return jsonify({'error': 'ciphertext is required'}), 400
+
+        result = identify_ciphertext(ciphertext, data.get('language', 'en'), data.get('top'))
+
+        return jsonify(result), 200
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
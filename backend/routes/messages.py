@@ -5,11 +5,13 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from database import db
 from auth import require_auth
 from services.message_service import create_message, get_user_messages, decrypt_message_content
 from services.crypto_service import decrypt_text
+from services.stats_service import get_frequencies
+from services.strength_service import estimate_strength
 
 messages_bp = Blueprint('messages', __name__)
 
@@ -55,7 +57,8 @@ def send_message():
         "id": 10,
         "encrypted_content": "RIJVS",
         "method": "vigenere",
-        "created_at": "2025-01-10T21:00:00Z"
+        "created_at": "2025-01-10T21:00:00Z",
+        "strength": {"rating": "weak", "keyspace_bits": 4.7, "warnings": [...], ...}
     }
     
     Note: Plaintext is NOT returned in response, only encrypted content.
@@ -87,7 +90,15 @@ def send_message():
         message = create_message(sender_id, receiver_id, text, method, key)
         
         # Return message with encrypted content only (NO plaintext)
-        return jsonify(message.to_dict()), 201
+        response = message.to_dict()
+        # The message is already committed: a failing estimate must not turn
+        # the send into an error the client would retry
+        try:
+            response['strength'] = estimate_strength(method, key, message.encrypted_content)
+        except Exception:
+            current_app.logger.exception('Strength estimate failed for message %s', message.id)
+            response['strength'] = None
+        return jsonify(response), 201
         
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -96,6 +107,46 @@ def send_message():
         return jsonify({'error': str(e)}), 500
 
 
+@messages_bp.route('/api/messages/stats', methods=['GET'])
+@require_auth
+def get_message_stats():
+    """
+    Letter / n-gram frequencies of all stored ciphertext
+
+    Only answered once NGRAM_STATS_MIN_MESSAGES messages (of the method) are
+    counted, so the statistics never describe a few users' messages.
+
+    Query parameters:
+        method: Only messages of this method (default: all)
+        prefix: '' for letter frequencies, 'T' for letters following T,
+                'TH' for letters following TH
+    
+    Response:
+    {
+        "method": "vigenere",
+        "prefix": "TH",
+        "messages": 250,
+        "total": 120,
+        "frequencies": {"A": 0.05, ...}
+    }
+    """
+    try:
+        method = request.args.get('method') or None
+        prefix = request.args.get('prefix', '').upper()
+        
+        result = get_frequencies(prefix, method)
+        min_messages = current_app.config['NGRAM_STATS_MIN_MESSAGES']
+        if result['messages'] < min_messages:
+            return jsonify({'error': f'Statistics are available once {min_messages} messages are stored'}), 403
+        
+        return jsonify({'method': method, 'prefix': prefix, **result}), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @messages_bp.route('/api/messages/decrypt', methods=['POST'])
 def decrypt_message():
     """
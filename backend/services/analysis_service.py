@@ -0,0 +1,273 @@
+"""
+Analysis service for recovering plaintext without the key
+Wraps kriptoloji.analysis and shapes results for the API
+
+The solvers are CPU-bound, so input length and search sizes are capped
+here: values above a limit are clamped to it. The key searches
+(substitution, columnar transposition) share one process pool of ANALYSIS_WORKERS processes, created on first use.
+"""
+import sys
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Add parent directory to path to import kriptoloji
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from kriptoloji.analysis import (
+    brute_force_shift, solve_vigenere, solve_substitution,
+    search_columnar, search_rail_fence, recover_hill_key,
+    identify_cipher, METHODS, LANGUAGES
+)
+
+DEFAULT_TOP = 5
+DEFAULT_MAX_PERIOD = 20
+MAX_PERIOD_LIMIT = 100
+DEFAULT_RESTARTS = 20
+MAX_RESTARTS = 40
+DEFAULT_MAX_COLUMNS = 8
+MAX_COLUMNS_LIMIT = 10
+MAX_RAILS_LIMIT = 50
+MAX_HILL_SIZE = 10
+
+# Statistical analyses are linear and fast; the key searches are not
+MAX_CIPHERTEXT_LENGTH = 100000
+MAX_SEARCH_LENGTH = 3000
+
+# Worker processes shared by all key searches; concurrent requests queue on them
+ANALYSIS_WORKERS = 2
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _parse_top(top, limit: int) -> int:
+    """Validate the requested number of candidates"""
+    if top is None:
+        return DEFAULT_TOP
+    try:
+        top = int(top)
+    except (TypeError, ValueError):
+        raise ValueError('top must be an integer')
+    if top < 1:
+        raise ValueError('top must be at least 1')
+    return min(top, limit)
+
+
+def _check_length(text: str, limit: int = MAX_CIPHERTEXT_LENGTH, name: str = 'ciphertext'):
+    """Reject texts too long to analyze on a request thread"""
+    if len(text) > limit:
+        raise ValueError(f'{name} must be at most {limit} characters for this analysis')
+
+
+def _parse_limit(value, default: int, minimum: int, limit: int, name: str) -> int:
+    """Validate an integer search size and clamp it to the server-side limit"""
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be an integer')
+    if value < minimum:
+        raise ValueError(f'{name} must be at least {minimum}')
+    return min(value, limit)
+
+
+def _analysis_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool shared by the key searches, creating it on first use.
+
+    Workers are started by a forkserver (spawn where unavailable) rather than
+    forked from the request thread, so they do not inherit the app's locks,
+    sockets or database connections.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+                context.set_forkserver_preload(['kriptoloji.analysis'])
+            else:
+                context = multiprocessing.get_context('spawn')
+            _pool = ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS, mp_context=context)
+        return _pool
+
+
+def _run_search(search, *args, **kwargs):
+    """Run a key search on the shared pool; a pool whose worker died is replaced"""
+    global _pool
+    pool = _analysis_pool()
+    try:
+        return search(*args, workers=ANALYSIS_WORKERS, executor=pool, **kwargs)
+    except BrokenProcessPool:
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        pool.shutdown(wait=False)
+        raise
+
+
+def _check_language(language: str):
+    """Reject languages without a frequency table"""
+    if language not in LANGUAGES:
+        raise ValueError(f"Unsupported language: {language}. Supported: {', '.join(LANGUAGES)}")
+
+
+def analyze_shift(ciphertext: str, language: str = 'en', top=None) -> list:
+    """
+    Rank all 26 shifts of a shift/caesar ciphertext.
+
+    Args:
+        ciphertext: Encrypted text
+        language: Letter frequency table to score against ('en' or 'tr')
+        top: Number of candidates to return (default 5, max 26)
+
+    Returns:
+        List of {'shift', 'plaintext', 'score'} dicts, best candidate first
+        (lower score = closer to the language)
+    """
+    _check_language(language)
+    _check_length(ciphertext)
+    candidates = brute_force_shift(ciphertext, language, _parse_top(top, 26))
+    return [
+        {'shift': shift, 'plaintext': plaintext, 'score': round(score, 4)}
+        for shift, plaintext, score in candidates
+    ]
+
+
+def analyze_vigenere(ciphertext: str, language: str = 'en', max_period=None, top=None) -> list:
+    """
+    Recover the key of a vigenere ciphertext.
+
+    Args:
+        ciphertext: Encrypted text
+        language: Letter frequency table to score against ('en' or 'tr')
+        max_period: Longest key length to try (default 20, clamped to 100)
+        top: Number of key lengths to try (default 5)
+
+    Returns:
+        List of {'key', 'plaintext', 'score'} dicts, best candidate first
+        (lower score = closer to the language)
+    """
+    _check_language(language)
+    _check_length(ciphertext)
+    max_period = _parse_limit(max_period, DEFAULT_MAX_PERIOD, 1, MAX_PERIOD_LIMIT, 'max_period')
+
+    candidates = solve_vigenere(ciphertext, max_period, language, _parse_top(top, max_period))
+    return [
+        {'key': key, 'plaintext': plaintext, 'score': round(score, 4)}
+        for key, plaintext, score in candidates
+    ]
+
+
+def analyze_substitution(ciphertext: str, restarts=None, top=None) -> list:
+    """
+    Recover the key of a substitution ciphertext (English quadgram scoring).
+
+    Args:
+        ciphertext: Encrypted text (a few hundred letters for reliable results,
+            at most MAX_SEARCH_LENGTH characters)
+        restarts: Number of hill-climbing restarts (default 20, clamped to 40)
+        top: Number of distinct candidates to return (default 5)
+
+    Returns:
+        List of {'key', 'plaintext', 'score'} dicts, best candidate first
+        (higher score = more likely)
+    """
+    _check_length(ciphertext, MAX_SEARCH_LENGTH)
+    restarts = _parse_limit(restarts, DEFAULT_RESTARTS, 1, MAX_RESTARTS, 'restarts')
+
+    candidates = _run_search(solve_substitution, ciphertext, restarts=restarts, top=_parse_top(top, restarts))
+    return [
+        {'key': key, 'plaintext': plaintext, 'score': round(score, 4)}
+        for key, plaintext, score in candidates
+    ]
+
+
+def analyze_transposition(ciphertext: str, method: str, max_key=None, top=None) -> list:
+    """
+    Search the key of a columnar transposition or rail fence ciphertext.
+
+    Args:
+        ciphertext: Encrypted text (at most MAX_SEARCH_LENGTH characters)
+        method: 'columnar_transposition' or 'rail_fence'
+        max_key: Longest key (columns, default 8, clamped to 10) or most rails
+            to try (clamped to 50)
+        top: Number of candidates to return (default 5)
+
+    Returns:
+        List of {'key', 'plaintext', 'score'} dicts, best candidate first
+        (higher score = more likely)
+    """
+    _check_length(ciphertext, MAX_SEARCH_LENGTH)
+    top = _parse_top(top, 50)
+
+    if method == 'columnar_transposition':
+        max_columns = _parse_limit(max_key, DEFAULT_MAX_COLUMNS, 2, MAX_COLUMNS_LIMIT, 'max_key')
+        candidates = _run_search(search_columnar, ciphertext, max_columns, top=top)
+    elif method == 'rail_fence':
+        max_rails = _parse_limit(max_key, MAX_RAILS_LIMIT, 2, MAX_RAILS_LIMIT, 'max_key')
+        candidates = search_rail_fence(ciphertext, max_rails, top=top)
+    else:
+        raise ValueError(f"Unsupported method: {method}. Supported: columnar_transposition, rail_fence")
+
+    return [
+        {'key': key, 'plaintext': plaintext, 'score': round(score, 4)}
+        for key, plaintext, score in candidates
+    ]
+
+
+def analyze_hill(plaintext: str, ciphertext: str, size) -> list:
+    """
+    Recover a hill key matrix from a known plaintext/ciphertext pair.
+
+    Args:
+        plaintext: Known plaintext aligned with the start of the ciphertext
+        ciphertext: Encrypted text
+        size: Key matrix size n (2..10)
+
+    Returns:
+        n x n key matrix
+    """
+    _check_length(plaintext, name='plaintext')
+    _check_length(ciphertext)
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise ValueError('size must be an integer')
+    if not 2 <= size <= MAX_HILL_SIZE:
+        raise ValueError(f'size must be between 2 and {MAX_HILL_SIZE}')
+    return recover_hill_key(plaintext, ciphertext, size)
+
+
+def identify_ciphertext(ciphertext: str, language: str = 'en', top=None) -> dict:
+    """
+    Guess which of the supported methods produced a ciphertext.
+
+    Args:
+        ciphertext: Encrypted text
+        language: Expected plaintext language ('en' or 'tr')
+        top: Number of methods to return (default: all)
+
+    Returns:
+        Dict with 'candidates' ({'method', 'probability'} dicts, most likely
+        first) and the 'features' the guess was based on
+    """
+    _check_language(language)
+    _check_length(ciphertext)
+    # One feature pass: the features the ranking used are returned with it
+    candidates, features = identify_cipher(ciphertext, language,
+                                           _parse_top(top, len(METHODS)) if top is not None else None,
+                                           return_features=True)
+    return {
+        'candidates': [
+            {'method': method, 'probability': round(probability, 4)}
+            for method, probability in candidates
+        ],
+        'features': {
+            name: round(value, 4) if isinstance(value, float) else value
+            for name, value in features.items()
+        },
+    }
@@ -1,21 +1,37 @@
 """
 Crypto service to handle encryption/decryption using kriptoloji module
-Supports all available cipher algorithms
+Supports all available cipher algorithms and pipelines of them
+("substitution+columnar_transposition"), see CipherPipeline
+
+Ciphers with a per-letter implementation next to the buffer one
+(encrypt_scalar/decrypt_scalar) are dispatched by input length: the buffer
+(vector) path has a fixed cost per key unit that loses on short chat
+messages. Crossover thresholds come from kriptoloji.bench.calibrate.
 """
 import sys
 import os
 import json
+import time
+import logging
+from functools import lru_cache, wraps
 
 # Add parent directory to path to import kriptoloji
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from kriptoloji import (
     VigenereCipher, CaesarCipher, ShiftCipher,
     PlayfairCipher, HillCipher, RailFenceCipher,
     ColumnarTransposition, SubstitutionCipher,
-    PolybiusCipher, RouteCipher, PigpenCipher
+    PolybiusCipher, RouteCipher, PigpenCipher,
+    CipherPipeline
+)
+from metrics import (
+    CIPHER_LATENCY, CIPHER_INPUT_SIZE, CIPHER_PATH, CIPHER_SCALAR_THRESHOLD, register_cache
 )
 
+logger = logging.getLogger(__name__)
+
 # Map method names to cipher instances
 CIPHER_MAP = {
     'vigenere': VigenereCipher(),
@@ -40,15 +56,227 @@ MATRIX_KEY_CIPHERS = ['hill']
 # Ciphers that require string keys
 STRING_KEY_CIPHERS = ['vigenere', 'playfair', 'columnar_transposition', 'substitution', 'polybius', 'route', 'pigpen']
 
+# Separates the stages of a pipeline method ("substitution+columnar_transposition")
+PIPELINE_SEPARATOR = '+'
+
+# Input length per key unit (path_width) below which the scalar path runs,
+# per method and operation; measured with python -m kriptoloji.bench.calibrate
+DEFAULT_SCALAR_THRESHOLDS = {
+    'vigenere': {'encrypt': 3.5, 'decrypt': 3.0},
+    'rail_fence': {'encrypt': 8.0, 'decrypt': 12.0},
+}
+
+# Active thresholds (defaults, or a profile loaded by init_dispatch)
+SCALAR_THRESHOLDS = {method: dict(ops) for method, ops in DEFAULT_SCALAR_THRESHOLDS.items()}
+
+
+@lru_cache(maxsize=1024)
+def _parse_key(method: str, key):
+    """Parse a raw key into the form the cipher expects (cached per method/key)"""
+    if method in INTEGER_KEY_CIPHERS:
+        return int(key) if isinstance(key, str) else key
+    if method in MATRIX_KEY_CIPHERS:
+        return json.loads(key) if isinstance(key, str) else key
+    if method == 'route':
+        # "rows,cols[,route]"
+        rows, cols, *route = str(key).split(',')
+        return (int(rows), int(cols), *(part.strip() for part in route))
+    return key
+
+
+def _resolve_key(method: str, key):
+    """Return the parsed key, using the cache for hashable keys"""
+    if isinstance(key, (list, dict)):
+        # JSON bodies may carry a Hill matrix directly
+        return _parse_key.__wrapped__(method, key)
+    return _parse_key(method, key)
+
+
+register_cache('cipher_key', _parse_key.cache_info)
+
+
+def _cipher_args(method: str, key) -> tuple:
+    """
+    Arguments after the text for CIPHER_MAP[method].encrypt/decrypt
+
+    Raises:
+        ValueError: If the key is missing or has the wrong format
+    """
+    # Algorithms that don't require key
+    if method == 'pigpen':
+        # Pigpen doesn't use key
+        return (None,)
+    
+    if method in INTEGER_KEY_CIPHERS:
+        # For caesar, if key is None, use default (3)
+        if method == 'caesar' and (key is None or key == ''):
+            return (None,)
+        try:
+            return (_resolve_key(method, key),)
+        except (ValueError, TypeError):
+            raise ValueError(f"Key for {method} must be an integer. Got: {key}")
+    
+    if method in MATRIX_KEY_CIPHERS:
+        if key is None or key == '':
+            raise ValueError(f"Key is required for {method}")
+        try:
+            return (_resolve_key(method, key),)
+        except (json.JSONDecodeError, ValueError) as e:
+            raise ValueError(f"Key for {method} must be a valid JSON matrix. Error: {str(e)}")
+    
+    # String key ciphers
+    # For polybius, key can be None (uses standard matrix)
+    if method == 'polybius' and (key is None or key == ''):
+        return (None,)
+    # For other string key ciphers, key is required
+    if key is None or key == '':
+        raise ValueError(f"Key is required for {method}")
+    if method == 'route':
+        try:
+            return _resolve_key(method, key)
+        except (ValueError, TypeError):
+            raise ValueError(f'Key for route must be "rows,cols,route" (e.g., "3,4,spiral_cw"). Got: {key}')
+    return (key,)
+
+
+def is_pipeline(method: str) -> bool:
+    """Whether method names a pipeline of supported methods"""
+    stages = method.split(PIPELINE_SEPARATOR)
+    return len(stages) > 1 and all(stage in CIPHER_MAP for stage in stages)
+
+
+@lru_cache(maxsize=256)
+def _pipeline(method: str, key: str) -> CipherPipeline:
+    """
+    Compiled pipeline for a method/key pair (cached: fused tables and
+    permutations are built once per key)
+
+    Args:
+        method: Stage methods joined by PIPELINE_SEPARATOR
+        key: JSON array with one key per stage (null for keyless stages)
+    """
+    stages = method.split(PIPELINE_SEPARATOR)
+    try:
+        keys = json.loads(key) if key else None
+    except json.JSONDecodeError:
+        keys = None
+    if not isinstance(keys, list) or len(keys) != len(stages):
+        raise ValueError(
+            f"Key for {method} must be a JSON array with one key per stage "
+            f"(e.g., [\"QWERTYUIOPASDFGHJKLZXCVBNM\", \"ZEBRA\"])"
+        )
+    return CipherPipeline([
+        (CIPHER_MAP[stage], *_cipher_args(stage, stage_key))
+        for stage, stage_key in zip(stages, keys)
+    ])
+
+
+def _resolve_pipeline(method: str, key) -> CipherPipeline:
+    """Return the compiled pipeline; JSON bodies may carry the key list directly"""
+    if isinstance(key, (list, dict)):
+        key = json.dumps(key)
+    return _pipeline(method, key)
+
+
+register_cache('cipher_pipeline', _pipeline.cache_info)
+
 
+def set_scalar_thresholds(thresholds: dict):
+    """
+    Replace the active scalar/vector thresholds
+    
+    Args:
+        thresholds: method -> {'encrypt': threshold, 'decrypt': threshold}, as in
+            the 'thresholds' field of a calibration profile
+    
+    Raises:
+        ValueError: If a method has no scalar path
+    """
+    for method in thresholds:
+        if not hasattr(CIPHER_MAP.get(method), 'encrypt_scalar'):
+            raise ValueError(f"{method} has no scalar path")
+    SCALAR_THRESHOLDS.clear()
+    for method, ops in thresholds.items():
+        SCALAR_THRESHOLDS[method] = {op: float(ops[op]) for op in ('encrypt', 'decrypt')}
+
+
+def init_dispatch(app):
+    """
+    Load scalar/vector thresholds at startup
+    
+    CIPHER_CALIBRATE measures them (~0.5 s) and writes CIPHER_PROFILE if set;
+    otherwise an existing CIPHER_PROFILE file is loaded; otherwise
+    DEFAULT_SCALAR_THRESHOLDS stay active.
+    """
+    config = app.config
+    path = config.get('CIPHER_PROFILE')
+    if config.get('CIPHER_CALIBRATE'):
+        from kriptoloji.bench.calibrate import calibrate
+        profile = calibrate()
+        if path:
+            with open(path, 'w') as f:
+                json.dump(profile, f, indent=2)
+        source = 'calibration'
+    elif path and os.path.exists(path):
+        with open(path) as f:
+            profile = json.load(f)
+        source = path
+    else:
+        return
+    set_scalar_thresholds(profile['thresholds'])
+    logger.info('Cipher scalar thresholds from %s: %s', source, SCALAR_THRESHOLDS)
+
+
+def _threshold_values() -> dict:
+    return {(method, op): value for method, ops in SCALAR_THRESHOLDS.items() for op, value in ops.items()}
+
+
+CIPHER_SCALAR_THRESHOLD.callback = _threshold_values
+
+
+def _run_cipher(method: str, operation: str, text: str, args: tuple) -> str:
+    """Run encrypt/decrypt on the path chosen by input length (recorded in metrics)"""
+    cipher = CIPHER_MAP[method]
+    threshold = SCALAR_THRESHOLDS.get(method, {}).get(operation)
+    if threshold and len(text) < threshold * cipher.path_width(*args):
+        path = 'scalar'
+        func = getattr(cipher, f'{operation}_scalar')
+    else:
+        path = 'vector'
+        func = getattr(cipher, operation)
+    CIPHER_PATH.inc(method, operation, path)
+    return func(text, *args)
+
+
+def _observe(operation: str):
+    """Record latency and input size of an encrypt/decrypt call"""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(text, method, key=None):
+            start = time.perf_counter()
+            try:
+                return f(text, method, key)
+            finally:
+                # Pipelines share one label: stage combinations are unbounded
+                label = method if method in CIPHER_MAP else 'pipeline' if is_pipeline(method) else None
+                if label:
+                    CIPHER_LATENCY.observe(time.perf_counter() - start, label, operation)
+                    CIPHER_INPUT_SIZE.observe(len(text), label, operation)
+        return wrapper
+    return decorator
+
+
+@_observe('encrypt')
 def encrypt_text(text: str, method: str, key: str = None) -> str:
     """
     Encrypt text using specified method and key
     
     Args:
         text: Plain text to encrypt
-        method: Encryption method (vigenere, caesar, hill, etc.)
-        key: Encryption key (format depends on method, optional for some algorithms)
+        method: Encryption method (vigenere, caesar, hill, etc.) or a pipeline
+            of methods joined by '+' (substitution+columnar_transposition)
+        key: Encryption key (format depends on method, optional for some algorithms;
+            for a pipeline a JSON array with one key per stage)
     
     Returns:
         Encrypted text
@@ -56,63 +284,34 @@ def encrypt_text(text: str, method: str, key: str = None) -> str:
     Raises:
         ValueError: If method is unsupported or key format is invalid
     """
+    if is_pipeline(method):
+        try:
+            pipeline = _resolve_pipeline(method, key)
+            CIPHER_PATH.inc('pipeline', 'encrypt', 'fused')
+            return pipeline.encrypt(text)
+        except Exception as e:
+            raise ValueError(f"Encryption failed with {method}: {str(e)}")
+    
     if method not in CIPHER_MAP:
         raise ValueError(f"Unsupported encryption method: {method}. Supported methods: {', '.join(CIPHER_MAP.keys())}")
     
-    cipher = CIPHER_MAP[method]
-    
     try:
-        # Algorithms that don't require key
-        if method == 'pigpen':
-            # Pigpen doesn't use key
-            return cipher.encrypt(text, None)
-        
-        if method in INTEGER_KEY_CIPHERS:
-            # Convert key to integer
-            # For caesar, if key is None, use default (3)
-            if method == 'caesar' and (key is None or key == ''):
-                return cipher.encrypt(text, None)  # Uses default key 3
-            try:
-                key_int = int(key) if isinstance(key, str) else key
-                return cipher.encrypt(text, key_int)
-            except (ValueError, TypeError):
-                raise ValueError(f"Key for {method} must be an integer. Got: {key}")
-        
-        elif method in MATRIX_KEY_CIPHERS:
-            # Parse key as JSON matrix
-            if key is None or key == '':
-                raise ValueError(f"Key is required for {method}")
-            try:
-                if isinstance(key, str):
-                    key_matrix = json.loads(key)
-                else:
-                    key_matrix = key
-                return cipher.encrypt(text, key_matrix)
-            except (json.JSONDecodeError, ValueError) as e:
-                raise ValueError(f"Key for {method} must be a valid JSON matrix. Error: {str(e)}")
-        
-        else:
-            # String key ciphers
-            # For polybius, key can be None (uses standard matrix)
-            if method == 'polybius' and (key is None or key == ''):
-                return cipher.encrypt(text, None)
-            # For other string key ciphers, key is required
-            if key is None or key == '':
-                raise ValueError(f"Key is required for {method}")
-            return cipher.encrypt(text, key)
-    
+        return _run_cipher(method, 'encrypt', text, _cipher_args(method, key))
     except Exception as e:
         raise ValueError(f"Encryption failed with {method}: {str(e)}")
 
 
+@_observe('decrypt')
 def decrypt_text(text: str, method: str, key: str = None) -> str:
     """
     Decrypt text using specified method and key
     
     Args:
         text: Encrypted text to decrypt
-        method: Decryption method (vigenere, caesar, hill, etc.)
-        key: Decryption key (format depends on method, optional for some algorithms)
+        method: Decryption method (vigenere, caesar, hill, etc.) or a pipeline
+            of methods joined by '+'
+        key: Decryption key (format depends on method, optional for some algorithms;
+            for a pipeline a JSON array with one key per stage)
     
     Returns:
         Decrypted text
@@ -120,51 +319,19 @@ def decrypt_text(text: str, method: str, key: str = None) -> str:
     Raises:
         ValueError: If method is unsupported or key format is invalid
     """
+    if is_pipeline(method):
+        try:
+            pipeline = _resolve_pipeline(method, key)
+            CIPHER_PATH.inc('pipeline', 'decrypt', 'fused')
+            return pipeline.decrypt(text)
+        except Exception as e:
+            raise ValueError(f"Decryption failed with {method}: {str(e)}")
+    
     if method not in CIPHER_MAP:
         raise ValueError(f"Unsupported decryption method: {method}. Supported methods: {', '.join(CIPHER_MAP.keys())}")
     
-    cipher = CIPHER_MAP[method]
-    
     try:
-        # Algorithms that don't require key
-        if method == 'pigpen':
-            # Pigpen doesn't use key
-            return cipher.decrypt(text, None)
-        
-        if method in INTEGER_KEY_CIPHERS:
-            # Convert key to integer
-            # For caesar, if key is None, use default (3)
-            if method == 'caesar' and (key is None or key == ''):
-                return cipher.decrypt(text, None)  # Uses default key 3
-            try:
-                key_int = int(key) if isinstance(key, str) else key
-                return cipher.decrypt(text, key_int)
-            except (ValueError, TypeError):
-                raise ValueError(f"Key for {method} must be an integer. Got: {key}")
-        
-        elif method in MATRIX_KEY_CIPHERS:
-            # Parse key as JSON matrix
-            if key is None or key == '':
-                raise ValueError(f"Key is required for {method}")
-            try:
-                if isinstance(key, str):
-                    key_matrix = json.loads(key)
-                else:
-                    key_matrix = key
-                return cipher.decrypt(text, key_matrix)
-            except (json.JSONDecodeError, ValueError) as e:
-                raise ValueError(f"Key for {method} must be a valid JSON matrix. Error: {str(e)}")
-        
-        else:
-            # String key ciphers
-            # For polybius, key can be None (uses standard matrix)
-            if method == 'polybius' and (key is None or key == ''):
-                return cipher.decrypt(text, None)
-            # For other string key ciphers, key is required
-            if key is None or key == '':
-                raise ValueError(f"Key is required for {method}")
-            return cipher.decrypt(text, key)
-    
+        return _run_cipher(method, 'decrypt', text, _cipher_args(method, key))
     except Exception as e:
         raise ValueError(f"Decryption failed with {method}: {str(e)}")
 
@@ -8,6 +8,16 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database import db
 from models.message import Message
 from services.crypto_service import encrypt_text, decrypt_text
+from services.stats_service import record_messages
+
+# Longest method name (or pipeline spec) the encryption_method column stores
+MAX_METHOD_LENGTH = Message.encryption_method.type.length
+
+
+def _check_method(method: str):
+    """Reject pipeline specs too long to be stored"""
+    if len(method) > MAX_METHOD_LENGTH:
+        raise ValueError(f"Method must be at most {MAX_METHOD_LENGTH} characters. Got: {method}")
 
 
 def create_message(sender_id: int, receiver_id: int, plaintext: str, method: str, key: str = None) -> Message:
@@ -18,15 +28,18 @@ def create_message(sender_id: int, receiver_id: int, plaintext: str, method: str
         sender_id: ID of the sender
         receiver_id: ID of the receiver
         plaintext: Plain text message to encrypt
-        method: Encryption method
+        method: Encryption method or pipeline ("substitution+columnar_transposition"),
+            stored as the message's encryption_method
         key: Encryption key
     
     Returns:
         Created Message object
     
     Raises:
-        ValueError: If encryption fails
+        ValueError: If encryption fails or the method is too long to store
     """
+    _check_method(method)
+    
     # Encrypt the message using crypto service
     encrypted_content = encrypt_text(plaintext, method, key)
     
@@ -39,11 +52,54 @@ def create_message(sender_id: int, receiver_id: int, plaintext: str, method: str
     )
     
     db.session.add(message)
+    db.session.flush()
+    # Read before commit expires the attributes; counted after the commit
+    counted = [(message.id, method, encrypted_content)]
     db.session.commit()
+    record_messages(counted)
     
     return message
 
 
+def create_messages(records):
+    """
+    Encrypt and save many messages in a single transaction
+    
+    Args:
+        records: Iterable of (sender_id, receiver_id, plaintext, method, key) tuples
+    
+    Returns:
+        Tuple of (created Message objects, list of (record, error) for records
+        that could not be encrypted and were skipped)
+    """
+    messages = []
+    failed = []
+    for record in records:
+        sender_id, receiver_id, plaintext, method, key = record
+        try:
+            _check_method(method)
+            encrypted_content = encrypt_text(plaintext, method, key)
+        except ValueError as e:
+            failed.append((record, str(e)))
+            continue
+        messages.append(Message(
+            sender_id=sender_id,
+            receiver_id=receiver_id,
+            encryption_method=method,
+            encrypted_content=encrypted_content
+        ))
+    
+    # One commit for the whole batch instead of one per message
+    db.session.add_all(messages)
+    db.session.flush()
+    # Read before commit expires the attributes; counted after the commit
+    counted = [(message.id, message.encryption_method, message.encrypted_content) for message in messages]
+    db.session.commit()
+    record_messages(counted)
+    
+    return messages, failed
+
+
 def get_user_messages(user_id: int):
     """
     Get all messages for a user (sent and received)
@@ -0,0 +1,403 @@
+"""
+Incremental n-gram statistics over stored ciphertext
+
+Keeps monogram, bigram and trigram letter counts of every stored message
+per encryption method, so analysis and strength scoring never have to scan
+the messages table.
+
+Counts are stored in the ngram_counts table as one row per (method, prefix,
+following letter). A query ("letter frequencies of vigenere messages", "what
+follows TH") is one primary key range of at most 26 rows per method. A row
+with prefix '#' counts the messages of a method.
+
+Sends do not touch these rows: after a message commits, its id and
+ciphertext are buffered in memory, and a background thread counts and writes
+the buffer every FLUSH_INTERVAL seconds in its own transaction, as one
+INSERT ... ON CONFLICT DO UPDATE (no read-modify-write, and concurrent
+writers never race on creating the same row). Increments still buffered
+when a process dies are lost; the backfill recounts them.
+
+Existing messages are counted once with the backfill command:
+
+    python services/stats_service.py backfill --batch-size 1000
+"""
+import sys
+import os
+import atexit
+import logging
+import argparse
+import threading
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy import select, insert, delete, func, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from database import db
+from models.message import Message
+from models.ngram_count import NgramCount
+from kriptoloji.analysis import ALPHABET, to_indices
+
+logger = logging.getLogger(__name__)
+
+# Pigpen ciphertext is symbol tokens; their letters are not ciphertext letters
+SKIPPED_METHODS = frozenset({'pigpen'})
+
+MAX_ORDER = 3
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Buffered increments are written at most this often (seconds)
+FLUSH_INTERVAL = 1.0
+
+# Messages kept in the buffer while flushes fail; the oldest are dropped beyond this
+MAX_PENDING = 100000
+
+# Prefix of the per-method message count rows (letter 0)
+MESSAGES_PREFIX = '#'
+
+# Row holding the highest message id counted by the last backfill. Flushes
+# skip buffered messages up to it. Its prefix is not a letter, so get_counts
+# never reads it.
+_CUTOFF_KEY = {'method': '', 'prefix': '@', 'letter': 0}
+
+# (message id, method, encrypted_content) of committed, not yet counted messages
+_pending = []
+_pending_lock = threading.Lock()
+_flusher = None
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+
+def count_ngrams(text: str) -> dict:
+    """
+    Monogram, bigram and trigram counts of the letters of a text
+
+    Args:
+        text: Any text; non-letters are skipped (see kriptoloji.analysis.to_indices)
+
+    Returns:
+        Dict of prefix -> {following letter index: count}, only non-zero counts
+    """
+    indices = to_indices(text)
+    counts = {}
+    if not indices:
+        return counts
+
+    counts[''] = dict(Counter(indices))
+    for (a, b), n in Counter(zip(indices, indices[1:])).items():
+        counts.setdefault(ALPHABET[a], {})[b] = n
+    for (a, b, c), n in Counter(zip(indices, indices[1:], indices[2:])).items():
+        counts.setdefault(ALPHABET[a] + ALPHABET[b], {})[c] = n
+    return counts
+
+
+def _merge(total: dict, counts: dict):
+    """Add prefix -> {letter: count} rows into total"""
+    for prefix, row in counts.items():
+        existing = total.get(prefix)
+        if existing is None:
+            total[prefix] = dict(row)
+        else:
+            for letter, n in row.items():
+                existing[letter] = existing.get(letter, 0) + n
+
+
+def _rows(methods: dict) -> list:
+    """
+    Counter rows of method -> prefix -> {letter: count}, in primary key order
+
+    Every writer touches rows in the same order, so two transactions adding
+    to overlapping n-grams wait for each other instead of deadlocking.
+    """
+    return [
+        {'method': method, 'prefix': prefix, 'letter': letter, 'count': n}
+        for method, counts in sorted(methods.items())
+        for prefix, row in sorted(counts.items())
+        for letter, n in sorted(row.items())
+    ]
+
+
+def _increment_statement(table):
+    """
+    INSERT that adds to the count of an existing row instead of failing
+
+    Raises:
+        RuntimeError: If the database has no INSERT ... ON CONFLICT
+    """
+    dialect = db.session.get_bind().dialect.name
+    make_insert = _UPSERT_INSERTS.get(dialect)
+    if make_insert is None:
+        raise RuntimeError(f'n-gram counters need PostgreSQL or SQLite, not {dialect}')
+    statement = make_insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.method, table.c.prefix, table.c.letter],
+        set_={'count': table.c.count + statement.excluded.count},
+    )
+
+
+def _count_messages(messages) -> dict:
+    """
+    Count n-grams of (method, encrypted_content) pairs
+
+    Returns:
+        Dict of method -> prefix -> {letter: count}
+    """
+    methods = {}
+    for method, encrypted_content in messages:
+        # For pipelines ("substitution+pigpen") the final stage produced the ciphertext
+        if method.rpartition('+')[2] in SKIPPED_METHODS:
+            continue
+        counts = count_ngrams(encrypted_content)
+        if not counts:
+            continue
+        counts[MESSAGES_PREFIX] = {0: 1}
+        _merge(methods.setdefault(method, {}), counts)
+    return methods
+
+
+def record_messages(messages):
+    """
+    Queue committed messages for counting
+
+    Call after the messages are committed. Nothing is executed on the
+    caller's session; the first call in a process starts the flush thread.
+
+    Args:
+        messages: Iterable of (message id, method, encrypted_content) tuples
+    """
+    global _flusher
+    with _pending_lock:
+        _pending.extend(messages)
+        if len(_pending) > MAX_PENDING:
+            logger.warning('N-gram buffer full, dropping %d messages', len(_pending) - MAX_PENDING)
+            del _pending[:-MAX_PENDING]
+        if _flusher is None:
+            app = current_app._get_current_object()
+            _flusher = threading.Thread(target=_flush_loop, args=(app,), name='ngram-flush', daemon=True)
+            _flusher.start()
+            atexit.register(_flush_at_exit, app)
+
+
+def flush_counters() -> int:
+    """
+    Count the buffered messages and add them to the stored counters
+
+    Runs in its own transaction on the current session (needs an app
+    context). The first statement touches the backfill cutoff row, so a
+    flush that overlaps a backfill waits for it to commit and then skips
+    the messages it counted. On failure the messages go back to the buffer.
+
+    Returns:
+        Number of messages taken from the buffer
+    """
+    with _pending_lock:
+        pending = _pending[:]
+        del _pending[:]
+    if not pending:
+        return 0
+
+    table = NgramCount.__table__
+    try:
+        db.session.execute(_increment_statement(table), [{**_CUTOFF_KEY, 'count': 0}])
+        cutoff = db.session.execute(select(table.c.count).filter_by(**_CUTOFF_KEY)).scalar()
+        rows = _rows(_count_messages(
+            (method, content) for message_id, method, content in pending if message_id > cutoff
+        ))
+        # One executemany; each row is an atomic increment
+        if rows:
+            db.session.execute(_increment_statement(table), rows)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        with _pending_lock:
+            _pending[:0] = pending
+            del _pending[:-MAX_PENDING]
+        raise
+    return len(pending)
+
+
+def _flush_loop(app):
+    """Flush thread: write the buffer every FLUSH_INTERVAL seconds"""
+    interval = app.config.get('NGRAM_FLUSH_INTERVAL', FLUSH_INTERVAL)
+    stop = threading.Event()
+    while not stop.wait(interval):
+        with app.app_context():
+            try:
+                flush_counters()
+            except Exception:
+                logger.exception('N-gram counter flush failed')
+            finally:
+                db.session.remove()
+
+
+def _flush_at_exit(app):
+    """Write what is left in the buffer when the process exits"""
+    with app.app_context():
+        try:
+            flush_counters()
+        except Exception:
+            logger.exception('N-gram counter flush failed at exit')
+        finally:
+            db.session.remove()
+
+
+def get_counts(prefix: str = '', method: str = None) -> list:
+    """
+    Counts of the letter following a prefix
+
+    Args:
+        prefix: '' for monograms, one letter for bigrams, two for trigrams
+        method: Encryption method, or None for all messages
+
+    Returns:
+        List of 26 counts (A..Z)
+
+    Raises:
+        ValueError: If the prefix is not 0-2 letters A-Z
+    """
+    prefix = prefix.upper()
+    if len(prefix) >= MAX_ORDER or any(letter not in ALPHABET for letter in prefix):
+        raise ValueError(f'prefix must be at most {MAX_ORDER - 1} letters A-Z')
+    return _sum_counts(prefix, method)
+
+
+def count_messages(method: str = None) -> int:
+    """
+    Number of counted messages
+
+    Args:
+        method: Encryption method, or None for all messages
+
+    Returns:
+        Messages whose n-grams are in the counters
+    """
+    return _sum_counts(MESSAGES_PREFIX, method)[0]
+
+
+def _sum_counts(prefix: str, method: str = None) -> list:
+    """Counter rows of one prefix summed over methods, indexed by letter"""
+    table = NgramCount.__table__
+    query = select(table.c.letter, func.sum(table.c.count)).where(table.c.prefix == prefix)
+    if method:
+        query = query.where(table.c.method == method)
+    counts = [0] * 26
+    for letter, n in db.session.execute(query.group_by(table.c.letter)):
+        counts[letter] = int(n)
+    return counts
+
+
+def get_frequencies(prefix: str = '', method: str = None) -> dict:
+    """
+    Relative frequencies of the letter following a prefix
+
+    Args:
+        prefix: '' for monograms, one letter for bigrams, two for trigrams
+        method: Encryption method, or None for all messages
+
+    Returns:
+        Dict with 'messages' (messages counted), 'total' and 'frequencies'
+        (letter -> share, empty if total is 0)
+    """
+    counts = get_counts(prefix, method)
+    total = sum(counts)
+    return {
+        'messages': count_messages(method),
+        'total': total,
+        'frequencies': {letter: n / total for letter, n in zip(ALPHABET, counts)} if total else {},
+    }
+
+
+def _lock_tables(counts_table):
+    """
+    Block writers of the counter and messages tables until the current transaction ends
+
+    Readers are not blocked. Taking the messages lock waits for sends that
+    are still inserting, so every message id up to the backfill's cutoff is
+    committed when it is read, and later sends get higher ids. SQLite has no
+    LOCK TABLE; there the first write of the transaction takes the database
+    write lock.
+    """
+    if db.session.get_bind().dialect.name == 'postgresql':
+        db.session.execute(text(f'LOCK TABLE {counts_table.name} IN EXCLUSIVE MODE'))
+        db.session.execute(text(f'LOCK TABLE {Message.__tablename__} IN SHARE MODE'))
+
+
+def backfill(batch_size: int = BACKFILL_BATCH_SIZE, progress=None) -> tuple:
+    """
+    Recount all stored messages and replace the counters
+
+    Runs in one transaction that first locks the counter and messages tables
+    and empties the counters; sends and flushes wait until it commits. It
+    stores the highest message id it counted in the cutoff row: buffered
+    messages up to that id are skipped by the next flush (see flush_counters),
+    later ones are added to the new counters. No increment is lost or counted
+    twice, at the price of stalling sends for the duration of the recount.
+
+    Streams the messages table in id order, batch_size rows at a time, with
+    only the method and content columns loaded. Counts are kept in memory
+    (at most 703 x 26 per method) and written at the end.
+
+    Args:
+        batch_size: Messages per query
+        progress: Optional callable receiving the number of messages counted so far
+
+    Returns:
+        Tuple of (number of messages counted, cutoff id: the highest message id
+        counted; every later message is counted by flush_counters)
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1')
+
+    table = NgramCount.__table__
+    _lock_tables(table)
+    db.session.execute(delete(table))
+
+    methods = {}
+    last_id = 0
+    processed = 0
+    while True:
+        batch = db.session.query(
+            Message.id, Message.encryption_method, Message.encrypted_content
+        ).filter(Message.id > last_id).order_by(Message.id).limit(batch_size).all()
+        if not batch:
+            break
+        for method, counts in _count_messages((method, content) for _, method, content in batch).items():
+            _merge(methods.setdefault(method, {}), counts)
+        last_id = batch[-1].id
+        processed += len(batch)
+        if progress:
+            progress(processed)
+
+    rows = [{**_CUTOFF_KEY, 'count': last_id}] + _rows(methods)
+    db.session.execute(insert(table), rows)
+    db.session.commit()
+    return processed, last_id
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='N-gram statistics tools')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    backfill_parser = sub.add_parser('backfill', help='Recount n-grams of all stored messages')
+    backfill_parser.add_argument('--batch-size', type=int, default=BACKFILL_BATCH_SIZE)
+
+    args = parser.parse_args(argv)
+
+    from app import app
+
+    with app.app_context():
+        processed, cutoff_id = backfill(args.batch_size, lambda n: print(f'{n} messages counted', file=sys.stderr))
+    print(f'Backfilled n-gram counts from {processed} messages (up to id {cutoff_id})')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Ciphertext strength estimate for sent messages
+
+Cheap indicators of how easily a message could be broken with the
+analysis tools in kriptoloji.analysis:
+- Key profile (keyspace, Vigenere period, weak Hill / substitution / columnar
+  keys): depends only on method and key, cached per key
+- Ciphertext profile (letter count, residual index of coincidence, letters
+  per key period): one counting pass over the ciphertext encrypt_text produced
+"""
+import sys
+import os
+import json
+import math
+from functools import lru_cache
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kriptoloji.analysis import ALPHABET, to_indices, letter_counts, index_of_coincidence, get_frequencies
+from metrics import register_cache
+
+# Index of coincidence of English plaintext and of uniformly random letters
+ENGLISH_IOC = sum(f * f for f in get_frequencies('en'))
+RANDOM_IOC = 1 / 26
+
+# Letters per Vigenere key letter from which period + frequency attacks work
+VIGENERE_LETTERS_PER_COLUMN = 8
+
+# Below this many letters the index of coincidence is too noisy to judge
+MIN_IOC_LETTERS = 40
+
+# Keyspace (bits) below which brute force is immediate / above which it is infeasible
+WEAK_KEYSPACE_BITS = 40
+STRONG_KEYSPACE_BITS = 80
+
+# Methods whose ciphertext is not letters A-Z
+NON_LETTER_METHODS = ('polybius', 'pigpen')
+
+# Methods whose consecutive stages in a pipeline compose into one substitution
+MONOALPHABETIC_METHODS = ('caesar', 'shift', 'substitution')
+
+# A pipeline of only these stages is still one letter-for-symbol substitution
+# (polybius and pigpen are fixed or keyed layouts applied letter by letter)
+FREQUENCY_PRESERVING_METHODS = MONOALPHABETIC_METHODS + NON_LETTER_METHODS
+
+FREQUENCY_WARNING = 'Letter frequencies survive: quadgram hill climbing recovers the key'
+
+
+def _bits(count: int) -> float:
+    return round(math.log2(count), 1) if count > 1 else 0.0
+
+
+def _period(letters: str) -> int:
+    """Shortest repeating unit of a key ('ABAB' -> 2)"""
+    for period in range(1, len(letters)):
+        if len(letters) % period == 0 and letters[:period] * (len(letters) // period) == letters:
+            return period
+    return len(letters)
+
+
+def _general_linear_count(n: int, q: int) -> int:
+    """Number of invertible n x n matrices over the field Z/q"""
+    count = 1
+    for i in range(n):
+        count *= q ** n - q ** i
+    return count
+
+
+def _hill_warnings(matrix: list) -> list:
+    n = len(matrix)
+    identity = [[int(i == j) for j in range(n)] for i in range(n)]
+    warnings = []
+    if all(matrix[i][j] % 26 == 0 for i in range(n) for j in range(n) if i != j):
+        warnings.append('Diagonal Hill key: every block position is a separate multiplicative substitution')
+    squared = [[sum(matrix[i][k] * matrix[k][j] for k in range(n)) % 26 for j in range(n)] for i in range(n)]
+    if squared == identity:
+        warnings.append('Involutory Hill key: encryption and decryption are the same operation')
+    for p in (2, 13):
+        if [[value % p for value in row] for row in matrix] == [[value % p for value in row] for row in identity]:
+            warnings.append(f'Hill key is the identity mod {p}: half of the key does nothing')
+    warnings.append(f'{n * n} letters of known plaintext recover a {n}x{n} Hill key')
+    return warnings
+
+
+@lru_cache(maxsize=1024)
+def _key_profile(method: str, key: str) -> dict:
+    """
+    Key-only part of the estimate (cached per method/key)
+
+    Args:
+        method: Encryption method
+        key: Key as sent (JSON text for Hill matrices)
+
+    Returns:
+        Dict with 'keyspace_bits', 'period' (letters per key cycle, None if
+        not periodic) and 'warnings'
+    """
+    if '+' in method:
+        return _pipeline_profile(method, key)
+
+    warnings = []
+    period = None
+    letters = ''.join(ALPHABET[i] for i in to_indices(key or ''))
+
+    if method in ('caesar', 'shift'):
+        keyspace = 26
+        warnings.append('Only 26 possible shifts: brute force is immediate')
+        if method == 'caesar':
+            warnings.append('Caesar uses a fixed, publicly known shift')
+    elif method == 'vigenere':
+        period = _period(letters) if letters else 1
+        keyspace = 26 ** period
+        if period < len(letters):
+            warnings.append(f'Key repeats itself: effective period is {period}')
+        if period == 1:
+            warnings.append('Single-letter Vigenere key is a shift cipher')
+    elif method == 'hill':
+        matrix = json.loads(key) if isinstance(key, str) else key
+        n = len(matrix)
+        keyspace = _general_linear_count(n, 2) * _general_linear_count(n, 13)
+        period = n
+        warnings.extend(_hill_warnings(matrix))
+    elif method == 'substitution':
+        keyspace = math.factorial(26)
+        fixed = sum(1 for plain, cipher in zip(ALPHABET, letters) if plain == cipher)
+        if fixed:
+            warnings.append(f'{fixed} letter(s) encrypt to themselves')
+    elif method == 'playfair':
+        # Distinct 5x5 squares (I/J merged)
+        keyspace = math.factorial(25)
+    elif method == 'columnar_transposition':
+        keyspace = math.factorial(len(letters)) if letters else 1
+        if letters and list(letters) == sorted(letters):
+            warnings.append('Key letters are in alphabetical order: columns are not reordered')
+        if len(letters) <= 10:
+            warnings.append(f'{len(letters)} columns: every column order can be tried')
+    elif method == 'polybius':
+        keyspace = math.factorial(25) if letters else 1
+        if not letters:
+            warnings.append('Standard Polybius square: decoding needs no key')
+    elif method == 'rail_fence':
+        # The rail count is not a keyspace size: only 2..letters-1 rails change
+        # the text, so estimate_strength sizes the keyspace from the ciphertext
+        keyspace = 1
+        warnings.append('Rail count is the whole key: brute force is immediate')
+    else:
+        # route, pigpen: fixed public layouts
+        keyspace = 1
+        warnings.append(f'{method} has no secret key beyond the layout')
+
+    # Standard Polybius has no key to recover (warned above)
+    if method in ('substitution', 'playfair') or (method == 'polybius' and letters):
+        warnings.append(FREQUENCY_WARNING)
+
+    return {'keyspace_bits': _bits(keyspace), 'period': period, 'warnings': warnings}
+
+
+def _pipeline_profile(method: str, key: str) -> dict:
+    """
+    Key profile of a pipeline ("substitution+columnar_transposition")
+
+    Stage keyspaces add up, except that a run of consecutive monoalphabetic
+    stages is one substitution: only its largest keyspace counts.
+
+    Args:
+        method: Stage methods joined by '+'
+        key: JSON array with one key per stage
+    """
+    stages = method.split('+')
+    keys = json.loads(key) if key else [None] * len(stages)
+    warnings = []
+    bits = 0.0
+    run = []
+
+    def close_run():
+        nonlocal bits
+        if run:
+            bits += max(stage_bits for _, stage_bits in run)
+        if len(run) > 1:
+            warnings.append(
+                f"{'+'.join(name for name, _ in run)} compose into a single substitution: "
+                f"the extra stages add no keyspace"
+            )
+        run.clear()
+
+    for stage, stage_key in zip(stages, keys):
+        stage_bits = _key_profile(stage, _key_id(stage_key))['keyspace_bits']
+        if stage in MONOALPHABETIC_METHODS:
+            run.append((stage, stage_bits))
+            continue
+        close_run()
+        bits += stage_bits
+    close_run()
+
+    # No stage mixes letters or positions: the ciphertext IoC check is skipped
+    # when the last stage emits digits or symbols, so warn from the stages
+    if all(stage in FREQUENCY_PRESERVING_METHODS for stage in stages):
+        warnings.append(FREQUENCY_WARNING)
+
+    return {'keyspace_bits': round(bits, 1), 'period': None, 'warnings': warnings}
+
+
+register_cache('strength_key', _key_profile.cache_info)
+
+
+def _key_id(key):
+    """Hashable form of a key (Hill matrices may arrive as JSON lists)"""
+    if isinstance(key, (list, dict)):
+        return json.dumps(key)
+    return None if key is None else str(key)
+
+
+def estimate_strength(method: str, key, ciphertext: str) -> dict:
+    """
+    Estimate how hard a ciphertext is to break
+
+    Args:
+        method: Encryption method used (or pipeline, see _pipeline_profile)
+        key: Key used (as passed to encrypt_text)
+        ciphertext: Output of encrypt_text
+
+    Returns:
+        Dict with 'rating' ('weak', 'fair' or 'strong'), 'keyspace_bits',
+        'letters', 'ioc' (None for non-letter ciphertext or short texts),
+        'letters_per_period' (periodic ciphers) and 'warnings'
+    """
+    profile = _key_profile(method, _key_id(key))
+    warnings = list(profile['warnings'])
+
+    ioc = None
+    letters = 0
+    letters_per_period = None
+    # For pipelines the final stage produced the ciphertext
+    if method.rpartition('+')[2] not in NON_LETTER_METHODS:
+        counts = letter_counts(to_indices(ciphertext))
+        letters = sum(counts)
+        if letters >= MIN_IOC_LETTERS:
+            ioc = index_of_coincidence(counts)
+            # 0: flat like random letters, 1: like monoalphabetic English
+            residual = (ioc - RANDOM_IOC) / (ENGLISH_IOC - RANDOM_IOC)
+            if residual > 0.5:
+                warnings.append('Ciphertext keeps the letter statistics of the plaintext')
+
+        period = profile['period']
+        if period:
+            letters_per_period = round(letters / period, 1)
+            if method == 'vigenere' and letters_per_period >= VIGENERE_LETTERS_PER_COLUMN:
+                warnings.append(
+                    f'Message is {letters_per_period}x the key period: '
+                    f'period and key letters can be recovered statistically'
+                )
+
+    bits = profile['keyspace_bits']
+    if method == 'rail_fence':
+        bits = _bits(letters - 2)
+    if bits < WEAK_KEYSPACE_BITS or len(warnings) > 1:
+        rating = 'weak'
+    elif bits >= STRONG_KEYSPACE_BITS and not warnings:
+        rating = 'strong'
+    else:
+        rating = 'fair'
+
+    return {
+        'rating': rating,
+        'keyspace_bits': bits,
+        'letters': letters,
+        'ioc': round(ioc, 4) if ioc is not None else None,
+        'letters_per_period': letters_per_period,
+        'warnings': warnings,
+    }
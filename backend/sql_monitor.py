@@ -0,0 +1,159 @@
+"""
+SQL instrumentation
+
+SQLAlchemy event hooks that, per request:
+- count statements and total SQL time (db_* metrics),
+- log statements slower than SQL_SLOW_QUERY_THRESHOLD with their EXPLAIN
+  output (parameter values are never logged: they include password hashes),
+- flag identical statements repeated SQL_N_PLUS_ONE_THRESHOLD or more times
+  as likely N+1 queries (e.g. lazy User.sent_messages / Message.sender loads).
+
+In debug mode (or with SQL_STATS_HEADER) every response carries an
+X-SQL-Stats header; in production the results go to /metrics.
+"""
+import time
+import logging
+
+from flask import g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from metrics import (
+    DB_QUERIES_PER_REQUEST, DB_QUERY_DURATION_PER_REQUEST,
+    DB_SLOW_QUERIES, DB_N_PLUS_ONE, route_label
+)
+
+logger = logging.getLogger(__name__)
+
+SQL_STATS_HEADER = 'X-SQL-Stats'
+
+# Set by init_sql_monitor
+_settings = {
+    'slow_threshold': 0.1,
+    'explain': True,
+}
+
+
+class RequestQueryStats:
+    """Statements executed during one request"""
+
+    __slots__ = ('count', 'total_time', 'slow', 'statements')
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slow = 0
+        # statement text -> number of executions
+        self.statements = {}
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_time += elapsed
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> list:
+        """Statements executed at least `threshold` times, most frequent first"""
+        repeated = [(n, stmt) for stmt, n in self.statements.items() if n >= threshold]
+        repeated.sort(reverse=True)
+        return repeated
+
+
+def _describe_parameters(parameters, executemany: bool) -> str:
+    """Shape of the bound parameters without their values"""
+    if not parameters:
+        return 'none'
+    if executemany:
+        return f'{len(parameters)} rows'
+    return f'{len(parameters)} values'
+
+
+def _explain(conn, statement, parameters) -> str:
+    """
+    EXPLAIN a slow SELECT on the same connection (best effort)
+
+    Runs inside a savepoint when the request's transaction is open: on
+    PostgreSQL a failing statement aborts the whole transaction, and the
+    request's remaining statements would fail with it.
+    """
+    if not statement.lstrip().upper().startswith('SELECT'):
+        return ''
+    prefix = 'EXPLAIN QUERY PLAN ' if conn.dialect.name == 'sqlite' else 'EXPLAIN '
+    conn.info['sql_monitor_explaining'] = True
+    savepoint = None
+    try:
+        if conn.in_transaction():
+            savepoint = conn.begin_nested()
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+        if savepoint is not None:
+            savepoint.commit()
+    except Exception as e:
+        if savepoint is not None and savepoint.is_active:
+            savepoint.rollback()
+        return f'<EXPLAIN failed: {e}>'
+    finally:
+        conn.info['sql_monitor_explaining'] = False
+    return '\n'.join(' | '.join(str(col) for col in row) for row in rows)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._sql_monitor_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if conn.info.get('sql_monitor_explaining'):
+        return
+    elapsed = time.perf_counter() - context._sql_monitor_start
+
+    stats = None
+    if has_request_context():
+        stats = g.get('_sql_stats')
+        if stats is None:
+            stats = g._sql_stats = RequestQueryStats()
+        stats.record(statement, elapsed)
+
+    if elapsed >= _settings['slow_threshold']:
+        plan = ''
+        if _settings['explain'] and not executemany:
+            plan = _explain(conn, statement, parameters)
+        if stats is not None:
+            stats.slow += 1
+            DB_SLOW_QUERIES.inc(route_label())
+        logger.warning(
+            'Slow query (%.1f ms): %s\nParameters: %s%s',
+            elapsed * 1000, statement, _describe_parameters(parameters, executemany),
+            f'\nPlan:\n{plan}' if plan else ''
+        )
+
+
+def init_sql_monitor(app):
+    """Attach SQL event hooks and per-request reporting to the app"""
+    config = app.config
+    _settings['slow_threshold'] = float(config.get('SQL_SLOW_QUERY_THRESHOLD', 0.1))
+    _settings['explain'] = bool(config.get('SQL_EXPLAIN_SLOW_QUERIES', True))
+    n_plus_one_threshold = int(config.get('SQL_N_PLUS_ONE_THRESHOLD', 3))
+    stats_header = bool(config.get('SQL_STATS_HEADER'))
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+    @app.after_request
+    def report_sql_stats(response):
+        stats = g.get('_sql_stats') or RequestQueryStats()
+        route = route_label()
+
+        DB_QUERIES_PER_REQUEST.observe(stats.count, route)
+        DB_QUERY_DURATION_PER_REQUEST.observe(stats.total_time, route)
+
+        repeated = stats.repeated(n_plus_one_threshold)
+        if repeated:
+            DB_N_PLUS_ONE.inc(route, amount=len(repeated))
+            for n, statement in repeated:
+                logger.warning('Possible N+1 on %s: statement executed %d times: %s', route, n, statement)
+
+        if stats_header or app.debug:
+            response.headers[SQL_STATS_HEADER] = (
+                f'queries={stats.count}; time_ms={stats.total_time * 1000:.2f}; '
+                f'slow={stats.slow}; n_plus_one={len(repeated)}'
+            )
+        return response
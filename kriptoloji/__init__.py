@@ -15,6 +15,8 @@ from .columnar_transposition import ColumnarTransposition
 from .polybius_cipher import PolybiusCipher
 from .pigpen_cipher import PigpenCipher
 from .hill_cipher import HillCipher
+from .pipeline import CipherPipeline
+from .utils.alphabet import Alphabet, LATIN, TURKISH, get_alphabet
 
 __all__ = [
     'ShiftCipher',
@@ -28,6 +30,11 @@ __all__ = [
     'PolybiusCipher',
     'PigpenCipher',
     'HillCipher',
+    'CipherPipeline',
+    'Alphabet',
+    'LATIN',
+    'TURKISH',
+    'get_alphabet',
 ]
 
 __version__ = '1.0.0'
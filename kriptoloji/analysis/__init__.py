@@ -0,0 +1,50 @@
+"""
+Kriptanaliz
+Anahtarı bilinmeyen şifreli metinler için frekans tabanlı çözme araçları.
+"""
+
+from .stats import (
+    ALPHABET,
+    LANGUAGES,
+    to_indices,
+    from_indices,
+    letter_counts,
+    get_frequencies,
+    chi_squared,
+    index_of_coincidence,
+)
+from .shift import brute_force_shift, rank_shifts, shift_decrypt
+from .vigenere import solve_vigenere, rank_periods
+from .ngrams import load_quadgrams, load_bigrams, quadgram_score, count_quadgrams
+from .substitution import solve_substitution
+from .transposition import search_columnar, search_rail_fence, rail_fence_decrypt
+from .hill import recover_hill_key
+from .identify import identify_cipher, cipher_features, METHODS
+
+__all__ = [
+    'ALPHABET',
+    'LANGUAGES',
+    'to_indices',
+    'from_indices',
+    'letter_counts',
+    'get_frequencies',
+    'chi_squared',
+    'index_of_coincidence',
+    'brute_force_shift',
+    'rank_shifts',
+    'shift_decrypt',
+    'solve_vigenere',
+    'rank_periods',
+    'load_quadgrams',
+    'load_bigrams',
+    'quadgram_score',
+    'count_quadgrams',
+    'solve_substitution',
+    'search_columnar',
+    'search_rail_fence',
+    'rail_fence_decrypt',
+    'recover_hill_key',
+    'identify_cipher',
+    'cipher_features',
+    'METHODS',
+]
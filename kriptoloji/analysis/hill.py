@@ -0,0 +1,58 @@
+"""
+Hill Anahtar Çözümü (Bilinen Plaintext)
+Eşleşen plaintext/ciphertext çiftinden Hill anahtar matrisini bulur.
+
+HillCipher her n'li plaintext bloğunu p, ciphertext bloğunu c = K * p (mod 26)
+olarak şifreler. Blokları satır olarak alt alta yazınca P * K^T = C olur;
+K^T bu denklemin çözümüdür.
+
+Z/26 bir cisim değildir: 26 blok seçimi mod 26'da tersinir bir P gerektirir
+ve tüm n'li alt kümeleri denemek kombinasyonel olarak büyür. Bunun yerine
+denklem mod 2 ve mod 13'te ayrı ayrı Gauss eliminasyonuyla çözülür; eleme
+her asal için bağımsız blokları pivot olarak kendisi seçer (O(m * n^2)),
+sonuç Çin kalan teoremiyle mod 26'ya birleştirilir. Pivot olmayan bloklar
+çözümün tutarlılığını kontrol eder.
+"""
+
+from .stats import to_indices
+from ..utils.matrix_utils import solve_mod, matrix_inverse
+
+
+def _blocks(indices: bytes, n: int, count: int) -> list:
+    """İlk count adet n'li bloğu satır listesi olarak döner"""
+    return [list(indices[i * n:(i + 1) * n]) for i in range(count)]
+
+
+def recover_hill_key(plaintext: str, ciphertext: str, n: int) -> list:
+    """
+    Bilinen plaintext/ciphertext çiftinden n x n Hill anahtarını bulur.
+
+    Args:
+        plaintext: Bilinen plaintext (ciphertext'in başıyla hizalı)
+        ciphertext: Şifreli metin
+        n: Anahtar matrisinin boyutu
+
+    Returns:
+        HillCipher.encrypt/decrypt'e verilebilecek n x n anahtar matrisi
+
+    Raises:
+        ValueError: Bağımsız blok yetersizse, çift bu boyutta bir Hill
+            şifrelemesiyle tutarlı değilse veya bulunan matris tersinir değilse
+    """
+    if n < 1:
+        raise ValueError("n en az 1 olmalı")
+    p_indices = to_indices(plaintext)
+    c_indices = to_indices(ciphertext)
+    count = min(len(p_indices), len(c_indices)) // n
+    if count < n:
+        raise ValueError(f"{n}x{n} anahtar için en az {n * n} harflik plaintext/ciphertext gerekli")
+
+    try:
+        key_t = solve_mod(_blocks(p_indices, n, count), _blocks(c_indices, n, count), 26)
+    except ValueError as e:
+        raise ValueError(f"Anahtar bulunamadı: {e}")
+
+    key = [[key_t[j][i] for j in range(n)] for i in range(n)]
+    # Şifreleme tersinir olmayan bir matrisle de yapılabilir ama çözülemez
+    matrix_inverse(key)
+    return key
@@ -0,0 +1,208 @@
+"""
+Şifre Türü Tahmini
+Yöntemi bilinmeyen şifreli metnin hangi algoritmayla şifrelendiğini tahmin eder.
+
+Özellikler metin üzerinde tek geçişte (harf sayımları bytes.count ile,
+bigram'lar tek Counter ile) hesaplanır:
+- Biçim: sadece rakam (Polybius, çift uzunluk ve 1-5 arası rakam), Pigpen
+  sembolleri ("S1D|X2|...")
+- Tesadüf indeksi (IoC): tek alfabeli şifreler dilin değerini korur
+- Dil frekanslarına ki-kare: transpozisyonlar harfleri değiştirmez (kaydırma 0),
+  Shift/Caesar bir kaydırmada dile oturur, Substitution hiçbirinde oturmaz
+- Periyodik IoC: Vigenère'de sütunların IoC'si dil değerine çıkar
+- Playfair: çift uzunluk, J yok, aynı harfli digraf (AA) yok
+- Harf ve bigram entropisi
+
+Her özellik yöntemler için bir log-puan katkısı üretir; puanlar olasılık
+gibi (toplamı 1) normalize edilip sıralanır. Analiz hattı sadece üstteki
+yöntemlerin çözücülerini çalıştırabilir.
+"""
+
+import math
+from collections import Counter
+
+from .stats import to_indices, letter_counts, get_frequencies, chi_squared, index_of_coincidence
+
+# crypto_service'deki yöntem kimlikleri
+METHODS = (
+    'vigenere', 'caesar', 'shift', 'playfair', 'hill', 'rail_fence',
+    'columnar_transposition', 'substitution', 'polybius', 'route', 'pigpen',
+)
+
+TRANSPOSITIONS = ('rail_fence', 'columnar_transposition', 'route')
+
+# PigpenCipher'ın ürettiği semboller
+PIGPEN_SYMBOLS = frozenset(
+    [f'{shape}{corner}{mark}' for shape in 'SX' for corner in '1234' for mark in ('', 'D', 'L')] + ['SP', 'XP']
+)
+
+RANDOM_IOC = 1 / 26
+
+# Periyodik IoC için denenecek en büyük periyot
+MAX_PERIOD = 20
+
+CAESAR_SHIFT = 3
+
+
+def _entropy(counts) -> float:
+    """Sayımlardan Shannon entropisi (bit)"""
+    total = sum(counts)
+    if not total:
+        return 0.0
+    return -sum(c / total * math.log2(c / total) for c in counts if c)
+
+
+def _periodic_ioc(indices: bytes) -> tuple:
+    """En yüksek ortalama sütun IoC'sini veren periyot (2..MAX_PERIOD)"""
+    best_period, best_ioc = 1, 0.0
+    # Her sütunda en az 8 harf
+    for period in range(2, min(MAX_PERIOD, len(indices) // 8) + 1):
+        ioc = sum(index_of_coincidence(letter_counts(indices[i::period])) for i in range(period)) / period
+        # Katlar da yüksek IoC verir; belirgin üstünlük yoksa kısa periyot kalır
+        if ioc > best_ioc * 1.05:
+            best_period, best_ioc = period, ioc
+    return best_period, best_ioc
+
+
+def cipher_features(ciphertext: str, language='en') -> dict:
+    """
+    Şifreli metnin tanımlayıcı özellikleri.
+
+    Args:
+        ciphertext: Şifreli metin
+        language: Karşılaştırılacak dil (bkz. get_frequencies)
+
+    Returns:
+        Özellik adı -> değer sözlüğü
+    """
+    expected = get_frequencies(language)
+    language_ioc = sum(f * f for f in expected)
+    stripped = ''.join(ciphertext.split())
+
+    tokens = [token for token in stripped.upper().split('|') if token]
+    pigpen = bool(tokens) and '|' in stripped and all(token in PIGPEN_SYMBOLS for token in tokens)
+    digits = stripped.isdigit()
+
+    indices = to_indices(ciphertext)
+    length = len(indices)
+    counts = letter_counts(indices)
+    bigrams = Counter(zip(indices, indices[1:]))
+    shifts = [chi_squared(counts, expected, shift) for shift in range(26)]
+    best_shift = min(range(26), key=shifts.__getitem__)
+    period, periodic_ioc = _periodic_ioc(indices)
+    ioc = index_of_coincidence(counts)
+
+    def normalized(value):
+        # 0: rastgele metin, 1: dilin tek alfabeli değeri
+        return (value - RANDOM_IOC) / (language_ioc - RANDOM_IOC)
+
+    return {
+        'length': length,
+        'digits_only': digits,
+        'digit_range_1_5': digits and set(stripped) <= set('12345'),
+        'even_length': length % 2 == 0 if not digits else len(stripped) % 2 == 0,
+        'pigpen_tokens': pigpen,
+        'ioc': ioc,
+        'monoalphabetic': normalized(ioc),
+        'periodic_ioc': periodic_ioc,
+        'periodic_monoalphabetic': normalized(periodic_ioc),
+        'period': period,
+        'chi_squared': shifts[0],
+        'best_shift': best_shift,
+        'best_shift_chi_squared': shifts[best_shift],
+        'monogram_entropy': _entropy(counts),
+        'bigram_entropy': _entropy(bigrams.values()),
+        'has_j': counts[9] > 0,
+        'doubled_digraphs': sum(1 for i in range(0, length - 1, 2) if indices[i] == indices[i + 1]),
+    }
+
+
+def _above(value: float, threshold: float, width: float) -> float:
+    """log P(değer > eşik): eşik çevresinde yumuşak (lojistik) geçiş"""
+    z = (value - threshold) / width
+    return -math.log1p(math.exp(-z)) if z > -30 else z
+
+
+def _is_prime(n: int) -> bool:
+    return n > 1 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+
+def _log_scores(f: dict) -> dict:
+    """Özelliklerden yöntem başına log-puan"""
+    if f['pigpen_tokens']:
+        return {method: (0.0 if method == 'pigpen' else -50.0) for method in METHODS}
+    if f['digits_only']:
+        polybius = 0.0 if f['digit_range_1_5'] and f['even_length'] else -5.0
+        return {method: (polybius if method == 'polybius' else -50.0) for method in METHODS}
+
+    length = max(f['length'], 1)
+    scores = dict.fromkeys(METHODS, 0.0)
+    scores['polybius'] = scores['pigpen'] = -50.0
+
+    # Dile uyum: ki-kare'nin serbestlik derecesi (25) ve uzunluğa göre ölçeği;
+    # dildeki metinler ~0.6'nın altında, harfleri karıştırılmış metinler üstünde kalır
+    fit_plain = (f['chi_squared'] - 25) / (25 + length)
+    fit_shift = (f['best_shift_chi_squared'] - 25) / (25 + length)
+    mono = f['monoalphabetic']
+    periodic = f['periodic_monoalphabetic']
+
+    is_mono = _above(mono, 0.5, 0.08)
+    not_mono = _above(-mono, -0.5, 0.08)
+
+    # Tek alfabeli aileler: harfler aynı (transpozisyon), kaydırılmış, karıştırılmış
+    for method in TRANSPOSITIONS:
+        scores[method] += is_mono + _above(-fit_plain, -0.65, 0.1)
+    for method in ('shift', 'caesar'):
+        scores[method] += is_mono + _above(-fit_shift, -0.65, 0.1) - (3.0 if f['best_shift'] == 0 else 0.0)
+    scores['caesar'] += 0.5 if f['best_shift'] == CAESAR_SHIFT else -3.0
+    scores['substitution'] += is_mono + _above(fit_shift, 0.65, 0.1)
+
+    # Çok alfabeli: Vigenère'de periyodik IoC yüksek, Hill'de değil
+    scores['vigenere'] += not_mono + _above(periodic, 0.75, 0.1) - (3.0 if f['period'] == 1 else 0.0)
+    scores['hill'] += not_mono + _above(-periodic, -0.75, 0.1) - (0.0 if f['even_length'] else 1.0)
+
+    # Playfair: çift uzunluk, J yok, AA digrafı yok. Rastgele bir metnin bunları
+    # tutturma olasılığı uzunlukla hızla düştüğünden kanıt uzunlukla büyür.
+    scores['playfair'] += _above(-mono, -0.7, 0.1)
+    if not f['even_length'] or f['has_j'] or f['doubled_digraphs']:
+        scores['playfair'] -= 20.0
+    else:
+        scores['playfair'] += min(10.0, 1.5 * length / 26)
+
+    # Columnar ve route ızgarayı X ile doldurur: asal uzunluk bir ızgaraya sığmaz
+    if _is_prime(length):
+        scores['columnar_transposition'] -= 3.0
+        scores['route'] -= 3.0
+    return scores
+
+
+def identify_cipher(ciphertext: str, language='en', top: int = None, return_features: bool = False):
+    """
+    Şifreli metnin yöntemini tahmin eder.
+
+    Args:
+        ciphertext: Şifreli metin
+        language: Plaintext'in dili (bkz. get_frequencies)
+        top: Döndürülecek yöntem sayısı (varsayılan: 11'i de)
+        return_features: True ise tahminin dayandığı özellikler de döner
+            (cipher_features'ı ikinci kez çağırmaya gerek kalmaz)
+
+    Returns:
+        (yöntem, olasılık) listesi, en olası yöntem başta (olasılıkların
+        toplamı 1). Transpozisyonlar (rail_fence, columnar_transposition,
+        route) ve shift/caesar harf istatistiğiyle ayırt edilmesi zor gruplardır.
+        return_features True ise (liste, cipher_features sözlüğü) ikilisi.
+
+    Raises:
+        ValueError: Metin boşsa
+    """
+    if not ciphertext or not ciphertext.strip():
+        raise ValueError("Şifreli metin boş olamaz")
+    features = cipher_features(ciphertext, language)
+    scores = _log_scores(features)
+    peak = max(scores.values())
+    weights = {method: math.exp(score - peak) for method, score in scores.items()}
+    total = sum(weights.values())
+    ranked = sorted(((method, weight / total) for method, weight in weights.items()), key=lambda item: -item[1])
+    ranked = ranked[:top] if top else ranked
+    return (ranked, features) if return_features else ranked
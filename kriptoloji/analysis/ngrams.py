@@ -0,0 +1,189 @@
+"""
+Dörtlü Harf (Quadgram) İstatistikleri
+Aday çözümleri dile benzerliklerine göre puanlamak için quadgram log-olasılıkları.
+
+Tablo, 26^4 = 456976 elemanlı düz bir array('d')'dir; "ABCD" quadgram'ının
+indeksi a*26^3 + b*26^2 + c*26 + d'dir. Her dilin tablosu süreç başına bir kez
+yüklenir (lru_cache) ve sonraki tüm puanlamalar dizi erişimidir.
+
+Tablo dosyası biçimi "QUADGRAM SAYI" satırlarıdır ('#' ile başlayan satırlar
+atlanır); yaygın english_quadgrams.txt dosyaları da aynı biçimdedir.
+Yeni bir tablo üretmek için:
+    python -m kriptoloji.analysis.ngrams korpus.txt > quadgrams.txt
+"""
+
+import os
+import sys
+import math
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+from .stats import to_indices, from_indices
+
+QUADGRAM_COUNT = 26 ** 4
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+QUADGRAM_FILES = {
+    'en': os.path.join(DATA_DIR, 'english_quadgrams.txt'),
+}
+
+
+def quadgram_code(a: int, b: int, c: int, d: int) -> int:
+    """Dört harf indeksinin tablodaki yeri"""
+    return ((a * 26 + b) * 26 + c) * 26 + d
+
+
+def count_quadgrams(text: str, min_count: int = 1) -> Counter:
+    """
+    Bir korpustaki quadgram sayıları.
+
+    Args:
+        text: Korpus metni (harf olmayan karakterler atlanır)
+        min_count: Bundan az geçen quadgram'lar atılır
+
+    Returns:
+        quadgram -> sayı Counter'ı
+    """
+    letters = from_indices(to_indices(text))
+    counts = Counter(letters[i:i + 4] for i in range(len(letters) - 3))
+    if min_count > 1:
+        counts = Counter({gram: n for gram, n in counts.items() if n >= min_count})
+    return counts
+
+
+def build_table(counts: dict) -> array:
+    """
+    Quadgram sayılarını log10 olasılık tablosuna çevirir.
+
+    Tabloda hiç görülmeyen quadgram'lar log10(0.01 / toplam) alır.
+
+    Args:
+        counts: quadgram -> sayı sözlüğü
+
+    Returns:
+        26^4 elemanlı array('d')
+    """
+    total = sum(counts.values())
+    if total == 0:
+        raise ValueError("Quadgram tablosu boş olamaz")
+    table = array('d', [math.log10(0.01 / total)]) * QUADGRAM_COUNT
+    for gram, count in counts.items():
+        indices = to_indices(gram)
+        if len(indices) == 4:
+            table[quadgram_code(*indices)] = math.log10(count / total)
+    return table
+
+
+def read_counts(path: str) -> dict:
+    """
+    "QUADGRAM SAYI" biçimindeki dosyayı okur.
+
+    Args:
+        path: Tablo dosyası
+
+    Returns:
+        quadgram -> sayı sözlüğü
+    """
+    counts = {}
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            gram, count = line.split()
+            counts[gram.upper()] = int(count)
+    return counts
+
+
+def _table_path(source: str) -> str:
+    """Dil kodunu veya dosya yolunu tablo dosyasına çözer"""
+    path = QUADGRAM_FILES.get(source, source)
+    if not os.path.isfile(path):
+        raise ValueError(f"Quadgram tablosu bulunamadı: {source}. Desteklenenler: {', '.join(QUADGRAM_FILES)}")
+    return path
+
+
+@lru_cache(maxsize=8)
+def load_quadgrams(source: str = 'en') -> array:
+    """
+    Quadgram tablosunu yükler (süreç başına bir kez).
+
+    Args:
+        source: Dil kodu ('en') veya tablo dosyasının yolu
+
+    Returns:
+        26^4 elemanlı log10 olasılık tablosu
+
+    Raises:
+        ValueError: Dil için tablo yoksa
+    """
+    return build_table(read_counts(_table_path(source)))
+
+
+@lru_cache(maxsize=8)
+def load_bigrams(source: str = 'en') -> array:
+    """
+    Quadgram tablosundan türetilen bigram log-olasılıkları.
+
+    Her quadgram sayısı içindeki üç bigram'a eklenir; ayrı bir tablo dosyası
+    gerekmez. Sütun/ray komşuluğu gibi iki harflik puanlamalar için kullanılır.
+
+    Args:
+        source: Dil kodu ('en') veya quadgram tablosunun yolu
+
+    Returns:
+        26^2 elemanlı log10 olasılık tablosu (indeks a*26 + b)
+    """
+    pairs = [0] * 676
+    for gram, count in read_counts(_table_path(source)).items():
+        indices = to_indices(gram)
+        if len(indices) == 4:
+            for i in range(3):
+                pairs[indices[i] * 26 + indices[i + 1]] += count
+    total = sum(pairs)
+    floor = math.log10(0.01 / total)
+    return array('d', (math.log10(n / total) if n else floor for n in pairs))
+
+
+def quadgram_codes(indices) -> list:
+    """
+    Metindeki her quadgram'ın tablo indeksi.
+
+    Args:
+        indices: Harf indeksleri (bytes veya liste)
+
+    Returns:
+        len(indices) - 3 elemanlı liste
+    """
+    return [quadgram_code(indices[i], indices[i + 1], indices[i + 2], indices[i + 3])
+            for i in range(len(indices) - 3)]
+
+
+def quadgram_score(indices, table: array) -> float:
+    """
+    Metnin quadgram log-olasılığı (büyük = dile daha yakın).
+
+    Args:
+        indices: Harf indeksleri (bytes veya liste)
+        table: load_quadgrams çıktısı
+
+    Returns:
+        log10 olasılık toplamı
+    """
+    return sum(table[code] for code in quadgram_codes(indices))
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Kullanım: python -m kriptoloji.analysis.ngrams korpus.txt > quadgrams.txt", file=sys.stderr)
+        sys.exit(2)
+    with open(sys.argv[1], encoding='utf-8', errors='ignore') as f:
+        counts = count_quadgrams(f.read())
+    for gram, count in counts.most_common():
+        print(gram, count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Shift/Caesar Kaba Kuvvet Analizi
+Anahtarı bilinmeyen Shift/Caesar şifreli metni için 26 kaydırmanın hepsini dener.
+
+Algoritma:
+1. Metin bir kez harf indekslerine çevrilir ve 26 harf sayılır (tek geçiş)
+2. Her kaydırma için ki-kare, sayı dizisi döndürülerek hesaplanır (26 x 26 işlem,
+   metin uzunluğundan bağımsız)
+3. Sadece istenen adaylar bytes.translate ile çözülür
+
+26 ayrı ShiftCipher.decrypt çağrısına göre maliyet metin üzerinde yaklaşık bir geçiştir.
+"""
+
+from functools import lru_cache
+
+from .stats import ALPHABET, to_indices, letter_counts, get_frequencies, chi_squared
+
+
+@lru_cache(maxsize=26)
+def _shift_table(shift: int) -> bytes:
+    """İndeks c'yi (c - shift) % 26 harfine çeviren tablo (çözme)"""
+    letters = ALPHABET.encode()
+    return bytes.maketrans(bytes(range(26)), letters[-shift:] + letters[:-shift] if shift else letters)
+
+
+def shift_decrypt(indices: bytes, shift: int) -> str:
+    """
+    Harf indekslerini shift kadar geri kaydırıp metne çevirir.
+
+    Args:
+        indices: to_indices çıktısı
+        shift: Şifreleme kaydırması
+
+    Returns:
+        Çözülmüş metin (ShiftCipher.decrypt ile aynı)
+    """
+    return indices.translate(_shift_table(shift % 26)).decode('ascii')
+
+
+def rank_shifts(counts: list, expected: tuple) -> list:
+    """
+    26 kaydırmayı ki-kare değerine göre sıralar.
+
+    Args:
+        counts: Şifreli metnin harf sayıları
+        expected: Dil frekansları (get_frequencies)
+
+    Returns:
+        (kaydırma, ki-kare) listesi, en iyi aday başta
+    """
+    scores = [(shift, chi_squared(counts, expected, shift)) for shift in range(26)]
+    scores.sort(key=lambda item: item[1])
+    return scores
+
+
+def brute_force_shift(ciphertext: str, language='en', top: int = None) -> list:
+    """
+    Shift/Caesar şifreli metnin tüm kaydırmalarını puanlar.
+
+    Args:
+        ciphertext: Şifreli metin (harf olmayan karakterler atlanır)
+        language: 'en', 'tr' veya özel frekans tablosu (bkz. get_frequencies)
+        top: Döndürülecek aday sayısı (varsayılan: 26'sı da)
+
+    Returns:
+        (kaydırma, plaintext, ki-kare) listesi, en olası aday başta
+
+    Raises:
+        ValueError: Metinde harf yoksa veya dil desteklenmiyorsa
+    """
+    expected = get_frequencies(language)
+    indices = to_indices(ciphertext)
+    if not indices:
+        raise ValueError("Şifreli metin en az bir harf içermeli")
+
+    ranked = rank_shifts(letter_counts(indices), expected)
+    if top is not None:
+        ranked = ranked[:top]
+
+    return [(shift, shift_decrypt(indices, shift), score) for shift, score in ranked]
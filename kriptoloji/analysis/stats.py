@@ -0,0 +1,152 @@
+"""
+Frekans İstatistikleri
+Şifre çözme analizleri için ortak harf sayımı ve dil frekans tabloları.
+
+Metin bir kez A-Z harf indekslerinden (0-25) oluşan bir bytes dizisine
+çevrilir; sonraki tüm sayımlar C seviyesinde bytes.count/translate ile yapılır.
+"""
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# İngilizce harf frekansları (%)
+ENGLISH_FREQUENCIES = (
+    8.167, 1.492, 2.782, 4.253, 12.702, 2.228, 2.015, 6.094, 6.966, 0.153,
+    0.772, 4.025, 2.406, 6.749, 7.507, 1.929, 0.095, 5.987, 6.327, 9.056,
+    2.758, 0.978, 2.360, 0.150, 1.974, 0.074,
+)
+
+# Türkçe harf frekansları (%), 26 harfe katlanmış: Ç->C, Ğ->G, I/İ->I, Ö->O, Ş->S, Ü->U.
+# Q, W, X Türkçede yoktur; sıfır bölmeyi önlemek için çok küçük değer verilir.
+TURKISH_FREQUENCIES = (
+    11.92, 2.84, 2.11, 4.71, 8.91, 0.46, 2.37, 1.21, 13.71, 0.03,
+    4.68, 5.92, 3.75, 7.49, 3.25, 0.89, 0.01, 6.72, 4.79, 3.01,
+    5.08, 0.96, 0.01, 0.01, 3.37, 1.50,
+)
+
+LANGUAGES = {
+    'en': ENGLISH_FREQUENCIES,
+    'tr': TURKISH_FREQUENCIES,
+}
+
+# Türkçe harfleri A-Z karşılıklarına katlama (büyük harfe çevirmeden önce)
+_TURKISH_FOLD = str.maketrans('çğıöşüÇĞİÖŞÜ', 'cgiosuCGIOSU')
+
+# A-Z dışındaki tüm byte'lar silinir, A-Z -> 0-25
+_NON_LETTERS = bytes(b for b in range(256) if not 65 <= b <= 90)
+_TO_INDEX = bytes.maketrans(ALPHABET.encode(), bytes(range(26)))
+_FROM_INDEX = bytes.maketrans(bytes(range(26)), ALPHABET.encode())
+
+
+def to_indices(text: str) -> bytes:
+    """
+    Metni harf indekslerine çevirir (A=0, ..., Z=25), harf olmayanları atar.
+
+    Args:
+        text: Herhangi bir metin (Türkçe karakterler katlanır)
+
+    Returns:
+        Her byte'ı 0-25 arası bir indeks olan bytes
+    """
+    data = text.translate(_TURKISH_FOLD).upper().encode('ascii', 'ignore')
+    return data.translate(_TO_INDEX, _NON_LETTERS)
+
+
+def from_indices(indices: bytes) -> str:
+    """
+    Harf indekslerini tekrar metne çevirir.
+
+    Args:
+        indices: 0-25 arası indekslerden oluşan bytes
+
+    Returns:
+        Büyük harfli metin
+    """
+    return indices.translate(_FROM_INDEX).decode('ascii')
+
+
+def letter_counts(indices: bytes) -> list:
+    """
+    26 harfin sayılarını döner.
+
+    Args:
+        indices: to_indices çıktısı (veya onun bir dilimi)
+
+    Returns:
+        26 elemanlı sayı listesi
+    """
+    return [indices.count(i) for i in range(26)]
+
+
+def index_of_coincidence(counts: list) -> float:
+    """
+    Rastgele seçilen iki harfin aynı olma olasılığı.
+
+    Tek alfabeli şifreler dilin değerini korur (İngilizce ~0.066, Türkçe ~0.059);
+    rastgele metin ~0.038 (1/26) verir.
+
+    Args:
+        counts: letter_counts çıktısı
+
+    Returns:
+        Tesadüf indeksi (2'den az harf varsa 0)
+    """
+    total = sum(counts)
+    if total < 2:
+        return 0.0
+    return sum(c * (c - 1) for c in counts) / (total * (total - 1))
+
+
+def get_frequencies(language) -> tuple:
+    """
+    Dil frekanslarını oranlara (toplamı 1) çevirir.
+
+    Args:
+        language: 'en', 'tr', harf -> frekans sözlüğü veya 26 elemanlı dizi
+
+    Returns:
+        26 elemanlı oran tuple'ı
+
+    Raises:
+        ValueError: Dil desteklenmiyorsa veya tablo geçersizse
+    """
+    if isinstance(language, str):
+        if language not in LANGUAGES:
+            raise ValueError(f"Desteklenmeyen dil: {language}. Desteklenenler: {', '.join(LANGUAGES)}")
+        table = LANGUAGES[language]
+    elif isinstance(language, dict):
+        table = [float(language.get(letter, language.get(letter.lower(), 0))) for letter in ALPHABET]
+    else:
+        table = [float(value) for value in language]
+
+    if len(table) != 26 or min(table) < 0 or sum(table) <= 0:
+        raise ValueError("Frekans tablosu 26 adet negatif olmayan değer içermeli")
+    total = sum(table)
+    # Sıfır frekanslı harf ki-kare'de sıfıra bölme yapar
+    return tuple(max(value / total, 1e-6) for value in table)
+
+
+def chi_squared(counts: list, expected: tuple, shift: int = 0) -> float:
+    """
+    Gözlenen sayıların dil frekanslarına ki-kare uzaklığı.
+
+    shift verilirse sayılar o kadar kaydırılmış okunur: plaintext harfi p'nin
+    sayısı counts[(p + shift) % 26]'dır. Böylece 26 kaydırmanın her biri
+    metni yeniden çözmeden, sadece 26 sayı üzerinden puanlanır.
+
+    Args:
+        counts: letter_counts çıktısı
+        expected: get_frequencies çıktısı
+        shift: Şifreleme kaydırması
+
+    Returns:
+        Ki-kare değeri (küçük = dile daha yakın)
+    """
+    total = sum(counts)
+    if total == 0:
+        return 0.0
+    score = 0.0
+    for p in range(26):
+        expected_count = total * expected[p]
+        diff = counts[(p + shift) % 26] - expected_count
+        score += diff * diff / expected_count
+    return score
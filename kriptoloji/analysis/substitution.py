@@ -0,0 +1,197 @@
+"""
+Substitution Anahtar Çözümü
+Anahtarı bilinmeyen SubstitutionCipher metnini quadgram puanıyla tepe tırmanma
+(hill climbing) kullanarak çözer.
+
+Algoritma:
+1. Başlangıç anahtarı: ilk denemede harf frekans sıralaması eşlenir; sonra
+   sırayla rastgele permütasyon ve sürecin o ana kadarki en iyi anahtarının
+   birkaç takasla bozulmuş hali kullanılır
+2. Tüm harf çiftlerinin çözümleri karışık sırayla yer değiştirilir; puan
+   artarsa takas kalır
+3. Tam bir turda hiç iyileşme olmazsa tırmanma biter
+4. Farklı başlangıçlarla (restart) tekrarlanır; en iyi anahtarlar döner
+
+Artımlı puanlama: her şifre harfi için içinde geçtiği quadgram başlangıçları
+bir kez hesaplanır. İki harfin yeri değişince sadece bu quadgram'lar yeniden
+puanlanır; metnin tamamı değil.
+
+Restart'lar ProcessPoolExecutor ile süreçlere dağıtılır; her süreç quadgram
+tablosunu bir kez yükler. Çağıran kendi havuzunu (executor) verirse her çağrıda
+yeni süreç açılmaz.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from .stats import ALPHABET, to_indices, from_indices, letter_counts, get_frequencies
+from .ngrams import load_quadgrams, quadgram_codes
+
+# Sürecin en iyi anahtarından yeniden başlarken yapılan rastgele takas sayısı
+PERTURB_SWAPS = 3
+
+
+class _Climber:
+    """Tek bir şifreli metin üzerinde artımlı puanlamalı tepe tırmanma"""
+
+    def __init__(self, indices: bytes, table):
+        self.cipher = indices
+        self.table = table
+        self.length = len(indices)
+        # Metinde geçen şifre harfleri; geçmeyenlerin takası puanı değiştirmez
+        self.present = sorted(set(indices))
+        # Şifre harfi -> metindeki konumları
+        self.positions = [[] for _ in range(26)]
+        for i, c in enumerate(indices):
+            self.positions[c].append(i)
+        # Şifre harfi -> içinde geçtiği quadgram başlangıçları
+        last = self.length - 4
+        self.affected = [
+            frozenset(s for i in self.positions[c] for s in range(max(0, i - 3), min(i, last) + 1))
+            for c in range(26)
+        ]
+
+    def climb(self, key: list, rng: random.Random) -> tuple:
+        """
+        Verilen çözme anahtarından (key[şifre harfi] = plaintext harfi) tırmanır.
+
+        Returns:
+            (anahtar, puan)
+        """
+        key = list(key)
+        table = self.table
+        plain = [key[c] for c in self.cipher]
+        contrib = [table[code] for code in quadgram_codes(plain)]
+        score = sum(contrib)
+        positions, affected, present = self.positions, self.affected, self.present
+
+        # Takas çiftleri: en az bir harf metinde geçmeli
+        pairs = [(a, b) for a in present for b in range(26) if b != a and (b > a or b not in present)]
+        improved = True
+        while improved:
+            improved = False
+            rng.shuffle(pairs)
+            for a, b in pairs:
+                pa, pb = key[a], key[b]
+                for i in positions[a]:
+                    plain[i] = pb
+                for i in positions[b]:
+                    plain[i] = pa
+
+                starts = affected[a] | affected[b]
+                new = [table[((plain[s] * 26 + plain[s + 1]) * 26 + plain[s + 2]) * 26 + plain[s + 3]]
+                       for s in starts]
+                delta = sum(new) - sum(contrib[s] for s in starts)
+                if delta > 0:
+                    key[a], key[b] = pb, pa
+                    for s, value in zip(starts, new):
+                        contrib[s] = value
+                    score += delta
+                    improved = True
+                else:
+                    for i in positions[a]:
+                        plain[i] = pa
+                    for i in positions[b]:
+                        plain[i] = pb
+        return key, score
+
+
+def _frequency_key(indices: bytes, language) -> list:
+    """Şifre harflerini sıklık sırasına göre dilin harflerine eşler"""
+    expected = get_frequencies(language)
+    counts = letter_counts(indices)
+    cipher_order = sorted(range(26), key=lambda c: -counts[c])
+    plain_order = sorted(range(26), key=lambda p: -expected[p])
+    key = [0] * 26
+    for c, p in zip(cipher_order, plain_order):
+        key[c] = p
+    return key
+
+
+def _run_restarts(indices: bytes, quadgrams: str, seeds: list, first_key) -> list:
+    """Bir süreçte bir grup restart çalıştırır"""
+    climber = _Climber(indices, load_quadgrams(quadgrams))
+    results = []
+    best = None
+    for n, seed in enumerate(seeds):
+        rng = random.Random(seed)
+        if n == 0 and first_key is not None:
+            key = first_key
+        elif best is not None and n % 2 == 0:
+            key = list(best[0])
+            for _ in range(PERTURB_SWAPS):
+                a, b = rng.randrange(26), rng.randrange(26)
+                key[a], key[b] = key[b], key[a]
+        else:
+            key = list(range(26))
+            rng.shuffle(key)
+        result = climber.climb(key, rng)
+        results.append(result)
+        if best is None or result[1] > best[1]:
+            best = result
+    return results
+
+
+def _encrypt_key(decrypt_key: list) -> str:
+    """Çözme eşlemesini SubstitutionCipher key'ine (A -> key[0], ...) çevirir"""
+    encrypt_key = [''] * 26
+    for c, p in enumerate(decrypt_key):
+        encrypt_key[p] = ALPHABET[c]
+    return ''.join(encrypt_key)
+
+
+def solve_substitution(ciphertext: str, restarts: int = 40, workers: int = None, language='en',
+                       quadgrams: str = 'en', seed: int = None, top: int = 5, executor=None) -> list:
+    """
+    SubstitutionCipher şifreli metnin anahtarını bulur.
+
+    Args:
+        ciphertext: Şifreli metin (harf olmayan karakterler atlanır)
+        restarts: Farklı başlangıç anahtarı sayısı
+        workers: Süreç sayısı (varsayılan: CPU sayısı, 1 = aynı süreçte)
+        language: Frekans başlangıç anahtarı için dil (bkz. get_frequencies)
+        quadgrams: Quadgram tablosu ('en' veya dosya yolu, bkz. load_quadgrams)
+        seed: Tekrarlanabilir sonuç için rastgelelik tohumu
+        top: Döndürülecek farklı anahtar sayısı
+        executor: Paylaşılan süreç havuzu (verilmezse çağrı için açılıp kapatılır);
+            restart'lar workers gruba bölünüp bu havuza gönderilir
+
+    Returns:
+        (anahtar, plaintext, puan) listesi, en olası aday başta. Anahtar
+        SubstitutionCipher.encrypt'e verilebilir (metinde geçmeyen harflerin
+        eşlemesi belirsizdir); puan quadgram log10 olasılığıdır (büyük = iyi).
+
+    Raises:
+        ValueError: Metin 4 harften kısaysa veya restarts geçersizse
+    """
+    if restarts < 1:
+        raise ValueError("restarts en az 1 olmalı")
+    indices = to_indices(ciphertext)
+    if len(indices) < 4:
+        raise ValueError("Şifreli metin en az 4 harf içermeli")
+    # Tablo ana süreçte de yüklenir: hatalı kaynak erken fark edilir
+    load_quadgrams(quadgrams)
+
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(64) for _ in range(restarts)]
+    first_key = _frequency_key(indices, language)
+
+    workers = min(workers or os.cpu_count() or 1, restarts)
+    if workers == 1:
+        results = _run_restarts(indices, quadgrams, seeds, first_key)
+    else:
+        groups = [seeds[i::workers] for i in range(workers)]
+        with nullcontext(executor) if executor else ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_restarts, indices, quadgrams, group, first_key if i == 0 else None)
+                       for i, group in enumerate(groups)]
+            results = [result for future in futures for result in future.result()]
+
+    best = {}
+    for key, score in results:
+        plaintext = bytes(key[c] for c in indices)
+        if plaintext not in best or score > best[plaintext][1]:
+            best[plaintext] = (key, score)
+    ranked = sorted(best.items(), key=lambda item: -item[1][1])[:top]
+    return [(_encrypt_key(key), from_indices(plaintext), score) for plaintext, (key, score) in ranked]
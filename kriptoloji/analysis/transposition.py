@@ -0,0 +1,218 @@
+"""
+Transpozisyon Anahtar Araması
+ColumnarTransposition ve RailFence şifreli metinlerinin anahtarını arar.
+
+Columnar (k sütun, ColumnarTransposition metni tam ızgaraya X ile doldurur):
+1. Şifreli metin k eşit bloğa ayrılır; her blok bir sütundur
+2. Her blok çifti (i, j) için "j, i'nin hemen sağındaki sütun" olmasının
+   puanı bir kez hesaplanır: satır satır bigram log-olasılıkları toplamı
+3. Sütun sıraları (permütasyonlar) ilk sütuna göre süreçlere dağıtılır;
+   her süreç önek ağacında derinlik öncelikli gezer ve önek puanı + kalan
+   sütunların en iyi komşu puanı, o ana kadarki K. en iyinin altına düşünce
+   dalı keser (erken kesme); çağıran bir süreç havuzu (executor) verirse
+   her aramada yeni süreç açılmaz
+4. Kalan adaylar sütun blokları ızgaraya adımlı dilim atamasıyla yerleştirilerek
+   çözülür ve quadgram puanıyla yeniden sıralanır
+
+Rail fence: her ray sayısı için konum permütasyonu bir kez hesaplanır ve metin
+tek bir toplama (gather) ile çözülür; aday sayısı küçük olduğundan hepsi
+quadgram ile puanlanır.
+"""
+
+import os
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from operator import itemgetter
+
+from .stats import ALPHABET, to_indices, from_indices
+from .ngrams import load_quadgrams, load_bigrams, quadgram_score
+
+# Bu kadar veya daha fazla sütunda permütasyon uzayı süreçlere dağıtılır
+PARALLEL_MIN_COLUMNS = 8
+
+
+def _pair_scores(indices: bytes, columns: int, bigrams) -> list:
+    """pair[i][j]: j bloğu i bloğunun sağındaki sütunsa satırlardaki bigram puanı"""
+    rows = len(indices) // columns
+    blocks = [indices[j * rows:(j + 1) * rows] for j in range(columns)]
+    return [[sum(bigrams[a * 26 + b] for a, b in zip(left, right)) if i != j else 0.0
+             for j, right in enumerate(blocks)]
+            for i, left in enumerate(blocks)]
+
+
+def _search_orders(pair: list, first: int, top: int) -> list:
+    """
+    first bloğuyla başlayan sütun sıralarından en iyi `top` tanesi.
+
+    Returns:
+        (komşuluk puanı, blok sırası) listesi
+    """
+    columns = len(pair)
+    best_out = [max(pair[i][j] for j in range(columns) if j != i) for i in range(columns)]
+    lowest_out = min(best_out)
+    heap = []
+    order = [first]
+    used = [False] * columns
+    used[first] = True
+
+    def visit(last, score, remaining_best):
+        if len(order) == columns:
+            if len(heap) < top:
+                heapq.heappush(heap, (score, tuple(order)))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, tuple(order)))
+            return
+        row = pair[last]
+        for nxt in range(columns):
+            if used[nxt]:
+                continue
+            next_score = score + row[nxt]
+            # Üst sınır: kalan her blok en iyi komşusuna bağlansa (son blok hariç)
+            if len(heap) == top and next_score + remaining_best - lowest_out <= heap[0][0]:
+                continue
+            used[nxt] = True
+            order.append(nxt)
+            visit(nxt, next_score, remaining_best - best_out[nxt])
+            order.pop()
+            used[nxt] = False
+
+    visit(first, 0.0, sum(best_out) - best_out[first])
+    return heap
+
+
+def _search_tasks(tasks: list, top: int) -> list:
+    """Bir süreçte (pair, ilk blok) görevlerini çalıştırır"""
+    return [_search_orders(pair, first, top) for pair, first in tasks]
+
+
+def _columnar_plaintext(indices: bytes, blocks: tuple) -> bytes:
+    """Blokları (blocks[sütun] = blok) ızgaraya yerleştirip satır satır okur"""
+    columns = len(blocks)
+    rows = len(indices) // columns
+    grid = bytearray(len(indices))
+    for column, j in enumerate(blocks):
+        grid[column::columns] = indices[j * rows:(j + 1) * rows]
+    return bytes(grid)
+
+
+def _columnar_key(blocks: tuple) -> str:
+    """Sütun -> blok sırasını ColumnarTransposition'a verilebilecek bir key'e çevirir"""
+    # Şifrelemede j. okunan sütun, key'de alfabetik sırası j olan harftir
+    return ''.join(ALPHABET[j] for j in blocks)
+
+
+def search_columnar(ciphertext: str, max_columns: int = 10, min_columns: int = 2, top: int = 10,
+                    workers: int = None, quadgrams: str = 'en', executor=None) -> list:
+    """
+    ColumnarTransposition şifreli metnin anahtarını arar.
+
+    Sadece metin uzunluğunu tam bölen sütun sayıları denenir
+    (ColumnarTransposition.encrypt ızgarayı X ile doldurur).
+
+    Args:
+        ciphertext: Şifreli metin (harf olmayan karakterler atlanır)
+        max_columns: Denenecek en fazla sütun sayısı (key uzunluğu, en fazla 26)
+        min_columns: Denenecek en az sütun sayısı
+        top: Döndürülecek aday sayısı
+        workers: Süreç sayısı (varsayılan: CPU sayısı, 1 = aynı süreçte)
+        quadgrams: Quadgram tablosu ('en' veya dosya yolu)
+        executor: Paylaşılan süreç havuzu (verilmezse arama için açılıp kapatılır);
+            büyük ağaçlar workers gruba bölünüp bu havuza gönderilir
+
+    Returns:
+        (key, plaintext, puan) listesi, en olası aday başta. Key
+        ColumnarTransposition.decrypt'e verilebilir; plaintext sondaki X
+        dolgusu atılmış haldedir; puan quadgram log10 olasılığıdır (büyük = iyi).
+
+    Raises:
+        ValueError: Denenebilecek sütun sayısı yoksa
+    """
+    indices = to_indices(ciphertext)
+    max_columns = min(max_columns, len(ALPHABET), len(indices) // 2)
+    counts = [k for k in range(max(2, min_columns), max_columns + 1) if len(indices) % k == 0]
+    if not counts:
+        raise ValueError("Metin uzunluğunu bölen sütun sayısı yok; metin ColumnarTransposition ile şifrelenmemiş olabilir")
+
+    bigrams = load_bigrams(quadgrams)
+    tasks = [(_pair_scores(indices, k, bigrams), first) for k in counts for first in range(k)]
+
+    workers = workers or os.cpu_count() or 1
+    inline, parallel = [], []
+    for task in tasks:
+        (parallel if workers > 1 and len(task[0]) >= PARALLEL_MIN_COLUMNS else inline).append(task)
+    heaps = _search_tasks(inline, top)
+    if parallel:
+        # Büyük ağaçlar (ilk sütuna göre) süreçlere eşit dağıtılır
+        groups = [parallel[i::workers] for i in range(min(workers, len(parallel)))]
+        with nullcontext(executor) if executor else ProcessPoolExecutor(max_workers=len(groups)) as pool:
+            for result in pool.map(_search_tasks, groups, [top] * len(groups)):
+                heaps.extend(result)
+
+    table = load_quadgrams(quadgrams)
+    candidates = []
+    for blocks in {blocks for heap in heaps for _, blocks in heap}:
+        plaintext = _columnar_plaintext(indices, blocks)
+        candidates.append((_columnar_key(blocks), from_indices(plaintext).rstrip('X'), quadgram_score(plaintext, table)))
+    candidates.sort(key=lambda item: -item[2])
+    return candidates[:top]
+
+
+@lru_cache(maxsize=64)
+def _rail_gather(length: int, rails: int) -> itemgetter:
+    """Plaintext'in p. harfini şifreli metinden alan toplama (gather) fonksiyonu"""
+    cycle = 2 * (rails - 1)
+    rail = [min(p % cycle, cycle - p % cycle) for p in range(length)]
+    # Şifreli metin ray ray okunur: i. harf, (ray, konum) sırasındaki i. konumdur
+    order = [0] * length
+    for i, p in enumerate(sorted(range(length), key=lambda p: (rail[p], p))):
+        order[p] = i
+    return itemgetter(*order)
+
+
+def rail_fence_decrypt(indices: bytes, rails: int) -> bytes:
+    """
+    Rail fence çözümü tek bir toplama (gather) ile.
+
+    Args:
+        indices: Harf indeksleri
+        rails: Ray sayısı
+
+    Returns:
+        Çözülmüş harf indeksleri
+    """
+    if len(indices) < 2:
+        return bytes(indices)
+    return bytes(_rail_gather(len(indices), rails)(indices))
+
+
+def search_rail_fence(ciphertext: str, max_rails: int = None, top: int = 5, quadgrams: str = 'en') -> list:
+    """
+    RailFence şifreli metnin ray sayısını arar.
+
+    Args:
+        ciphertext: Şifreli metin (harf olmayan karakterler atlanır)
+        max_rails: Denenecek en fazla ray sayısı (varsayılan: metin uzunluğunun yarısı)
+        top: Döndürülecek aday sayısı
+        quadgrams: Quadgram tablosu ('en' veya dosya yolu)
+
+    Returns:
+        (ray sayısı, plaintext, puan) listesi, en olası aday başta
+
+    Raises:
+        ValueError: Metin 4 harften kısaysa
+    """
+    indices = to_indices(ciphertext)
+    if len(indices) < 4:
+        raise ValueError("Şifreli metin en az 4 harf içermeli")
+    limit = max(2, len(indices) // 2)
+    max_rails = min(max_rails or limit, limit)
+
+    table = load_quadgrams(quadgrams)
+    candidates = []
+    for rails in range(2, max_rails + 1):
+        plaintext = rail_fence_decrypt(indices, rails)
+        candidates.append((rails, plaintext, quadgram_score(plaintext, table)))
+    best = heapq.nlargest(top, candidates, key=lambda item: item[2])
+    return [(rails, from_indices(plaintext), score) for rails, plaintext, score in best]
@@ -0,0 +1,132 @@
+"""
+Vigenère Anahtar Çözümü
+Anahtarı bilinmeyen Vigenère şifreli metinden anahtarı ve metni bulur.
+
+Algoritma:
+1. Anahtar uzunluğu tahmini: her aday periyot p için metin p sütuna bölünür
+   (sütun i = i, i+p, i+2p, ... harfleri). Doğru periyotta her sütun tek bir
+   kaydırma ile şifrelendiğinden sütunların tesadüf indeksi dilin değerine çıkar.
+2. Her sütunun kaydırması (anahtar harfi) shift analizindeki gibi harf
+   sayılarından ki-kare ile bulunur.
+3. Adaylar çözülmüş metnin ki-kare değerine (anahtar uzunluğu cezasıyla)
+   göre sıralanır.
+
+Sütunlar metnin adımlı (strided) dilimleridir (indices[i::p]); kopyalama ve
+sayım C seviyesinde yapılır. Periyot tahmini için metnin başındaki bir örnek
+yeterlidir; 1 MB metinde maliyetin çoğu seçilen periyotların tam sayımıdır.
+"""
+
+from .stats import ALPHABET, to_indices, letter_counts, get_frequencies, chi_squared, index_of_coincidence
+from .shift import rank_shifts, _shift_table
+
+# Periyot tahmini için kullanılan en fazla harf sayısı
+IOC_SAMPLE_SIZE = 1 << 16
+
+# Rastgele metnin tesadüf indeksi
+RANDOM_IOC = 1 / 26
+
+# p'nin bir böleni q, p'nin rastgele metne göre IoC fazlasının bu kadarını veriyorsa
+# p sadece q'nun tekrarıdır (LEMON için 10, 15, 20 atılır)
+MULTIPLE_RATIO = 0.75
+
+# Anahtar harfi başına ki-kare cezası: kısa metinde her fazladan sütun kendi
+# kaydırmasını seçerek ki-kare'yi düşürür; ceza uzun ve yanlış anahtarları eler
+KEY_LETTER_PENALTY = 2.0
+
+
+def rank_periods(indices: bytes, max_period: int) -> list:
+    """
+    Aday anahtar uzunluklarını ortalama sütun tesadüf indeksine göre sıralar.
+
+    Args:
+        indices: to_indices çıktısı
+        max_period: Denenecek en büyük anahtar uzunluğu
+
+    Returns:
+        (periyot, ortalama IoC) listesi, en yüksek IoC başta
+    """
+    sample = indices[:IOC_SAMPLE_SIZE]
+    # Her sütunda en az 2 harf olmalı
+    max_period = max(1, min(max_period, len(sample) // 2))
+    scores = []
+    for period in range(1, max_period + 1):
+        total = sum(index_of_coincidence(letter_counts(sample[i::period])) for i in range(period))
+        scores.append((period, total / period))
+    scores.sort(key=lambda item: -item[1])
+    return scores
+
+
+def _drop_multiples(periods: list, ratio: float = MULTIPLE_RATIO) -> list:
+    """Bölenlerinden biri neredeyse aynı IoC'yi veren periyotları atar"""
+    excess = {period: ioc - RANDOM_IOC for period, ioc in periods}
+    return [(period, ioc) for period, ioc in periods
+            if not any(period % q == 0 and excess[q] >= ratio * excess[period]
+                       for q in excess if q < period)]
+
+
+def _reduce_key(shifts: list) -> list:
+    """Kendini tekrar eden anahtarı en kısa haline indirir (KEYKEY -> KEY)"""
+    length = len(shifts)
+    for period in range(1, length):
+        if length % period == 0 and shifts == shifts[:period] * (length // period):
+            return shifts[:period]
+    return shifts
+
+
+def _decrypt(indices: bytes, shifts: list) -> str:
+    """Her sütunu kendi kaydırmasıyla çözüp harfleri yerine yazar"""
+    period = len(shifts)
+    if period == 1:
+        return indices.translate(_shift_table(shifts[0])).decode('ascii')
+    plaintext = bytearray(len(indices))
+    for i, shift in enumerate(shifts):
+        plaintext[i::period] = indices[i::period].translate(_shift_table(shift))
+    return plaintext.decode('ascii')
+
+
+def solve_vigenere(ciphertext: str, max_period: int = 20, language='en', top: int = 5) -> list:
+    """
+    Vigenère şifreli metnin anahtarını bulur.
+
+    Args:
+        ciphertext: Şifreli metin (harf olmayan karakterler atlanır)
+        max_period: Denenecek en büyük anahtar uzunluğu
+        language: 'en', 'tr' veya özel frekans tablosu (bkz. get_frequencies)
+        top: Denenecek periyot sayısı (IoC'ye göre en iyiler, katlar hariç)
+
+    Returns:
+        (anahtar, plaintext, puan) listesi, en olası aday başta. Puan, çözülmüş
+        metnin ki-kare değeri + anahtar harfi başına KEY_LETTER_PENALTY'dir.
+        Aynı anahtara inen periyotlar (p, 2p, ...) tek aday olarak döner.
+
+    Raises:
+        ValueError: Metinde harf yoksa, max_period geçersizse veya dil desteklenmiyorsa
+    """
+    if max_period < 1:
+        raise ValueError("max_period en az 1 olmalı")
+    expected = get_frequencies(language)
+    indices = to_indices(ciphertext)
+    if not indices:
+        raise ValueError("Şifreli metin en az bir harf içermeli")
+
+    periods = _drop_multiples(rank_periods(indices, max_period))
+    if top is not None:
+        periods = periods[:top]
+
+    keys = {}
+    for period, _ in periods:
+        shifts = []
+        plain_counts = [0] * 26
+        for i in range(period):
+            counts = letter_counts(indices[i::period])
+            shift = rank_shifts(counts, expected)[0][0]
+            shifts.append(shift)
+            for p in range(26):
+                plain_counts[p] += counts[(p + shift) % 26]
+        shifts = tuple(_reduce_key(shifts))
+        if shifts not in keys:
+            keys[shifts] = chi_squared(plain_counts, expected) + KEY_LETTER_PENALTY * len(shifts)
+
+    ranked = sorted(keys.items(), key=lambda item: item[1])
+    return [(''.join(ALPHABET[s] for s in shifts), _decrypt(indices, list(shifts)), score)
+            for shifts, score in ranked]
@@ -0,0 +1,4 @@
+"""
+Kriptoloji Benchmark'ları
+Algoritmaların performans ölçümleri (kütüphane API'sinin parçası değildir).
+"""
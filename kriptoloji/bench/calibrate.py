@@ -0,0 +1,122 @@
+"""
+Yol Seçimi Kalibrasyonu
+İki uygulaması olan algoritmalar için (tampon yolu: encrypt/decrypt, harf
+başına döngü: encrypt_scalar/decrypt_scalar) döngünün daha hızlı olduğu en
+uzun girdiyi ölçer.
+
+Tampon yolunun sabit maliyeti key ile büyür (Vigenère: key harfi başına bir
+dilim; Rail Fence: ray başına dilim). Bu yüzden eşik, key'in path_width birimi başına harf sayısı olarak
+verilir: uzunluk < eşik * path_width(key) ise harf başına döngü seçilir
+(bkz. backend crypto_service).
+
+Kullanım (depo kök dizininden):
+    python -m kriptoloji.bench.calibrate                          # JSON'u yazdır
+    python -m kriptoloji.bench.calibrate --output cipher_profile.json
+"""
+
+import sys
+import json
+import argparse
+
+from .ciphers import CIPHERS, make_plaintext, environment, _time_call
+
+# path_width birimi başına denenen girdi uzunlukları (harf)
+RATIOS = [0.5, 1, 1.5, 2, 3, 4, 6, 8, 12, 16, 24, 32, 48, 64]
+
+# İki yolu olan algoritmalar
+SCALAR_CIPHERS = [name for name, (cls, _) in CIPHERS.items() if hasattr(cls, 'encrypt_scalar')]
+
+
+def crossover(cipher, op: str, args: tuple, min_time: float, max_repeats: int) -> float:
+    """
+    Harf başına döngünün tampon yolundan hızlı olduğu en uzun girdi.
+
+    Uzunluklar RATIOS sırasıyla denenir. Tampon yolunun art arda iki
+    uzunlukta daha hızlı olduğu ilk noktada (tek ölçümlük gürültü sayılmaz)
+    bir önceki ölçümle arasında doğrusal interpolasyon yapılır.
+
+    Args:
+        cipher: Algoritma nesnesi
+        op: 'encrypt' veya 'decrypt'
+        args: Key argümanları
+        min_time: Her ölçüm için minimum süre (saniye)
+        max_repeats: Her ölçüm için maksimum tekrar
+
+    Returns:
+        Eşik (path_width birimi başına harf); 0: tampon yolu her zaman daha hızlı
+    """
+    width = cipher.path_width(*args)
+    # (oran, harf başına döngü süresi - tampon yolu süresi); negatif: döngü daha hızlı
+    differences = []
+    for ratio in RATIOS:
+        text = make_plaintext(max(1, round(ratio * width)))
+        if op == 'decrypt':
+            text = cipher.encrypt(text, *args)
+        vector, _ = _time_call(getattr(cipher, op), (text,) + args, min_time, max_repeats)
+        scalar, _ = _time_call(getattr(cipher, op + '_scalar'), (text,) + args, min_time, max_repeats)
+        differences.append((ratio, scalar - vector))
+        if len(differences) >= 2 and differences[-2][1] >= 0 and differences[-1][1] >= 0:
+            break
+    else:
+        return float(RATIOS[-1])
+
+    index = len(differences) - 2
+    if index == 0:
+        return 0.0
+    (low, low_difference), (high, high_difference) = differences[index - 1], differences[index]
+    fraction = -low_difference / (high_difference - low_difference)
+    return round(low + (high - low) * fraction, 1)
+
+
+def calibrate(ciphers=None, min_time: float = 0.01, max_repeats: int = 20, progress=None) -> dict:
+    """
+    Seçilen algoritmaların yol seçim eşiklerini ölçer (~1 saniye).
+
+    Args:
+        ciphers: Algoritma isimleri (varsayılan: SCALAR_CIPHERS)
+        min_time: Her ölçüm için minimum süre (saniye)
+        max_repeats: Her ölçüm için maksimum tekrar
+        progress: Her eşikten sonra (algoritma, işlem, eşik) ile çağrılır (isteğe bağlı)
+
+    Returns:
+        {'meta': {...}, 'thresholds': {algoritma: {'encrypt': eşik, 'decrypt': eşik}}}
+    """
+    thresholds = {}
+    for name in ciphers or SCALAR_CIPHERS:
+        cls, key_args = CIPHERS[name]
+        cipher = cls()
+        args = key_args(0)
+        for op in ('encrypt', 'decrypt'):
+            threshold = crossover(cipher, op, args, min_time, max_repeats)
+            thresholds.setdefault(name, {})[op] = threshold
+            if progress:
+                progress(name, op, threshold)
+    return {'meta': environment(min_time), 'thresholds': thresholds}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='kriptoloji scalar/vector path calibration')
+    parser.add_argument('--cipher', action='append', choices=SCALAR_CIPHERS,
+                        help='Calibrate only this cipher (repeatable)')
+    parser.add_argument('--min-time', type=float, default=0.01, help='Minimum seconds per measurement')
+    parser.add_argument('--max-repeats', type=int, default=20)
+    parser.add_argument('--output', help='Write the JSON profile to this file')
+    parser.add_argument('--quiet', action='store_true', help='No per-threshold progress on stderr')
+    args = parser.parse_args(argv)
+
+    def progress(name, op, threshold):
+        print(f'{name:<24} {op:<8} scalar below {threshold:>5} letters per key unit', file=sys.stderr)
+
+    profile = calibrate(args.cipher, args.min_time, args.max_repeats, None if args.quiet else progress)
+
+    output = json.dumps(profile, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""
+Cipher Mikro-Benchmark'ları
+kriptoloji/__init__.py'nin dışa aktardığı 11 algoritmanın encrypt/decrypt
+sürelerini 16 byte'tan 10 MB'a kadar farklı girdi boyutlarında ölçer.
+
+Kullanım (depo kök dizininden):
+    python -m kriptoloji.bench.ciphers                          # 16 B .. 1 MB
+    python -m kriptoloji.bench.ciphers --full                   # 10 MB dahil
+    python -m kriptoloji.bench.ciphers --cipher hill --sizes 1024,65536
+    python -m kriptoloji.bench.ciphers --output baseline.json   # sonuçları kaydet
+    python -m kriptoloji.bench.ciphers --compare baseline.json --threshold 0.15
+
+Karşılaştırma modunda, baseline'a göre --threshold oranından fazla yavaşlayan
+her (cipher, işlem, boyut) satırı raporlanır ve çıkış kodu 1 olur.
+"""
+
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+
+from .. import (
+    ShiftCipher, CaesarCipher, SubstitutionCipher, PlayfairCipher,
+    VigenereCipher, RailFenceCipher, RouteCipher, ColumnarTransposition,
+    PolybiusCipher, PigpenCipher, HillCipher, __version__
+)
+
+# Varsayılan girdi boyutları (byte)
+DEFAULT_SIZES = [16, 256, 4096, 65536, 1048576]
+FULL_SIZES = DEFAULT_SIZES + [10 * 1048576]
+
+# Uzun Vigenère key'i (64 karakter)
+LONG_VIGENERE_KEY = 'THEQUICKBROWNFOXJUMPSOVERTHELAZYDOGANDKEEPSRUNNINGACROSSTHEFIELDS'
+
+# 3x3 tersinir Hill matrisi (det mod 26 = 25)
+HILL_KEY_3X3 = [[6, 24, 1], [13, 16, 10], [20, 17, 15]]
+
+
+def _route_args(size: int) -> tuple:
+    """Route cipher için metni tam kaplayan (rows, cols) değerleri"""
+    cols = max(2, int(size ** 0.5))
+    rows = (size + cols - 1) // cols
+    return (rows, cols, 'spiral_cw')
+
+
+# Her algoritma: (sınıf, boyuta göre key argümanları üreten fonksiyon)
+CIPHERS = {
+    'shift': (ShiftCipher, lambda size: (7,)),
+    'caesar': (CaesarCipher, lambda size: (3,)),
+    'substitution': (SubstitutionCipher, lambda size: ('QWERTYUIOPASDFGHJKLZXCVBNM',)),
+    'playfair': (PlayfairCipher, lambda size: ('MONARCHY',)),
+    'vigenere': (VigenereCipher, lambda size: (LONG_VIGENERE_KEY,)),
+    'rail_fence': (RailFenceCipher, lambda size: (5,)),
+    'route': (RouteCipher, _route_args),
+    'columnar_transposition': (ColumnarTransposition, lambda size: ('ZEBRAS',)),
+    'polybius': (PolybiusCipher, lambda size: ('POLYBIUS',)),
+    'pigpen': (PigpenCipher, lambda size: (None,)),
+    'hill': (HillCipher, lambda size: (HILL_KEY_3X3,)),
+}
+
+
+def make_plaintext(size: int, seed: int = 1234) -> str:
+    """
+    Deterministik, İngilizce benzeri harf dağılımına sahip metin üretir.
+
+    Args:
+        size: Karakter sayısı
+        seed: Rastgelelik tohumu (aynı seed -> aynı metin)
+
+    Returns:
+        Büyük harf A-Z metni
+    """
+    rng = random.Random(seed)
+    letters = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+    weights = [12.7, 9.1, 8.2, 7.5, 7.0, 6.7, 6.3, 6.1, 6.0, 4.3, 4.0, 2.8, 2.8,
+               2.4, 2.4, 2.2, 2.0, 2.0, 1.9, 1.5, 1.0, 0.8, 0.15, 0.15, 0.1, 0.07]
+    # Küçük bir bloğu tekrarlamak, 10 MB için rng maliyetini sınırlar
+    block = ''.join(rng.choices(letters, weights, k=min(size, 65536)))
+    return (block * (size // len(block) + 1))[:size]
+
+
+def _time_call(func, args: tuple, min_time: float, max_repeats: int) -> tuple:
+    """
+    Fonksiyonun tek çağrı süresini ölçer (timeit benzeri).
+
+    Kısa girdilerde zamanlayıcı gürültüsünü azaltmak için çağrılar en az
+    ~2 ms süren gruplar halinde çalıştırılır; gruplar min_time dolana kadar
+    (en fazla max_repeats kez; 1 saniyeden kısa gruplar en az 3 kez)
+    tekrarlanır ve en iyi grup alınır.
+
+    Returns:
+        (çağrı başına en iyi süre, toplam çağrı sayısı)
+    """
+    # Grup büyüklüğünü kalibre et
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        elapsed = time.perf_counter() - t0
+        if elapsed >= 0.002:
+            break
+        number *= 2
+
+    best = elapsed / number
+    repeats = 1
+    started = time.perf_counter()
+    while repeats < max_repeats and ((repeats < 3 and elapsed < 1.0) or time.perf_counter() - started < min_time):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        best = min(best, (time.perf_counter() - t0) / number)
+        repeats += 1
+    return best, repeats * number
+
+
+def run_benchmarks(ciphers=None, sizes=None, min_time: float = 0.2, max_repeats: int = 50,
+                   progress=None) -> dict:
+    """
+    Seçilen algoritmaları tüm boyutlarda ölçer.
+
+    Args:
+        ciphers: Algoritma isimleri (varsayılan: hepsi)
+        sizes: Girdi boyutları (varsayılan: DEFAULT_SIZES)
+        min_time: Her ölçüm için minimum süre (saniye)
+        max_repeats: Her ölçüm için maksimum tekrar
+        progress: Her sonuçtan sonra çağrılan fonksiyon (isteğe bağlı)
+
+    Returns:
+        {'meta': {...}, 'results': [{'cipher', 'op', 'size', 'seconds', 'mb_per_s', 'calls'}, ...]}
+    """
+    ciphers = ciphers or list(CIPHERS.keys())
+    sizes = sizes or DEFAULT_SIZES
+    results = []
+
+    for size in sizes:
+        plaintext = make_plaintext(size)
+        for name in ciphers:
+            cls, key_args = CIPHERS[name]
+            cipher = cls()
+            args = key_args(size)
+
+            # Decrypt girdisi: aynı metnin şifreli hali (ölçüme dahil değil)
+            ciphertext = cipher.encrypt(plaintext, *args)
+
+            for op, func, text in (('encrypt', cipher.encrypt, plaintext),
+                                   ('decrypt', cipher.decrypt, ciphertext)):
+                seconds, calls = _time_call(func, (text,) + args, min_time, max_repeats)
+                result = {
+                    'cipher': name,
+                    'op': op,
+                    'size': size,
+                    'seconds': seconds,
+                    'mb_per_s': (size / 1048576) / seconds if seconds else 0.0,
+                    'calls': calls,
+                }
+                results.append(result)
+                if progress:
+                    progress(result)
+
+    return {
+        'meta': environment(min_time),
+        'results': results,
+    }
+
+
+def environment(min_time: float) -> dict:
+    """Ölçümlerin yapıldığı ortam (sonuç dosyalarının 'meta' alanı)"""
+    return {
+        'kriptoloji_version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'min_time': min_time,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """
+    Sonuçları baseline ile karşılaştırır.
+
+    Args:
+        current: run_benchmarks çıktısı
+        baseline: Kaydedilmiş run_benchmarks çıktısı
+        threshold: İzin verilen yavaşlama oranı (0.10 = %10)
+
+    Returns:
+        Gerilemeler: [{'cipher', 'op', 'size', 'baseline', 'current', 'ratio'}, ...]
+    """
+    base = {(r['cipher'], r['op'], r['size']): r['seconds'] for r in baseline['results']}
+    regressions = []
+    for r in current['results']:
+        previous = base.get((r['cipher'], r['op'], r['size']))
+        if not previous:
+            continue
+        ratio = r['seconds'] / previous
+        if ratio > 1.0 + threshold:
+            regressions.append({
+                'cipher': r['cipher'],
+                'op': r['op'],
+                'size': r['size'],
+                'baseline': previous,
+                'current': r['seconds'],
+                'ratio': ratio,
+            })
+    return regressions
+
+
+def _format_size(size: int) -> str:
+    for unit, factor in (('MB', 1048576), ('KB', 1024)):
+        if size >= factor and size % factor == 0:
+            return f'{size // factor} {unit}'
+    return f'{size} B'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='kriptoloji cipher micro-benchmarks')
+    parser.add_argument('--cipher', action='append', choices=list(CIPHERS.keys()),
+                        help='Benchmark only this cipher (repeatable)')
+    parser.add_argument('--sizes', help='Comma-separated input sizes in bytes')
+    parser.add_argument('--full', action='store_true', help='Include 10 MB inputs')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per measurement')
+    parser.add_argument('--max-repeats', type=int, default=50)
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--compare', metavar='BASELINE', help='Fail on regressions against this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Allowed slowdown ratio (default 0.10)')
+    parser.add_argument('--quiet', action='store_true', help='No per-result progress on stderr')
+    args = parser.parse_args(argv)
+
+    if args.sizes:
+        sizes = [int(s) for s in args.sizes.split(',')]
+    else:
+        sizes = FULL_SIZES if args.full else DEFAULT_SIZES
+
+    def progress(r):
+        print(f"{r['cipher']:<24} {r['op']:<8} {_format_size(r['size']):>7} "
+              f"{r['seconds'] * 1000:>12.3f} ms {r['mb_per_s']:>10.3f} MB/s",
+              file=sys.stderr)
+
+    current = run_benchmarks(args.cipher, sizes, args.min_time, args.max_repeats,
+                             None if args.quiet else progress)
+
+    output = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['cipher']} {r['op']} {_format_size(r['size'])}: "
+                  f"{r['baseline'] * 1000:.3f} ms -> {r['current'] * 1000:.3f} ms "
+                  f"(x{r['ratio']:.2f})", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f'No regressions beyond {args.threshold:.0%} against {args.compare}', file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
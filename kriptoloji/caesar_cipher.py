@@ -17,6 +17,7 @@ Z -> C
 """
 
 from .shift_cipher import ShiftCipher
+from .utils.alphabet import LATIN
 
 
 class CaesarCipher:
@@ -25,10 +26,21 @@ class CaesarCipher:
     Shift Cipher'ı key=3 ile kullanır.
     """
     
-    def __init__(self):
-        self.shift_cipher = ShiftCipher()
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.shift_cipher = ShiftCipher(alphabet)
+        self.alphabet = self.shift_cipher.alphabet
         self.default_key = 3  # Klasik Caesar shift
     
+    def letter_maps(self, key: int = None) -> tuple:
+        """Şifrelemenin harf eşlemesi (bkz. ShiftCipher.letter_maps)"""
+        if key is None:
+            key = self.default_key
+        return self.shift_cipher.letter_maps(key)
+    
     def encrypt(self, plaintext: str, key: int = None) -> str:
         """
         Metni Caesar Cipher ile şifreler.
@@ -25,9 +25,13 @@ Sütunlar (key sırasına göre):
 5. sütun: O D
 
 Şifreli: LRHWLLEOOD
+
+Uygulama: k sütunlu ızgarada j. sütun, indeks tamponunun tampon[j::k]
+dilimidir. Şifreleme sütun dilimlerini key sırasıyla birleştirir, çözme
+sütun parçalarını aynı dilimlere geri atar; satır/sütun listeleri kurulmaz.
 """
 
-from .utils.text_utils import prepare_text, pad_text
+from .utils.alphabet import LATIN, get_alphabet
 
 
 class ColumnarTransposition:
@@ -36,6 +40,16 @@ class ColumnarTransposition:
     Sütunları key'e göre sıralayarak şifreler.
     """
     
+    # Şifreleme dolgu harfi ekler, çözme sondaki dolguyu siler
+    padding = True
+    
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.alphabet = get_alphabet(alphabet)
+    
     def _get_column_order(self, key: str) -> list:
         """
         Key'den sütun sırasını belirler.
@@ -83,6 +97,34 @@ class ColumnarTransposition:
             inverse[order] = i
         return inverse
     
+    def output_length(self, length: int, key: str) -> int:
+        """Şifreli metnin uzunluğu: key uzunluğunun katına yuvarlanır (bkz. pipeline)"""
+        if len(key) == 0:
+            raise ValueError("Key boş olamaz")
+        return -(-length // len(key)) * len(key)
+    
+    def positions(self, length: int, key: str) -> list:
+        """
+        Şifrelemenin konum permütasyonu (bkz. pipeline).
+        
+        Args:
+            length: Metin uzunluğu
+            key: Key kelimesi
+        
+        Returns:
+            Çıktının j. harfi girdinin positions[j]. harfidir; length değeri
+            dolgu harfi (X) demektir
+        """
+        padded = self.output_length(length, key)
+        key_len = len(key)
+        column_order = self._get_column_order(key.upper())
+        sorted_columns = sorted(range(key_len), key=lambda x: column_order[x])
+        
+        positions = []
+        for col_idx in sorted_columns:
+            positions.extend(min(i, length) for i in range(col_idx, padded, key_len))
+        return positions
+    
     def encrypt(self, plaintext: str, key: str) -> str:
         """
         Metni Columnar Transposition ile şifreler.
@@ -99,42 +141,26 @@ class ColumnarTransposition:
         Returns:
             Şifreli metin
         """
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
         if len(key) == 0:
             raise ValueError("Key boş olamaz")
         
         key = key.upper()
         key_len = len(key)
         
-        # Metni key uzunluğuna kadar doldur
-        padded_text = pad_text(text, ((len(text) + key_len - 1) // key_len) * key_len, 'X')
+        # Metni indeks tamponuna çevir, key uzunluğunun katına kadar X ile doldur
+        buffer = self.alphabet.encode(plaintext)
+        if len(buffer) % key_len != 0:
+            buffer += bytes([self.alphabet.pad_index]) * (key_len - len(buffer) % key_len)
         
-        # Sütun sırasını belirle
+        # Sütunları (tampon[j::k]) sıraya göre oku
         column_order = self._get_column_order(key)
-        
-        # Matrisi oluştur (satırlar)
-        num_rows = len(padded_text) // key_len
-        matrix = []
-        text_index = 0
-        
-        for i in range(num_rows):
-            row = []
-            for j in range(key_len):
-                row.append(padded_text[text_index])
-                text_index += 1
-            matrix.append(row)
-        
-        # Sütunları sıraya göre oku
-        ciphertext = []
         sorted_columns = sorted(range(key_len), key=lambda x: column_order[x])
         
+        ciphertext = bytearray()
         for col_idx in sorted_columns:
-            for row in matrix:
-                ciphertext.append(row[col_idx])
+            ciphertext += buffer[col_idx::key_len]
         
-        return ''.join(ciphertext)
+        return self.alphabet.decode(ciphertext)
     
     def decrypt(self, ciphertext: str, key: str) -> str:
         """
@@ -152,65 +178,36 @@ class ColumnarTransposition:
         Returns:
             Çözülmüş metin
         """
-        # Metni hazırla
-        text = prepare_text(ciphertext, remove_spaces=True)
-        
         if len(key) == 0:
             raise ValueError("Key boş olamaz")
         
         key = key.upper()
         key_len = len(key)
         
+        # Metni indeks tamponuna çevir
+        buffer = self.alphabet.encode(ciphertext)
+        
         # Sütun sırasını belirle
         column_order = self._get_column_order(key)
+        sorted_columns = sorted(range(key_len), key=lambda x: column_order[x])
         
         # Toplam karakter sayısı
-        total_chars = len(text)
+        total_chars = len(buffer)
         num_rows = (total_chars + key_len - 1) // key_len
         
-        # Sütun sırasına göre sıralı sütun indeksleri
-        sorted_columns = sorted(range(key_len), key=lambda x: column_order[x])
-        
-        # Her sütunda kaç karakter var
+        # Her sütunda kaç karakter var (ilk extra_chars sütun bir fazla)
         chars_per_col = total_chars // key_len
         extra_chars = total_chars % key_len
         
-        # Şifreli metni sütunlara yerleştir
-        text_index = 0
-        columns = [[] for _ in range(key_len)]
+        # Eksik hücreler X olarak kalır
+        grid = bytearray([self.alphabet.pad_index]) * (num_rows * key_len)
         
+        # Şifreli metnin parçalarını sütun dilimlerine geri yerleştir
+        text_index = 0
         for col_order_idx, col_idx in enumerate(sorted_columns):
-            # Bu sütuna kaç karakter gelecek
-            if col_order_idx < extra_chars:
-                col_size = chars_per_col + 1
-            else:
-                col_size = chars_per_col
-            
-            # Bu sütuna karakterleri yerleştir
-            for _ in range(col_size):
-                if text_index < len(text):
-                    columns[col_idx].append(text[text_index])
-                    text_index += 1
-        
-        # Matrisi oluştur (sütunlardan satırlara)
-        matrix = []
-        for row_idx in range(num_rows):
-            row = []
-            for col_idx in range(key_len):
-                if row_idx < len(columns[col_idx]):
-                    row.append(columns[col_idx][row_idx])
-                else:
-                    row.append('X')  # Padding
-            matrix.append(row)
-        
-        # Satır satır oku
-        plaintext = []
-        for row in matrix:
-            plaintext.extend(row)
-        
-        result = ''.join(plaintext)
-        # Son X'leri kaldır (padding)
-        result = result.rstrip('X')
-        
-        return result
-
+            col_size = chars_per_col + 1 if col_order_idx < extra_chars else chars_per_col
+            grid[col_idx:col_idx + col_size * key_len:key_len] = buffer[text_index:text_index + col_size]
+            text_index += col_size
+        
+        # Satır satır oku, son X'leri kaldır (padding)
+        return self.alphabet.decode(grid).rstrip(self.alphabet.pad)
@@ -3,10 +3,10 @@ Hill Cipher
 Matris tabanlı şifreleme. Her karakter grubu bir matrisle çarpılır.
 
 Algoritma:
-1. NxN anahtar matrisi seç (2x2 veya 3x3)
+1. NxN anahtar matrisi seç (2x2 .. 10x10)
 2. Metni N'li gruplara böl
 3. Her grubu vektör olarak temsil et
-4. Vektörü anahtar matrisiyle çarp (mod 26)
+4. Vektörü anahtar matrisiyle çarp (mod n; Latin alfabede 26, Türkçede 29)
 5. Sonuç vektörü karakterlere çevir
 
 Örnek (2x2 matris, key=[[3,3],[2,5]]):
@@ -14,13 +14,33 @@ Plaintext: "HELLO" -> "HE", "LL", "OX" (padding)
 HE -> [7, 4]
 [7, 4] * [[3,3],[2,5]] = [7*3+4*2, 7*3+4*5] = [29, 41]
 Mod 26: [3, 15] -> "DP"
+
+Uygulama: metin indeks tamponuna çevrilir; k. bileşenler tampon[k::N]
+dilimleridir. Çıktının r. bileşeni, her dilimin key[r][k] ile çarpılmış
+hali (çarpım tablosuyla translate) toplanarak bulunur. Toplama, dilimler
+büyük tamsayı olarak okunup toplanarak yapılır: byte'lar taşmadan en
+fazla 255 // (n - 1) terim alabilir (Latin: 10, yani 10x10'a kadar hiç
+indirgeme gerekmez); daha fazla terimde ara toplam translate ile mod n'e
+indirilir. Mod n ve harfe dönüş translate'tir.
 """
 
-from .utils.matrix_utils import (
-    create_matrix, matrix_multiply, text_to_matrix, 
-    matrix_to_text, matrix_inverse
-)
-from .utils.text_utils import prepare_text, pad_text
+from functools import lru_cache
+
+from .utils.matrix_utils import create_matrix, matrix_inverse
+from .utils.alphabet import LATIN, get_alphabet
+
+
+@lru_cache(maxsize=8)
+def _tables(size: int) -> tuple:
+    """
+    Modül n için çarpım ve indirgeme tabloları.
+
+    Returns:
+        (c ile çarpım tabloları: i -> (c * i) mod n, toplam (0-255) -> mod n)
+    """
+    multiply = [bytes((c * i) % size if i < size else 0 for i in range(256)) for c in range(size)]
+    reduce = bytes(v % size for v in range(256))
+    return multiply, reduce
 
 
 class HillCipher:
@@ -29,15 +49,20 @@ class HillCipher:
     Matris çarpımı kullanarak şifreleme yapar.
     """
     
-    def __init__(self):
-        self.supported_sizes = [2, 3]  # 2x2 ve 3x3 matrisler
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.alphabet = get_alphabet(alphabet)
+        self.supported_sizes = list(range(2, 11))  # 2x2 .. 10x10 matrisler
     
     def _validate_key_matrix(self, key_matrix: list) -> list:
         """
         Anahtar matrisini doğrular ve normalize eder.
         
         Args:
-            key_matrix: Anahtar matrisi (2x2 veya 3x3)
+            key_matrix: Anahtar matrisi (NxN)
         
         Returns:
             Doğrulanmış matris
@@ -45,21 +70,57 @@ class HillCipher:
         n = len(key_matrix)
         
         if n not in self.supported_sizes:
-            raise ValueError(f"Matris boyutu {n}x{n} desteklenmiyor. Sadece 2x2 ve 3x3 destekleniyor.")
+            raise ValueError(f"Matris boyutu {n}x{n} desteklenmiyor. 2x2 ile 10x10 arası destekleniyor.")
         
         # Her satırın uzunluğunu kontrol et
         for i, row in enumerate(key_matrix):
             if len(row) != n:
                 raise ValueError(f"Matris kare değil: satır {i} uzunluğu {len(row)}, beklenen {n}")
         
-        # Mod 26'ya normalize et
+        # Mod n'e normalize et
+        size = self.alphabet.size
         normalized = create_matrix(n, n, 0)
         for i in range(n):
             for j in range(n):
-                normalized[i][j] = key_matrix[i][j] % 26
+                normalized[i][j] = key_matrix[i][j] % size
         
         return normalized
     
+    def _multiply_blocks(self, buffer: bytearray, key: list) -> bytearray:
+        """
+        Her N'li bloğu key ile çarpar (key * blok, mod n).
+        
+        Args:
+            buffer: Uzunluğu N'in katı olan indeks tamponu
+            key: NxN matris (0..n-1)
+        
+        Returns:
+            Sonuç indeks tamponu
+        """
+        n = len(key)
+        size = self.alphabet.size
+        multiply, reduce = _tables(size)
+        # Bir byte'ta taşmadan toplanabilecek terim sayısı
+        limit = 255 // (size - 1)
+        blocks = len(buffer) // n
+        # k. bileşenler: her bloğun k. harfi
+        components = [buffer[k::n] for k in range(n)]
+        result = bytearray(len(buffer))
+        
+        for r, row in enumerate(key):
+            total = 0
+            terms = 0
+            for k, factor in enumerate(row):
+                if terms == limit:
+                    # Ara toplamı mod n'e indir (bir terim sayılır)
+                    total = int.from_bytes(total.to_bytes(blocks, 'big').translate(reduce), 'big')
+                    terms = 1
+                total += int.from_bytes(components[k].translate(multiply[factor]), 'big')
+                terms += 1
+            result[r::n] = total.to_bytes(blocks, 'big')
+        
+        return result.translate(reduce)
+    
     def encrypt(self, plaintext: str, key_matrix: list) -> str:
         """
         Metni Hill Cipher ile şifreler.
@@ -72,50 +133,25 @@ class HillCipher:
         
         Args:
             plaintext: Şifrelenecek metin
-            key_matrix: Anahtar matrisi (2x2 veya 3x3 liste listesi)
+            key_matrix: Anahtar matrisi (NxN liste listesi)
         
         Returns:
             Şifreli metin
         """
+        alphabet = self.alphabet
+        
         # Anahtar matrisini doğrula
         key = self._validate_key_matrix(key_matrix)
         n = len(key)
         
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
-        # Metni N'li gruplara böl ve padding ekle
-        if len(text) % n != 0:
-            text = pad_text(text, ((len(text) + n - 1) // n) * n, 'X')
-        
-        # Grupları şifrele
-        ciphertext_blocks = []
-        
-        for i in range(0, len(text), n):
-            # Grubu al
-            block = text[i:i + n]
-            
-            # Vektörü oluştur (1xN matris)
-            vector = text_to_matrix(block, 1, n)
-            
-            # Matris çarpımı: vector * key (1xN * NxN = 1xN)
-            # Not: text_to_matrix Nx1 döndürür, bu yüzden transpoze etmemiz gerekebilir
-            # Basit yaklaşım: vektörü Nx1 olarak oluştur, sonra key ile çarp
-            
-            # Vektörü Nx1 matris olarak oluştur
-            vector_matrix = [[0] for _ in range(n)]
-            for j, char in enumerate(block):
-                from .utils.text_utils import char_to_index
-                vector_matrix[j][0] = char_to_index(char)
-            
-            # Key * vector (NxN * Nx1 = Nx1)
-            result_matrix = matrix_multiply(key, vector_matrix)
-            
-            # Sonucu metne çevir
-            result_text = matrix_to_text(result_matrix)
-            ciphertext_blocks.append(result_text)
-        
-        return ''.join(ciphertext_blocks)
+        # Metni indeks tamponuna çevir
+        buffer = alphabet.encode(plaintext)
+        
+        # N'in katına kadar dolgu harfiyle (X) doldur
+        if len(buffer) % n != 0:
+            buffer += bytes([alphabet.pad_index]) * (n - len(buffer) % n)
+        
+        return alphabet.decode(self._multiply_blocks(buffer, key))
     
     def decrypt(self, ciphertext: str, key_matrix: list) -> str:
         """
@@ -123,7 +159,7 @@ class HillCipher:
         
         Adımlar:
         1. Anahtar matrisini doğrula
-        2. Ters matrisi hesapla (mod 26)
+        2. Ters matrisi hesapla (mod n)
         3. Metni N'li gruplara böl
         4. Her grubu ters matrisle çarp
         5. Sonuçları birleştir
@@ -135,45 +171,25 @@ class HillCipher:
         Returns:
             Çözülmüş metin
         """
+        alphabet = self.alphabet
+        
         # Anahtar matrisini doğrula
         key = self._validate_key_matrix(key_matrix)
         n = len(key)
         
         # Ters matrisi hesapla
         try:
-            inverse_key = matrix_inverse(key)
+            inverse_key = matrix_inverse(key, alphabet.size)
         except ValueError as e:
             raise ValueError(f"Anahtar matrisinin modüler tersi yok: {e}")
         
-        # Metni hazırla
-        text = prepare_text(ciphertext, remove_spaces=True)
+        # Metni indeks tamponuna çevir
+        buffer = alphabet.encode(ciphertext)
         
-        if len(text) % n != 0:
+        if len(buffer) % n != 0:
             raise ValueError(f"Şifreli metin uzunluğu {n}'in katı olmalı")
         
-        # Grupları çöz
-        plaintext_blocks = []
-        
-        for i in range(0, len(text), n):
-            # Grubu al
-            block = text[i:i + n]
-            
-            # Vektörü Nx1 matris olarak oluştur
-            vector_matrix = [[0] for _ in range(n)]
-            for j, char in enumerate(block):
-                from .utils.text_utils import char_to_index
-                vector_matrix[j][0] = char_to_index(char)
-            
-            # Inverse key * vector (NxN * Nx1 = Nx1)
-            result_matrix = matrix_multiply(inverse_key, vector_matrix)
-            
-            # Sonucu metne çevir
-            result_text = matrix_to_text(result_matrix)
-            plaintext_blocks.append(result_text)
-        
-        result = ''.join(plaintext_blocks)
-        # Son X'leri kaldır (padding)
-        result = result.rstrip('X')
-        
-        return result
-
+        inverse_key = [[value % alphabet.size for value in row] for row in inverse_key]
+        
+        # Son dolgu harflerini kaldır (padding)
+        return alphabet.decode(self._multiply_blocks(buffer, inverse_key)).rstrip(alphabet.pad)
@@ -17,9 +17,21 @@ Pigpen şablonları:
 - Y, Z: Özel semboller
 
 Bu implementasyonda sembolleri karakter kodlarıyla temsil ediyoruz.
+Şablonlar 26 Latin harfi için tanımlıdır; metin her zaman Latin alfabesine
+katlanır (Ç -> C).
 """
 
-from .utils.text_utils import prepare_text
+from .utils.alphabet import LATIN
+
+
+class _CodeTable(dict):
+    """
+    Şablon kodu -> harf. Tam eşleşmeyen kod (boşluklu veya bilinmeyen) sadece
+    kaçırıldığında boşlukları atılarak aranır; bilinmeyen kod "?" olur.
+    """
+
+    def __missing__(self, code: str) -> str:
+        return self.get(code.strip(), '?')
 
 
 class PigpenCipher:
@@ -66,6 +78,10 @@ class PigpenCipher:
         
         # Ters harita (decrypt için)
         self.decrypt_map = {v: k for k, v in self.encrypt_map.items()}
+        self._code_table = _CodeTable(self.decrypt_map)
+        
+        # Harf indeksi -> şablon kodu
+        self.codes = [self.encrypt_map[char] for char in LATIN.letters]
     
     def encrypt(self, plaintext: str, key: str = None) -> str:
         """
@@ -84,20 +100,9 @@ class PigpenCipher:
         Returns:
             Şifreli metin (kodlar "|" ile ayrılmış)
         """
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
-        # Her karakteri şablon koduna çevir
-        ciphertext = []
-        for char in text:
-            if char in self.encrypt_map:
-                ciphertext.append(self.encrypt_map[char])
-            else:
-                # Bilinmeyen karakter için boş
-                ciphertext.append('??')
-        
-        # Kodları "|" ile birleştir
-        return '|'.join(ciphertext)
+        # Metni indeks tamponuna çevir, her indeksi şablon koduna çevir
+        # ve kodları "|" ile birleştir
+        return '|'.join(map(self.codes.__getitem__, LATIN.encode(plaintext)))
     
     def decrypt(self, ciphertext: str, key: str = None) -> str:
         """
@@ -114,18 +119,7 @@ class PigpenCipher:
         Returns:
             Çözülmüş metin
         """
-        # Kodları ayır
-        codes = ciphertext.split('|')
-        
-        # Her kodu karaktere çevir
-        plaintext = []
-        for code in codes:
-            code = code.strip()
-            if code in self.decrypt_map:
-                plaintext.append(self.decrypt_map[code])
-            else:
-                # Bilinmeyen kod için "?" ekle
-                plaintext.append('?')
-        
-        return ''.join(plaintext)
+        # Kodları ayır, her kodu tek sözlük aramasıyla karaktere çevir
+        # (bilinmeyen kod için "?", bkz. _CodeTable)
+        return ''.join(map(self._code_table.__getitem__, ciphertext.split('|')))
 
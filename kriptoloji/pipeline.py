@@ -0,0 +1,374 @@
+"""
+Şifre Hattı (Pipeline)
+Birden fazla şifreyi art arda uygular; uyumlu aşamaları cebirsel olarak
+birleştirip metin üzerinde olabildiğince az geçiş yapar.
+
+Aşama aileleri:
+- Harf eşlemesi (Shift, Caesar, Substitution, Vigenère): i. konumdaki
+  harfe maps[i mod p] permütasyonu uygulanır (bkz. letter_maps). Art arda
+  gelen eşlemeler bileşkeleri alınarak tek bir periyodik eşlemede birleşir
+  (periyot: periyotların ekoku). Tek alfabeli bir eşleme tek translate,
+  periyodik bir eşleme faz başına bir adımlı dilim translate'idir.
+- Konum permütasyonu (Rail Fence, Columnar, Route): çıktının j. harfi
+  girdinin positions[j]. harfidir (bkz. positions). Art arda gelen
+  permütasyonlar tek bir permütasyonda birleşir; her metin uzunluğu için bir
+  kez hesaplanır (lru_cache) ve aritmetik parçalarına bölünüp adımlı dilim
+  atamalarıyla uygulanır. Parçalara bölünemeyen permütasyonlarda (tek
+  başına Rail Fence) aşamalar kendi dilim işlemleriyle tek tek çalışır.
+- Diğerleri (Playfair, Hill, Polybius, Pigpen) kendi encrypt/decrypt'leriyle
+  çalışır. Polybius ve Pigpen harf dışı çıktı verdiği için sadece son aşama
+  olabilir.
+
+Aşamalar yeniden sıralanmaz: şifreleme ve çözme, aşamaları tek tek
+uygulamakla aynı sonucu verir. Çözmede permütasyonlar dolgulu aşamalarda
+(Columnar, Route) bölünür, çünkü sondaki dolgu silinince metin uzunluğu ve
+onunla birlikte önceki aşamanın permütasyonu değişir.
+
+Örnek:
+    pipeline = CipherPipeline([
+        (SubstitutionCipher(), 'QWERTYUIOPASDFGHJKLZXCVBNM'),
+        (ShiftCipher(), 3),                 # substitution ile tek tabloda
+        (ColumnarTransposition(), 'ZEBRA'),
+        (RailFenceCipher(), 3),             # columnar ile tek permütasyonda
+    ])
+    pipeline.passes  # 2
+"""
+
+from functools import lru_cache
+from math import gcd
+
+from .pigpen_cipher import PigpenCipher
+from .polybius_cipher import PolybiusCipher
+from .utils.alphabet import LATIN
+
+# Birleşik harf eşlemesinin en büyük periyodu; aşılırsa yeni geçiş başlar
+MAX_PERIOD = 360
+
+# Toplamanın dilimlerle yapılması için aritmetik parçaların ortalama en az uzunluğu
+MIN_RUN_LENGTH = 8
+
+# Harf dışı çıktı veren şifreler (sadece son aşama olabilir)
+NON_LETTER_CIPHERS = (PolybiusCipher, PigpenCipher)
+
+
+def _compose_maps(first: tuple, second: tuple):
+    """
+    İki periyodik eşlemenin bileşkesi (önce first, sonra second).
+
+    Returns:
+        Birleşik eşleme veya periyot MAX_PERIOD'u aşarsa None
+    """
+    period = len(first) * len(second) // gcd(len(first), len(second))
+    if period > MAX_PERIOD:
+        return None
+    return tuple(
+        tuple(second[i % len(second)][x] for x in first[i % len(first)])
+        for i in range(period)
+    )
+
+
+def _invert_map(mapping: tuple) -> tuple:
+    inverse = [0] * len(mapping)
+    for i, target in enumerate(mapping):
+        inverse[target] = i
+    return tuple(inverse)
+
+
+class _LetterStep:
+    """Birleşik (periyodik) harf eşlemesi: tek geçiş"""
+
+    on_text = False
+
+    def __init__(self, alphabet, maps: tuple):
+        self.alphabet = alphabet
+        self.maps = maps
+
+    def merge(self, maps: tuple) -> bool:
+        composed = _compose_maps(self.maps, maps)
+        if composed is None:
+            return False
+        self.maps = composed
+        return True
+
+    def compile(self):
+        alphabet = self.alphabet
+        self.tables = [alphabet.index_table(mapping) for mapping in self.maps]
+        self.inverse_tables = [alphabet.index_table(_invert_map(mapping)) for mapping in self.maps]
+        # Tek alfabeli eşleme son adımsa dönüşüm ve harfe çevirme tek translate
+        if len(self.maps) == 1:
+            self.letter_tables = (alphabet.letter_table(self.maps[0]),
+                                  alphabet.letter_table(_invert_map(self.maps[0])))
+        else:
+            self.letter_tables = None
+
+    def apply(self, buffer: bytearray, decrypt: bool) -> bytearray:
+        tables = self.inverse_tables if decrypt else self.tables
+        period = len(tables)
+        if period == 1:
+            return buffer.translate(tables[0])
+        for i, table in enumerate(tables[:len(buffer)]):
+            buffer[i::period] = buffer[i::period].translate(table)
+        return buffer
+
+
+def _group_positions(stages: tuple, length: int) -> list:
+    """
+    Art arda konum permütasyonlarının bileşkesi.
+
+    Args:
+        stages: (şifre, argümanlar) tuple'ları
+        length: Girdi uzunluğu
+
+    Returns:
+        Çıktının j. harfi girdinin gather[j]. harfi; length değeri dolgu harfi
+    """
+    gather = range(length)
+    current = length
+    for cipher, args in stages:
+        positions = cipher.positions(current, *args)
+        gather = [gather[p] if p < current else length for p in positions]
+        current = len(positions)
+    return list(gather)
+
+
+def _group_length(stages: tuple, length: int) -> int:
+    for cipher, args in stages:
+        length = cipher.output_length(length, *args)
+    return length
+
+
+def _plan(gather: list):
+    """
+    Toplama planı: gather'ı aritmetik dizi parçalarına (run) böler.
+
+    Columnar ve Route permütasyonları (ve bileşkeleri) uzun adımlı dizilerden
+    oluşur; bunlar adımlı dilim atamasıyla toplanır (harf başına Python
+    işlemi yok).
+
+    Returns:
+        (çıktı başı, çıktı sonu, girdi başı, adım) parçaları; parçalar
+        kısaysa (örn. tek başına Rail Fence'in zikzak rayları) None: harf
+        başına toplama, şifrelerin kendi dilim işlemlerinden yavaştır
+    """
+    runs = []
+    i, n = 0, len(gather)
+    while i < n:
+        start = gather[i]
+        step = gather[i + 1] - start if i + 1 < n else 1
+        j = i + 1
+        if step:
+            while j < n and gather[j] - gather[j - 1] == step:
+                j += 1
+        else:
+            step = 1
+        runs.append((i, j, start, step))
+        i = j
+    if len(runs) * MIN_RUN_LENGTH > n:
+        return None
+    return tuple(runs)
+
+
+def _permute(buffer: bytearray, plan, inverse: bool = False) -> bytearray:
+    """
+    Toplama planını uygular.
+
+    Args:
+        buffer: İndeks tamponu (şifrelemede dolgu harfiyle biter, bkz. _group_positions)
+        plan: _plan çıktısı
+        inverse: Ters permütasyon; parçalar dağıtma (scatter) olarak uygulanır
+    """
+    result = bytearray(len(buffer) if inverse else plan[-1][1] if plan else 0)
+    for out_start, out_stop, start, step in plan:
+        stop = start + step * (out_stop - out_start)
+        source = slice(start, stop if stop >= 0 else None, step)
+        if inverse:
+            result[source] = buffer[out_start:out_stop]
+        else:
+            result[out_start:out_stop] = buffer[source]
+    return result
+
+
+@lru_cache(maxsize=256)
+def _group_plan(stages: tuple, length: int):
+    """Birleşik permütasyonun planı (çözmede aynı parçalar dağıtılır)"""
+    return _plan(_group_positions(stages, length))
+
+
+class _PositionStep:
+    """Birleşik konum permütasyonu: tek toplama"""
+
+    on_text = False
+
+    def __init__(self, alphabet, stage: tuple):
+        self.alphabet = alphabet
+        self.stages = (stage,)
+
+    def merge(self, stage: tuple) -> bool:
+        self.stages += (stage,)
+        return True
+
+    def compile(self):
+        # Çözme bölümleri (çözme sırasıyla). Dolgulu bir aşama çözülünce
+        # sondaki dolgu silinir ve metin kısalır; önceki aşamaların
+        # permütasyonu bu yeni uzunluğa bağlı olduğu için bölüm orada biter.
+        segments = []
+        segment = ()
+        for stage in reversed(self.stages):
+            segment = (stage,) + segment
+            if stage[0].padding:
+                segments.append((segment, True))
+                segment = ()
+        if segment:
+            segments.append((segment, False))
+        self.segments = segments
+
+    def _each(self, buffer: bytearray, stages: tuple, decrypt: bool) -> bytearray:
+        """Aşamaları şifrelerin kendi encrypt/decrypt'iyle tek tek uygular"""
+        text = self.alphabet.decode(buffer)
+        if decrypt:
+            for cipher, args in reversed(stages):
+                text = cipher.decrypt(text, *args)
+        else:
+            for cipher, args in stages:
+                text = cipher.encrypt(text, *args)
+        return self.alphabet.encode(text)
+
+    def apply(self, buffer: bytearray, decrypt: bool) -> bytearray:
+        pad = self.alphabet.pad_index
+        if not decrypt:
+            plan = _group_plan(self.stages, len(buffer))
+            if plan is None:
+                return self._each(buffer, self.stages, decrypt)
+            buffer.append(pad)
+            return _permute(buffer, plan)
+
+        for segment, padding in self.segments:
+            length = len(buffer)
+            # Bu aşamaların üretemeyeceği bir uzunluk veya parçalanamayan permütasyon
+            plan = _group_plan(segment, length) if _group_length(segment, length) == length else None
+            if plan is None:
+                buffer = self._each(buffer, segment, decrypt)
+                continue
+            buffer = _permute(buffer, plan, inverse=True)
+            if padding:
+                # Sondaki dolgu harflerini kaldır (bkz. ColumnarTransposition.decrypt)
+                end = len(buffer)
+                while end and buffer[end - 1] == pad:
+                    end -= 1
+                del buffer[end:]
+        return buffer
+
+
+class _CipherStep:
+    """Birleştirilemeyen aşama: şifrenin kendi encrypt/decrypt'i"""
+
+    on_text = True
+
+    def __init__(self, cipher, args: tuple):
+        self.cipher = cipher
+        self.args = args
+
+    def compile(self):
+        pass
+
+    def apply(self, text: str, decrypt: bool) -> str:
+        if decrypt:
+            return self.cipher.decrypt(text, *self.args)
+        return self.cipher.encrypt(text, *self.args)
+
+
+class CipherPipeline:
+    """
+    Art arda şifreleme hattı.
+    Aşamalar bir kez derlenir (birleştirilir); encrypt/decrypt derlenmiş
+    adımları uygular.
+    """
+
+    def __init__(self, stages):
+        """
+        Args:
+            stages: (şifre, key argümanları...) tuple'ları, uygulanma sırasıyla;
+                örn. (RouteCipher(), 3, 4, 'spiral_cw')
+
+        Raises:
+            ValueError: Hat boşsa, şifrelerin alfabeleri farklıysa veya harf
+                dışı çıktı veren bir şifre son aşama değilse
+        """
+        stages = [(stage[0], tuple(stage[1:])) for stage in stages]
+        if not stages:
+            raise ValueError("Hat en az bir aşama içermeli")
+
+        alphabets = {getattr(cipher, 'alphabet', LATIN) for cipher, _ in stages}
+        if len(alphabets) != 1:
+            raise ValueError("Hattaki tüm şifreler aynı alfabeyi kullanmalı")
+        self.alphabet = alphabets.pop()
+
+        steps = []
+        for index, (cipher, args) in enumerate(stages):
+            if isinstance(cipher, NON_LETTER_CIPHERS) and index != len(stages) - 1:
+                raise ValueError(f"{type(cipher).__name__} harf dışı çıktı verir, sadece son aşama olabilir")
+            last = steps[-1] if steps else None
+
+            if hasattr(cipher, 'letter_maps'):
+                maps = cipher.letter_maps(*args)
+                if not (isinstance(last, _LetterStep) and last.merge(maps)):
+                    steps.append(_LetterStep(self.alphabet, maps))
+            elif hasattr(cipher, 'positions'):
+                # Argümanları şimdiden doğrula (hatalı key derlemede yakalanır)
+                cipher.positions(0, *args)
+                if not (isinstance(last, _PositionStep) and last.merge((cipher, args))):
+                    steps.append(_PositionStep(self.alphabet, (cipher, args)))
+            else:
+                steps.append(_CipherStep(cipher, args))
+
+        for step in steps:
+            step.compile()
+        self.stages = stages
+        self.steps = steps
+
+    @property
+    def passes(self) -> int:
+        """Metin üzerindeki geçiş sayısı (birleştirilmiş adımlar)"""
+        return len(self.steps)
+
+    def _run(self, text: str, steps: list, decrypt: bool) -> str:
+        """Adımları sırayla uygular; metin adımlar arasında indeks tamponunda kalır"""
+        alphabet = self.alphabet
+        buffer = None
+        for index, step in enumerate(steps):
+            if step.on_text:
+                if buffer is not None:
+                    text, buffer = alphabet.decode(buffer), None
+                text = step.apply(text, decrypt)
+                continue
+            if buffer is None:
+                buffer = alphabet.encode(text)
+            if index == len(steps) - 1 and getattr(step, 'letter_tables', None):
+                # Son adım tek alfabeli eşleme: harfe çevirmeyle aynı translate
+                return alphabet.decode(buffer, step.letter_tables[decrypt])
+            buffer = step.apply(buffer, decrypt)
+        return text if buffer is None else alphabet.decode(buffer)
+
+    def encrypt(self, plaintext: str) -> str:
+        """
+        Metni hattın tüm aşamalarıyla şifreler.
+
+        Args:
+            plaintext: Şifrelenecek metin
+
+        Returns:
+            Şifreli metin (aşamaları tek tek uygulamakla aynı)
+        """
+        return self._run(plaintext, self.steps, decrypt=False)
+
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        Şifreli metni aşamaları ters sırayla çözerek açar.
+
+        Args:
+            ciphertext: Şifreli metin
+
+        Returns:
+            Çözülmüş metin
+        """
+        return self._run(ciphertext, self.steps[::-1], decrypt=True)
@@ -16,126 +16,137 @@ C H Y B D
 E F G I/J K
 L P Q S T
 U V W X Z
+
+Alfabe değiştirilebilir (bkz. utils.alphabet): Türkçe alfabede Ğ, G ile
+birleşir ve matris 4x7'dir; satır/sütun kaydırmaları matris boyutuna göre
+döngüseldir.
+
+Uygulama: her key için nxn bigram -> şifreli bigram tabloları bir kez
+oluşturulur (lru_cache). Metin indeks tamponuna çevrilir ve her bigram tek
+bir tablo erişimiyle şifrelenir; matriste konum araması yapılmaz.
 """
 
-from .utils.text_utils import prepare_text, remove_duplicates, char_to_index, index_to_char
+from functools import lru_cache
+
+from .utils.alphabet import LATIN, get_alphabet
+
+
+@lru_cache(maxsize=256)
+def _pair_tables(alphabet, rows: tuple) -> tuple:
+    """
+    Matris satırlarından (şifreleme, çözme) bigram tabloları.
+
+    Args:
+        alphabet: Matrisin alfabesi
+        rows: Matris satırları (her satır bir str)
+
+    Returns:
+        İki liste; a*n+b. eleman bigram'ın 2 byte'lık (indeks) karşılığı
+    """
+    height, width = len(rows), len(rows[0])
+    cells = [[alphabet.letters.index(char) for char in row] for row in rows]
+    position = {}
+    for r, row in enumerate(cells):
+        for c, index in enumerate(row):
+            position[index] = (r, c)
+    # Birleşen harfler (J) hedef harfin (I) hücresinde
+    for index in range(alphabet.size):
+        position[index] = position[alphabet.square_table[index]]
+
+    tables = []
+    for step in (1, -1):
+        table = []
+        for a in range(alphabet.size):
+            row1, col1 = position[a]
+            for b in range(alphabet.size):
+                row2, col2 = position[b]
+                if row1 == row2:
+                    # Aynı satır: sağdaki / soldaki (döngüsel)
+                    pair = (cells[row1][(col1 + step) % width], cells[row2][(col2 + step) % width])
+                elif col1 == col2:
+                    # Aynı sütun: alttaki / üstteki (döngüsel)
+                    pair = (cells[(row1 + step) % height][col1], cells[(row2 + step) % height][col2])
+                else:
+                    # Dikdörtgen köşeleri
+                    pair = (cells[row1][col2], cells[row2][col1])
+                table.append(bytes(pair))
+        tables.append(table)
+    return tuple(tables)
 
 
 class PlayfairCipher:
     """
     Playfair Cipher implementasyonu.
-    5x5 matris kullanarak bigram şifreleme yapar.
+    Alfabenin karesini (Latin: 5x5) kullanarak bigram şifreleme yapar.
     """
     
-    def __init__(self):
-        self.alphabet = 'ABCDEFGHIKLMNOPQRSTUVWXYZ'  # J yok (I ile birleşir)
-        self.matrix_size = 5
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        
+        Raises:
+            ValueError: Alfabe için kare tanımlı değilse
+        """
+        self.alphabet = get_alphabet(alphabet)
+        if self.alphabet.square_shape is None:
+            raise ValueError(f"{self.alphabet.name} alfabesi için Playfair karesi tanımlı değil")
+        self.rows, self.cols = self.alphabet.square_shape
     
     def _create_matrix(self, key: str) -> list:
         """
-        Key'den 5x5 Playfair matrisi oluşturur.
+        Key'den Playfair matrisi oluşturur.
         
         Adımlar:
-        1. Key'den tekrarları kaldır
+        1. Key'den tekrarları kaldır (birleşen harfler katlanır, J -> I)
         2. Key'i matrise yerleştir
-        3. Kalan harfleri alfabetik sırayla ekle (I/J birleşik)
+        3. Kalan harfleri alfabetik sırayla ekle
         
         Args:
             key: Matris oluşturmak için key
         
         Returns:
-            5x5 matris (liste listesi)
+            Matris (liste listesi, Latin için 5x5)
         """
-        # Key'i hazırla
-        key = prepare_text(key, remove_spaces=True)
-        key = key.replace('J', 'I')  # J'yi I'ya çevir
-        key = remove_duplicates(key)
-        
-        # Matrisi oluştur
-        matrix = []
-        used_chars = set()
-        
-        # Önce key'i ekle
-        for char in key:
-            if char not in used_chars:
-                used_chars.add(char)
-        
-        # Key karakterlerini matrise ekle
-        key_list = list(key)
-        for char in key_list:
-            if char not in used_chars:
-                continue
-            if len(matrix) == 0 or len(matrix[-1]) == 5:
-                matrix.append([])
-            matrix[-1].append(char)
-            used_chars.add(char)
-        
-        # Kalan harfleri alfabetik sırayla ekle
-        for char in self.alphabet:
-            if char not in used_chars:
-                if len(matrix) == 0 or len(matrix[-1]) == 5:
-                    matrix.append([])
-                matrix[-1].append(char)
-                used_chars.add(char)
-        
-        return matrix
+        return [list(row) for row in self.alphabet.keyed_square(key)]
     
-    def _find_position(self, matrix: list, char: str) -> tuple:
-        """
-        Karakterin matristeki pozisyonunu bulur.
-        
-        Args:
-            matrix: Playfair matrisi
-            char: Aranacak karakter
-        
-        Returns:
-            (satır, sütun) tuple'ı
-        """
-        char = char.upper().replace('J', 'I')
-        for i, row in enumerate(matrix):
-            for j, cell in enumerate(row):
-                if cell == char:
-                    return (i, j)
-        raise ValueError(f"Karakter bulunamadı: {char}")
+    def _tables(self, key: str) -> tuple:
+        """Key'in (şifreleme, çözme) bigram tabloları"""
+        return _pair_tables(self.alphabet, tuple(self.alphabet.keyed_square(key)))
     
-    def _prepare_bigrams(self, text: str) -> list:
+    def _apply(self, text: str, table: list) -> str:
         """
-        Metni bigram'lara böler.
+        Metni bigram'lara bölüp her bigram'ı tablodan çevirir.
         
         Kurallar:
-        1. Aynı harf yan yana gelirse, aralarına X ekle
-        2. Son bigram tek harf kalırsa, X ekle
+        1. Aynı harf yan yana gelirse, ilkinin yanına dolgu harfi (X) ekle
+        2. Son bigram tek harf kalırsa, dolgu harfi ekle
         
         Args:
             text: Metin
+            table: _pair_tables tablosu
         
         Returns:
-            Bigram listesi
+            Sonuç metni
         """
-        text = prepare_text(text, remove_spaces=True)
-        text = text.replace('J', 'I')
-        
-        bigrams = []
+        alphabet = self.alphabet
+        size, pad = alphabet.size, alphabet.pad_index
+        buffer = alphabet.encode(text).translate(alphabet.square_table)
+        length = len(buffer)
+        result = bytearray()
         i = 0
         
-        while i < len(text):
-            if i + 1 < len(text):
-                char1 = text[i]
-                char2 = text[i + 1]
-                
-                # Aynı harf yan yanaysa X ekle
-                if char1 == char2:
-                    bigrams.append(char1 + 'X')
-                    i += 1
-                else:
-                    bigrams.append(char1 + char2)
-                    i += 2
+        while i < length:
+            a = buffer[i]
+            if i + 1 < length and buffer[i + 1] != a:
+                result += table[a * size + buffer[i + 1]]
+                i += 2
             else:
-                # Son karakter tek kalırsa X ekle
-                bigrams.append(text[i] + 'X')
+                # Aynı harf yan yanaysa veya son harf tek kaldıysa X ekle
+                result += table[a * size + pad]
                 i += 1
         
-        return bigrams
+        return alphabet.decode(result)
     
     def encrypt(self, plaintext: str, key: str) -> str:
         """
@@ -148,36 +159,8 @@ class PlayfairCipher:
         Returns:
             Şifreli metin
         """
-        # Matrisi oluştur
-        matrix = self._create_matrix(key)
-        
-        # Bigram'lara böl
-        bigrams = self._prepare_bigrams(plaintext)
-        
-        # Her bigram'ı şifrele
-        ciphertext = []
-        for bigram in bigrams:
-            char1, char2 = bigram[0], bigram[1]
-            row1, col1 = self._find_position(matrix, char1)
-            row2, col2 = self._find_position(matrix, char2)
-            
-            # Aynı satırdaysa: sağdaki karakterleri al
-            if row1 == row2:
-                new_col1 = (col1 + 1) % 5
-                new_col2 = (col2 + 1) % 5
-                ciphertext.append(matrix[row1][new_col1] + matrix[row2][new_col2])
-            
-            # Aynı sütundaysa: alttaki karakterleri al
-            elif col1 == col2:
-                new_row1 = (row1 + 1) % 5
-                new_row2 = (row2 + 1) % 5
-                ciphertext.append(matrix[new_row1][col1] + matrix[new_row2][col2])
-            
-            # Değilse: dikdörtgen köşelerini al
-            else:
-                ciphertext.append(matrix[row1][col2] + matrix[row2][col1])
-        
-        return ''.join(ciphertext)
+        encrypt_table, _ = self._tables(key)
+        return self._apply(plaintext, encrypt_table)
     
     def decrypt(self, ciphertext: str, key: str) -> str:
         """
@@ -190,39 +173,11 @@ class PlayfairCipher:
         Returns:
             Çözülmüş metin
         """
-        # Matrisi oluştur
-        matrix = self._create_matrix(key)
+        _, decrypt_table = self._tables(key)
+        result = self._apply(ciphertext, decrypt_table)
         
-        # Bigram'lara böl
-        bigrams = self._prepare_bigrams(ciphertext)
-        
-        # Her bigram'ı çöz
-        plaintext = []
-        for bigram in bigrams:
-            char1, char2 = bigram[0], bigram[1]
-            row1, col1 = self._find_position(matrix, char1)
-            row2, col2 = self._find_position(matrix, char2)
-            
-            # Aynı satırdaysa: soldaki karakterleri al
-            if row1 == row2:
-                new_col1 = (col1 - 1) % 5
-                new_col2 = (col2 - 1) % 5
-                plaintext.append(matrix[row1][new_col1] + matrix[row2][new_col2])
-            
-            # Aynı sütundaysa: üstteki karakterleri al
-            elif col1 == col2:
-                new_row1 = (row1 - 1) % 5
-                new_row2 = (row2 - 1) % 5
-                plaintext.append(matrix[new_row1][col1] + matrix[new_row2][col2])
-            
-            # Değilse: dikdörtgen köşelerini al
-            else:
-                plaintext.append(matrix[row1][col2] + matrix[row2][col1])
-        
-        result = ''.join(plaintext)
         # Son X'i kaldır (padding olabilir)
-        if result.endswith('X') and len(result) > 1:
+        if result.endswith(self.alphabet.pad) and len(result) > 1:
             result = result[:-1]
         
         return result
-
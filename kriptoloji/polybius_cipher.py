@@ -24,90 +24,94 @@ Standart matris (key yok):
 3  L M N O P
 4  Q R S T U
 5  V W X Y Z
+
+Alfabe değiştirilebilir (bkz. utils.alphabet): Türkçe alfabede Ğ, G ile
+birleşir ve kare 4 satır x 7 sütundur (satır rakamları 1-4, sütun 1-7).
+
+Uygulama: her matris için harf indeksi -> satır rakamı ve harf indeksi ->
+sütun rakamı translate tabloları bir kez oluşturulur (lru_cache). Şifreli
+metnin çift konumları satır, tek konumları sütun rakamlarıdır; her biri
+indeks tamponunun tek bir translate'idir.
 """
 
-from .utils.text_utils import prepare_text, remove_duplicates
+from functools import lru_cache
+
+from .utils.alphabet import LATIN, get_alphabet
+
+_DIGITS = b'123456789'
+_NON_DIGITS = bytes(b for b in range(256) if not 48 <= b <= 57)
+
+
+@lru_cache(maxsize=256)
+def _digit_tables(alphabet, rows: tuple) -> tuple:
+    """
+    Matris satırlarından (satır rakamı, sütun rakamı, hücre -> harf) tabloları.
+
+    Args:
+        alphabet: Matrisin alfabesi
+        rows: Matris satırları (her satır harflerden oluşan str)
+
+    Returns:
+        İki 256 byte'lık translate tablosu (birleşen harfler hedef harfin
+        hücresinde) ve hücre numarası -> harf tablosu (Alphabet.letter_table)
+    """
+    row_digits = bytearray(256)
+    col_digits = bytearray(256)
+    for r, row in enumerate(rows):
+        for c, char in enumerate(row):
+            index = alphabet.letters.index(char)
+            row_digits[index] = _DIGITS[r]
+            col_digits[index] = _DIGITS[c]
+    cell_letters = alphabet.letter_table([alphabet.letters.index(char) for char in ''.join(rows)])
+    return bytes(row_digits), bytes(col_digits), cell_letters
+
+
+@lru_cache(maxsize=16)
+def _cell_tables(height: int, width: int) -> tuple:
+    """
+    Rakam -> hücre numarasına katkısı: satır (d-1)*genişlik, sütun d-1.
+
+    Toplam hücre sayısından küçük kalır (alfabe en fazla 128 harf), yani
+    byte'lar büyük tamsayı olarak toplandığında taşma olmaz.
+
+    Returns:
+        (satır tablosu, sütun tablosu, geçerli satır rakamları, geçerli sütun rakamları)
+    """
+    row_cell = bytes.maketrans(_DIGITS[:height], bytes(range(0, height * width, width)))
+    col_cell = bytes.maketrans(_DIGITS[:width], bytes(range(width)))
+    return row_cell, col_cell, _DIGITS[:height], _DIGITS[:width]
 
 
 class PolybiusCipher:
     """
     Polybius Square Cipher implementasyonu.
-    5x5 matris kullanarak karakterleri koordinatlara çevirir.
+    Alfabenin karesini (Latin: 5x5) kullanarak karakterleri koordinatlara çevirir.
     """
     
-    def __init__(self):
-        self.matrix_size = 5
-        self.standard_alphabet = 'ABCDEFGHIKLMNOPQRSTUVWXYZ'  # J yok (I ile birleşir)
-    
-    def _create_matrix(self, key: str = None) -> list:
+    def __init__(self, alphabet=LATIN):
         """
-        Polybius matrisi oluşturur.
-        
         Args:
-            key: Key kelimesi (varsayılan: None, standart matris)
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
         
-        Returns:
-            5x5 matris
+        Raises:
+            ValueError: Alfabe için kare tanımlı değilse
         """
-        if key is None:
-            # Standart matris
-            matrix = []
-            alphabet = self.standard_alphabet
-            for i in range(self.matrix_size):
-                row = []
-                for j in range(self.matrix_size):
-                    idx = i * self.matrix_size + j
-                    if idx < len(alphabet):
-                        row.append(alphabet[idx])
-                matrix.append(row)
-            return matrix
-        
-        # Key'den matris oluştur
-        key = prepare_text(key, remove_spaces=True)
-        key = key.replace('J', 'I')
-        key = remove_duplicates(key)
-        
-        # Kullanılan karakterleri takip et
-        used_chars = set(key)
-        matrix = []
-        
-        # Önce key'i ekle
-        key_list = list(key)
-        for char in key_list:
-            if len(matrix) == 0 or len(matrix[-1]) == self.matrix_size:
-                matrix.append([])
-            if char not in used_chars:
-                continue
-            matrix[-1].append(char)
-            used_chars.add(char)
-        
-        # Kalan harfleri ekle
-        for char in self.standard_alphabet:
-            if char not in used_chars:
-                if len(matrix) == 0 or len(matrix[-1]) == self.matrix_size:
-                    matrix.append([])
-                matrix[-1].append(char)
-                used_chars.add(char)
-        
-        return matrix
+        self.alphabet = get_alphabet(alphabet)
+        if self.alphabet.square_shape is None:
+            raise ValueError(f"{self.alphabet.name} alfabesi için Polybius karesi tanımlı değil")
+        self.rows, self.cols = self.alphabet.square_shape
     
-    def _find_position(self, matrix: list, char: str) -> tuple:
+    def _create_matrix(self, key: str = None) -> list:
         """
-        Karakterin matristeki pozisyonunu bulur.
+        Polybius matrisi oluşturur.
         
         Args:
-            matrix: Polybius matrisi
-            char: Aranacak karakter
+            key: Key kelimesi (varsayılan: None, standart matris)
         
         Returns:
-            (satır, sütun) tuple'ı (0-indexed)
+            Matris (liste listesi, Latin için 5x5)
         """
-        char = char.upper().replace('J', 'I')
-        for i, row in enumerate(matrix):
-            for j, cell in enumerate(row):
-                if cell == char:
-                    return (i, j)
-        raise ValueError(f"Karakter bulunamadı: {char}")
+        return [list(row) for row in self.alphabet.keyed_square(key)]
     
     def encrypt(self, plaintext: str, key: str = None) -> str:
         """
@@ -125,22 +129,20 @@ class PolybiusCipher:
         Returns:
             Şifreli metin (rakamlar: "11223344" gibi)
         """
-        # Matrisi oluştur
-        matrix = self._create_matrix(key)
-        
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        text = text.replace('J', 'I')
-        
-        # Her karakteri koordinatlara çevir
-        ciphertext = []
-        for char in text:
-            row, col = self._find_position(matrix, char)
-            # 1-indexed koordinatlar (1-5 arası)
-            ciphertext.append(str(row + 1))
-            ciphertext.append(str(col + 1))
-        
-        return ''.join(ciphertext)
+        alphabet = self.alphabet
+        
+        # Matrisin rakam tablolarını al
+        row_digits, col_digits, _ = _digit_tables(alphabet, tuple(alphabet.keyed_square(key)))
+        
+        # Metni indeks tamponuna çevir (J -> I)
+        buffer = alphabet.encode(plaintext).translate(alphabet.square_table)
+        
+        # 1-indexed koordinatlar: çift konumlar satır, tek konumlar sütun
+        ciphertext = bytearray(2 * len(buffer))
+        ciphertext[0::2] = buffer.translate(row_digits)
+        ciphertext[1::2] = buffer.translate(col_digits)
+        
+        return ciphertext.decode('ascii')
     
     def decrypt(self, ciphertext: str, key: str = None) -> str:
         """
@@ -158,31 +160,28 @@ class PolybiusCipher:
         Returns:
             Çözülmüş metin
         """
-        # Matrisi oluştur
-        matrix = self._create_matrix(key)
+        alphabet = self.alphabet
+        
+        # Matrisin hücre -> harf tablosunu al
+        _, _, cell_letters = _digit_tables(alphabet, tuple(alphabet.keyed_square(key)))
+        row_cell, col_cell, row_digits, col_digits = _cell_tables(self.rows, self.cols)
         
         # Sadece rakamları al
-        digits = ''.join(c for c in ciphertext if c.isdigit())
+        digits = ciphertext.encode('ascii', 'ignore').translate(None, _NON_DIGITS)
         
         if len(digits) % 2 != 0:
             raise ValueError("Şifreli metin çift sayıda rakam içermeli")
         
-        # İkişer rakam oku
-        plaintext = []
-        for i in range(0, len(digits), 2):
-            row_str = digits[i]
-            col_str = digits[i + 1]
-            
-            # 1-indexed'den 0-indexed'e çevir
-            row = int(row_str) - 1
-            col = int(col_str) - 1
-            
-            # Geçerlilik kontrolü
-            if not (0 <= row < self.matrix_size and 0 <= col < self.matrix_size):
-                raise ValueError(f"Geçersiz koordinat: ({row_str}, {col_str})")
-            
-            # Karakteri al
-            plaintext.append(matrix[row][col])
-        
-        return ''.join(plaintext)
-
+        rows, cols = digits[0::2], digits[1::2]
+        
+        # Geçerlilik kontrolü (kare dışında rakam)
+        if rows.translate(None, row_digits) or cols.translate(None, col_digits):
+            for row_digit, col_digit in zip(rows, cols):
+                if row_digit not in row_digits or col_digit not in col_digits:
+                    raise ValueError(f"Geçersiz koordinat: ({chr(row_digit)}, {chr(col_digit)})")
+        
+        # Hücre numarası = satır katkısı + sütun katkısı; byte dizileri büyük
+        # tamsayı olarak toplanır, sonuç hücre -> harf tablosuyla çevrilir
+        cells = (int.from_bytes(rows.translate(row_cell), 'big')
+                 + int.from_bytes(cols.translate(col_cell), 'big')).to_bytes(len(rows), 'big')
+        return alphabet.decode(cells, cell_letters)
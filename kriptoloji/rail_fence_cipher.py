@@ -13,9 +13,38 @@ E . L . L . O . . . L . D
 L . . . W . . . . . . .
 
 Şifreli: HORELOLWD (satır satır okunur)
+
+Uygulama: zigzag periyodu d = 2 * (rails - 1). r. satır i = r, d - r,
+r + d, 2d - r, ... konumlarından oluşur; yani iki adımlı dilimin
+(tampon[r::d] ve tampon[d-r::d]) iç içe geçmesidir. Şifreleme ve çözme bu
+dilimlerin indeks tamponu üzerinde atanmasıyla yapılır; matris kurulmaz.
+
+Kısa metinlerde satır başına dilim maliyeti baskındır: encrypt_scalar ve
+decrypt_scalar konum permütasyonunu (uzunluk, ray) başına bir kez hesaplanan
+tek bir toplama (gather) ile uygular. Toplama fonksiyonu önbellekte değilse
+ilk çağrı tampon yolundan yavaştır; kısa mesaj uzunlukları az olduğundan
+önbellek (4096 giriş) sıcak kalır.
 """
 
-from .utils.text_utils import prepare_text
+from functools import lru_cache
+from operator import itemgetter
+
+from .utils.alphabet import LATIN, get_alphabet
+
+
+@lru_cache(maxsize=4096)
+def _gather(length: int, rails: int, inverse: bool) -> itemgetter:
+    """
+    Şifrelemenin (inverse=True ise çözmenin) konum permütasyonunu uygulayan
+    toplama fonksiyonu; length en az 2 olmalı (tek elemanlı itemgetter tuple döndürmez).
+    """
+    positions = RailFenceCipher().positions(length, rails)
+    if inverse:
+        order = [0] * length
+        for j, p in enumerate(positions):
+            order[p] = j
+        positions = order
+    return itemgetter(*positions)
 
 
 class RailFenceCipher:
@@ -24,15 +53,74 @@ class RailFenceCipher:
     Metni zigzag şeklinde yazarak şifreler.
     """
     
+    # Şifreleme dolgu harfi eklemez
+    padding = False
+    
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.alphabet = get_alphabet(alphabet)
+    
+    def _rail_slices(self, length: int, rails: int) -> list:
+        """
+        Her satırın konumlarını veren adımlı dilimler.
+        
+        Args:
+            length: Metin uzunluğu
+            rails: Ray sayısı
+        
+        Returns:
+            Satır başına (dilim, ikinci dilim veya None) listesi; orta
+            satırlarda iki dilimin elemanları sırayla iç içe geçer
+        """
+        cycle = 2 * (rails - 1)
+        slices = [(slice(0, length, cycle), None)]
+        for row in range(1, rails - 1):
+            slices.append((slice(row, length, cycle), slice(cycle - row, length, cycle)))
+        slices.append((slice(rails - 1, length, cycle), None))
+        return slices
+    
+    def output_length(self, length: int, rails: int) -> int:
+        """Şifreli metnin uzunluğu (bkz. pipeline)"""
+        return length
+    
+    def positions(self, length: int, rails: int) -> list:
+        """
+        Şifrelemenin konum permütasyonu (bkz. pipeline).
+        
+        Args:
+            length: Metin uzunluğu
+            rails: Ray sayısı
+        
+        Returns:
+            Çıktının j. harfi girdinin positions[j]. harfidir
+        """
+        if rails < 2:
+            raise ValueError("Rails en az 2 olmalı")
+        
+        indices = range(length)
+        positions = []
+        for first, second in self._rail_slices(length, rails):
+            if second is None:
+                positions.extend(indices[first])
+                continue
+            down, up = indices[first], indices[second]
+            row = [0] * (len(down) + len(up))
+            row[0::2] = down
+            row[1::2] = up
+            positions.extend(row)
+        return positions
+    
     def encrypt(self, plaintext: str, rails: int) -> str:
         """
         Metni Rail Fence Cipher ile şifreler.
         
         Adımlar:
-        1. Metni hazırla
-        2. N satırlı zigzag matrisi oluştur
-        3. Metni zigzag şeklinde yerleştir
-        4. Her satırı sırayla oku
+        1. Metni indeks tamponuna çevir
+        2. Her satırın konumlarını adımlı dilimlerle al
+        3. Satırları sırayla birleştir
         
         Args:
             plaintext: Şifrelenecek metin
@@ -44,48 +132,30 @@ class RailFenceCipher:
         if rails < 2:
             raise ValueError("Rails en az 2 olmalı")
         
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
-        if len(text) == 0:
-            return ""
-        
-        # Zigzag matrisi oluştur (her satır bir liste)
-        matrix = [[] for _ in range(rails)]
-        
-        # Zigzag yerleştirme
-        row = 0
-        direction = 1  # 1: aşağı, -1: yukarı
-        
-        for char in text:
-            # Karakteri mevcut satıra ekle
-            matrix[row].append(char)
-            
-            # Bir sonraki satırı belirle
-            row += direction
-            
-            # Yön değiştir (üst veya alt sınıra ulaşıldığında)
-            if row == 0:
-                direction = 1
-            elif row == rails - 1:
-                direction = -1
-        
-        # Her satırı sırayla oku
-        ciphertext = []
-        for row_list in matrix:
-            ciphertext.extend(row_list)
-        
-        return ''.join(ciphertext)
+        buffer = self.alphabet.encode(plaintext)
+        
+        ciphertext = bytearray()
+        for first, second in self._rail_slices(len(buffer), rails):
+            if second is None:
+                ciphertext += buffer[first]
+                continue
+            # İki dilimi iç içe geçir (ilk dilim en fazla bir eleman uzun)
+            down, up = buffer[first], buffer[second]
+            row = bytearray(len(down) + len(up))
+            row[0::2] = down
+            row[1::2] = up
+            ciphertext += row
+        
+        return self.alphabet.decode(ciphertext)
     
     def decrypt(self, ciphertext: str, rails: int) -> str:
         """
         Şifreli metni Rail Fence Cipher ile çözer.
         
         Adımlar:
-        1. Metni hazırla
-        2. Zigzag pattern'i hesapla (hangi pozisyonlar hangi satırda)
-        3. Şifreli metni zigzag şeklinde yerleştir
-        4. Zigzag şeklinde oku
+        1. Metni indeks tamponuna çevir
+        2. Her satırın uzunluğunu dilimlerden hesapla
+        3. Şifreli metnin satır parçalarını konumlarına geri ata
         
         Args:
             ciphertext: Şifreli metin
@@ -97,52 +167,45 @@ class RailFenceCipher:
         if rails < 2:
             raise ValueError("Rails en az 2 olmalı")
         
-        # Metni hazırla
-        text = prepare_text(ciphertext, remove_spaces=True)
-        
-        if len(text) == 0:
-            return ""
-        
-        # Zigzag pattern'i oluştur (her pozisyonun hangi satırda olduğunu göster)
-        pattern = []
-        row = 0
-        direction = 1
-        
-        for _ in range(len(text)):
-            pattern.append(row)
-            row += direction
-            if row == 0:
-                direction = 1
-            elif row == rails - 1:
-                direction = -1
-        
-        # Her satırda kaç karakter olduğunu say
-        row_counts = [0] * rails
-        for row_num in pattern:
-            row_counts[row_num] += 1
-        
-        # Şifreli metni satırlara böl
-        matrix = [[] for _ in range(rails)]
-        text_index = 0
-        
-        for row_num in range(rails):
-            # Bu satıra ait karakterleri al
-            count = row_counts[row_num]
-            matrix[row_num] = list(text[text_index:text_index + count])
-            text_index += count
-        
-        # Zigzag şeklinde oku
-        plaintext = []
-        row_indices = [0] * rails  # Her satırda okuma indeksi
-        
-        for pos in range(len(text)):
-            # Bu pozisyondaki satırı bul
-            target_row = pattern[pos]
-            
-            # Bu satırdan karakteri al
-            char = matrix[target_row][row_indices[target_row]]
-            plaintext.append(char)
-            row_indices[target_row] += 1
-        
-        return ''.join(plaintext)
-
+        buffer = self.alphabet.encode(ciphertext)
+        length = len(buffer)
+        
+        plaintext = bytearray(length)
+        offset = 0
+        for first, second in self._rail_slices(length, rails):
+            down = len(range(length)[first])
+            up = len(range(length)[second]) if second is not None else 0
+            row = buffer[offset:offset + down + up]
+            offset += down + up
+            if second is None:
+                plaintext[first] = row
+            else:
+                plaintext[first] = row[0::2]
+                plaintext[second] = row[1::2]
+        
+        return self.alphabet.decode(plaintext)
+    
+    def _apply_scalar(self, text: str, rails: int, inverse: bool) -> str:
+        """encrypt/decrypt'in önbellekli konum permütasyonuyla yapılanı (kısa metinler için)"""
+        if rails < 2:
+            raise ValueError("Rails en az 2 olmalı")
+        
+        buffer = self.alphabet.encode(text)
+        if len(buffer) < 2:
+            return self.alphabet.decode(buffer)
+        return self.alphabet.decode(bytes(_gather(len(buffer), rails, inverse)(buffer)))
+    
+    def path_width(self, rails: int) -> int:
+        """
+        Tampon yolunun sabit maliyetinin ölçüsü: ray sayısı (satır başına dilim).
+        Yol seçim eşikleri (harf sayısı) bununla çarpılır.
+        """
+        return rails
+    
+    def encrypt_scalar(self, plaintext: str, rails: int) -> str:
+        """encrypt ile aynı sonuç; tek toplama (kısa metinlerde daha hızlı)"""
+        return self._apply_scalar(plaintext, rails, False)
+    
+    def decrypt_scalar(self, ciphertext: str, rails: int) -> str:
+        """decrypt ile aynı sonuç; tek toplama (kısa metinlerde daha hızlı)"""
+        return self._apply_scalar(ciphertext, rails, True)
@@ -13,304 +13,161 @@ O W O R
 L D X X
 
 Spiral (saat yönü): H E L L R O W O L D X X
+
+Uygulama: her (satır, sütun, yol) için okuma sırası, yani matris hücrelerinin
+okunma sırasındaki düz indeksleri bir kez hesaplanır (lru_cache). Şifreleme
+indeks tamponundan bu sırayla tek bir toplama (gather), çözme ise ters
+permütasyonla toplamadır; matris kurulmaz.
 """
 
-from .utils.text_utils import prepare_text, pad_text
+from functools import lru_cache
+from operator import itemgetter
 
+from .utils.alphabet import LATIN, get_alphabet
 
-class RouteCipher:
-    """
-    Route Cipher implementasyonu.
-    Matris tabanlı şifreleme, farklı okuma yolları destekler.
-    """
+
+def _spiral_clockwise(rows: int, cols: int) -> list:
+    """Saat yönünde spiral: sağa, aşağı, sola, yukarı; sonra iç çerçeve"""
+    positions = []
+    top, bottom = 0, rows - 1
+    left, right = 0, cols - 1
     
-    def __init__(self):
-        self.reading_modes = {
-            'spiral_cw': self._read_spiral_clockwise,
-            'spiral_ccw': self._read_spiral_counterclockwise,
-            'column_down': self._read_column_down,
-            'column_up': self._read_column_up,
-            'row_right': self._read_row_right,
-            'row_left': self._read_row_left,
-        }
+    while top <= bottom and left <= right:
+        # Sağa git (üst satır)
+        positions.extend(top * cols + j for j in range(left, right + 1))
+        top += 1
+        # Aşağı git (sağ sütun)
+        positions.extend(i * cols + right for i in range(top, bottom + 1))
+        right -= 1
+        # Sola git (alt satır) - eğer hala satır varsa
+        if top <= bottom:
+            positions.extend(bottom * cols + j for j in range(right, left - 1, -1))
+            bottom -= 1
+        # Yukarı git (sol sütun) - eğer hala sütun varsa
+        if left <= right:
+            positions.extend(i * cols + left for i in range(bottom, top - 1, -1))
+            left += 1
     
-    def _create_matrix(self, text: str, rows: int, cols: int) -> list:
-        """
-        Metni matrise yerleştirir (soldan sağa, yukarıdan aşağıya).
-        
-        Args:
-            text: Metin
-            rows: Satır sayısı
-            cols: Sütun sayısı
-        
-        Returns:
-            Matris
-        """
-        # Metni uzunluğa kadar doldur
-        padded_text = pad_text(text, rows * cols, 'X')
-        
-        matrix = []
-        text_index = 0
-        
-        for i in range(rows):
-            row = []
-            for j in range(cols):
-                row.append(padded_text[text_index])
-                text_index += 1
-            matrix.append(row)
-        
-        return matrix
+    return positions
+
+
+def _spiral_counterclockwise(rows: int, cols: int) -> list:
+    """Saat yönünün tersine spiral: aşağı, sağa, yukarı, sola; sonra iç çerçeve"""
+    positions = []
+    top, bottom = 0, rows - 1
+    left, right = 0, cols - 1
     
-    def _read_spiral_clockwise(self, matrix: list) -> str:
-        """
-        Matrisi saat yönünde spiral olarak okur.
-        
-        Algoritma:
-        1. Dış çerçeveden başla
-        2. Sağa, aşağı, sola, yukarı git
-        3. İç çerçeveye geç, tekrarla
-        
-        Args:
-            matrix: Matris
-        
-        Returns:
-            Okunan metin
-        """
-        if not matrix or not matrix[0]:
-            return ""
-        
-        rows = len(matrix)
-        cols = len(matrix[0])
-        result = []
-        
-        top, bottom = 0, rows - 1
-        left, right = 0, cols - 1
-        
-        while top <= bottom and left <= right:
-            # Sağa git (üst satır)
-            for j in range(left, right + 1):
-                result.append(matrix[top][j])
-            top += 1
-            
-            # Aşağı git (sağ sütun)
-            for i in range(top, bottom + 1):
-                result.append(matrix[i][right])
+    while top <= bottom and left <= right:
+        # Aşağı git (sol sütun)
+        positions.extend(i * cols + left for i in range(top, bottom + 1))
+        left += 1
+        # Sağa git (alt satır)
+        positions.extend(bottom * cols + j for j in range(left, right + 1))
+        bottom -= 1
+        # Yukarı git (sağ sütun) - eğer hala sütun varsa
+        if left <= right:
+            positions.extend(i * cols + right for i in range(bottom, top - 1, -1))
             right -= 1
-            
-            # Sola git (alt satır) - eğer hala satır varsa
-            if top <= bottom:
-                for j in range(right, left - 1, -1):
-                    result.append(matrix[bottom][j])
-                bottom -= 1
-            
-            # Yukarı git (sol sütun) - eğer hala sütun varsa
-            if left <= right:
-                for i in range(bottom, top - 1, -1):
-                    result.append(matrix[i][left])
-                left += 1
-        
-        return ''.join(result)
+        # Sola git (üst satır) - eğer hala satır varsa
+        if top <= bottom:
+            positions.extend(top * cols + j for j in range(right, left - 1, -1))
+            top += 1
     
-    def _read_spiral_counterclockwise(self, matrix: list) -> str:
-        """
-        Matrisi saat yönünün tersine spiral olarak okur.
-        
-        Args:
-            matrix: Matris
-        
-        Returns:
-            Okunan metin
-        """
-        if not matrix or not matrix[0]:
-            return ""
-        
-        rows = len(matrix)
-        cols = len(matrix[0])
-        result = []
-        
-        top, bottom = 0, rows - 1
-        left, right = 0, cols - 1
-        
-        while top <= bottom and left <= right:
-            # Aşağı git (sol sütun)
-            for i in range(top, bottom + 1):
-                result.append(matrix[i][left])
-            left += 1
-            
-            # Sağa git (alt satır)
-            for j in range(left, right + 1):
-                result.append(matrix[bottom][j])
-            bottom -= 1
-            
-            # Yukarı git (sağ sütun) - eğer hala sütun varsa
-            if left <= right:
-                for i in range(bottom, top - 1, -1):
-                    result.append(matrix[i][right])
-                right -= 1
-            
-            # Sola git (üst satır) - eğer hala satır varsa
-            if top <= bottom:
-                for j in range(right, left - 1, -1):
-                    result.append(matrix[top][j])
-                top += 1
-        
-        return ''.join(result)
+    return positions
+
+
+def _column_down(rows: int, cols: int) -> list:
+    """Sütun sütun, yukarıdan aşağıya"""
+    return [i * cols + j for j in range(cols) for i in range(rows)]
+
+
+def _column_up(rows: int, cols: int) -> list:
+    """Sütun sütun, aşağıdan yukarıya"""
+    return [i * cols + j for j in range(cols) for i in range(rows - 1, -1, -1)]
+
+
+def _row_right(rows: int, cols: int) -> list:
+    """Satır satır, soldan sağa (normal okuma)"""
+    return list(range(rows * cols))
+
+
+def _row_left(rows: int, cols: int) -> list:
+    """Satır satır, sağdan sola"""
+    return [i * cols + j for i in range(rows) for j in range(cols - 1, -1, -1)]
+
+
+READING_MODES = {
+    'spiral_cw': _spiral_clockwise,
+    'spiral_ccw': _spiral_counterclockwise,
+    'column_down': _column_down,
+    'column_up': _column_up,
+    'row_right': _row_right,
+    'row_left': _row_left,
+}
+
+
+@lru_cache(maxsize=64)
+def _reading_order(rows: int, cols: int, route: str) -> tuple:
+    """
+    Okuma sırası ve tersi.
     
-    def _read_column_down(self, matrix: list) -> str:
-        """
-        Matrisi sütun sütun, yukarıdan aşağıya okur.
-        
-        Args:
-            matrix: Matris
-        
-        Returns:
-            Okunan metin
-        """
-        if not matrix or not matrix[0]:
-            return ""
-        
-        rows = len(matrix)
-        cols = len(matrix[0])
-        result = []
-        
-        for j in range(cols):
-            for i in range(rows):
-                result.append(matrix[i][j])
-        
-        return ''.join(result)
+    Returns:
+        (order, inverse): order[i] i. okunan hücrenin düz indeksi,
+        inverse[hücre] o hücrenin okunma sırası
+    """
+    order = READING_MODES[route](rows, cols)
+    inverse = [0] * len(order)
+    for i, cell in enumerate(order):
+        inverse[cell] = i
+    return tuple(order), tuple(inverse)
+
+
+def _gather(buffer, positions) -> bytes:
+    """buffer[positions[0]], buffer[positions[1]], ... (tek C çağrısı)"""
+    if len(positions) < 2:
+        return bytes(buffer[p] for p in positions)
+    return bytes(itemgetter(*positions)(buffer))
+
+
+class RouteCipher:
+    """
+    Route Cipher implementasyonu.
+    Matris tabanlı şifreleme, farklı okuma yolları destekler.
+    """
     
-    def _read_column_up(self, matrix: list) -> str:
-        """
-        Matrisi sütun sütun, aşağıdan yukarıya okur.
-        
-        Args:
-            matrix: Matris
-        
-        Returns:
-            Okunan metin
-        """
-        if not matrix or not matrix[0]:
-            return ""
-        
-        rows = len(matrix)
-        cols = len(matrix[0])
-        result = []
-        
-        for j in range(cols):
-            for i in range(rows - 1, -1, -1):
-                result.append(matrix[i][j])
-        
-        return ''.join(result)
+    # Şifreleme dolgu harfi ekler, çözme sondaki dolguyu siler
+    padding = True
     
-    def _read_row_right(self, matrix: list) -> str:
+    def __init__(self, alphabet=LATIN):
         """
-        Matrisi satır satır, soldan sağa okur (normal okuma).
-        
         Args:
-            matrix: Matris
-        
-        Returns:
-            Okunan metin
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
         """
-        if not matrix:
-            return ""
-        
-        result = []
-        for row in matrix:
-            result.extend(row)
-        
-        return ''.join(result)
+        self.alphabet = get_alphabet(alphabet)
+        self.reading_modes = READING_MODES
     
-    def _read_row_left(self, matrix: list) -> str:
-        """
-        Matrisi satır satır, sağdan sola okur.
-        
-        Args:
-            matrix: Matris
-        
-        Returns:
-            Okunan metin
-        """
-        if not matrix:
-            return ""
-        
-        result = []
-        for row in matrix:
-            result.extend(reversed(row))
-        
-        return ''.join(result)
+    def output_length(self, length: int, rows: int, cols: int, route: str = 'spiral_cw') -> int:
+        """Şifreli metnin uzunluğu: her zaman matris boyutu (bkz. pipeline)"""
+        return rows * cols if rows > 0 and cols > 0 else 0
     
-    def _write_matrix(self, text: str, rows: int, cols: int, reading_func) -> list:
+    def positions(self, length: int, rows: int, cols: int, route: str = 'spiral_cw') -> list:
         """
-        Şifreli metni belirtilen okuma yoluna göre matrise yerleştirir.
-        
-        Algoritma:
-        1. Okuma yolunun tersini hesapla
-        2. Şifreli metni bu yola göre matrise yerleştir
-        3. Normal okuma ile çözülmüş metni al
+        Şifrelemenin konum permütasyonu (bkz. pipeline).
         
         Args:
-            text: Şifreli metin
-            rows: Satır sayısı
-            cols: Sütun sayısı
-            reading_func: Okuma fonksiyonu
+            length: Metin uzunluğu
+            rows, cols, route: encrypt ile aynı
         
         Returns:
-            Matris
+            Çıktının j. harfi girdinin positions[j]. harfidir; length değeri
+            dolgu harfi (X) demektir (matristen taşan harfler atılır)
         """
-        # Önce normal matris oluştur
-        temp_matrix = self._create_matrix('A' * (rows * cols), rows, cols)
-        
-        # Okuma sırasını belirle
-        read_order = []
-        for i in range(rows):
-            for j in range(cols):
-                read_order.append((i, j))
-        
-        # Okuma fonksiyonunu kullanarak sırayı belirle
-        # (Bu basitleştirilmiş bir yaklaşım, gerçekte okuma fonksiyonunun tersi hesaplanmalı)
-        # Spiral için özel işlem gerekir, bu yüzden basit yaklaşım kullanıyoruz
-        
-        # Şifreli metni matrise yerleştir (okuma sırasına göre)
-        matrix = [[''] * cols for _ in range(rows)]
-        text_index = 0
-        
-        # Okuma sırasını simüle et
-        # Spiral için özel işlem
-        if reading_func == self._read_spiral_clockwise:
-            # Spiral okuma sırasını hesapla
-            top, bottom = 0, rows - 1
-            left, right = 0, cols - 1
-            positions = []
-            
-            while top <= bottom and left <= right:
-                for j in range(left, right + 1):
-                    positions.append((top, j))
-                top += 1
-                for i in range(top, bottom + 1):
-                    positions.append((i, right))
-                right -= 1
-                if top <= bottom:
-                    for j in range(right, left - 1, -1):
-                        positions.append((bottom, j))
-                    bottom -= 1
-                if left <= right:
-                    for i in range(bottom, top - 1, -1):
-                        positions.append((i, left))
-                    left += 1
-            
-            for i, j in positions:
-                if text_index < len(text):
-                    matrix[i][j] = text[text_index]
-                    text_index += 1
-        else:
-            # Diğer okuma modları için basit yerleştirme
-            for i, j in read_order:
-                if text_index < len(text):
-                    matrix[i][j] = text[text_index]
-                    text_index += 1
-        
-        return matrix
+        if route not in self.reading_modes:
+            raise ValueError(f"Geçersiz route: {route}. Geçerli: {list(self.reading_modes.keys())}")
+        if rows <= 0 or cols <= 0:
+            return []
+        order, _ = _reading_order(rows, cols, route)
+        return [min(cell, length) for cell in order]
     
     def encrypt(self, plaintext: str, rows: int, cols: int, route: str = 'spiral_cw') -> str:
         """
@@ -328,17 +185,17 @@ class RouteCipher:
         if route not in self.reading_modes:
             raise ValueError(f"Geçersiz route: {route}. Geçerli: {list(self.reading_modes.keys())}")
         
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
+        if rows <= 0 or cols <= 0:
+            return ""
         
-        # Matrisi oluştur
-        matrix = self._create_matrix(text, rows, cols)
+        # Metni indeks tamponuna çevir, matris boyutuna kadar X ile doldur (fazlası atılır)
+        size = rows * cols
+        buffer = self.alphabet.encode(plaintext)[:size]
+        buffer += bytes([self.alphabet.pad_index]) * (size - len(buffer))
         
         # Belirtilen yoldan oku
-        reading_func = self.reading_modes[route]
-        ciphertext = reading_func(matrix)
-        
-        return ciphertext
+        order, _ = _reading_order(rows, cols, route)
+        return self.alphabet.decode(_gather(buffer, order))
     
     def decrypt(self, ciphertext: str, rows: int, cols: int, route: str = 'spiral_cw') -> str:
         """
@@ -356,20 +213,18 @@ class RouteCipher:
         if route not in self.reading_modes:
             raise ValueError(f"Geçersiz route: {route}")
         
-        # Metni hazırla
-        text = prepare_text(ciphertext, remove_spaces=True)
-        
-        # Okuma fonksiyonunu al
-        reading_func = self.reading_modes[route]
+        if rows <= 0 or cols <= 0:
+            return ""
         
-        # Şifreli metni matrise yerleştir (okuma yolunun tersi)
-        matrix = self._write_matrix(text, rows, cols, reading_func)
+        # Metni indeks tamponuna çevir
+        buffer = self.alphabet.encode(ciphertext)[:rows * cols]
         
-        # Normal okuma ile çöz (soldan sağa, yukarıdan aşağıya)
-        plaintext = self._read_row_right(matrix)
+        # Her hücre, okuma sırasındaki yerinden alınır (soldan sağa, yukarıdan aşağıya);
+        # şifreli metin kısaysa boş kalan hücreler atlanır
+        _, inverse = _reading_order(rows, cols, route)
+        if len(buffer) < len(inverse):
+            inverse = [i for i in inverse if i < len(buffer)]
+        plaintext = self.alphabet.decode(_gather(buffer, inverse))
         
         # Padding X'leri kaldır (son kısımdan)
-        plaintext = plaintext.rstrip('X')
-        
-        return plaintext
-
+        return plaintext.rstrip(self.alphabet.pad)
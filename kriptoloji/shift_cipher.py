@@ -8,13 +8,19 @@ Algoritma:
 3. Mod 26 al (alfabede döngü)
 4. Yeni indeksi karaktere çevir
 
+Alfabe değiştirilebilir (bkz. utils.alphabet); modül alfabenin harf
+sayısıdır (Latin 26, Türkçe 29).
+
 Örnek (key=3):
 A (0) -> 0+3 = 3 -> D
 B (1) -> 1+3 = 4 -> E
 Z (25) -> 25+3 = 28 -> 28%26 = 2 -> C
+
+Metin bir kez indeks tamponuna çevrilir; kaydırma ve harfe dönüş tek bir
+translate çağrısıdır (bkz. Alphabet.shift_letter_table).
 """
 
-from .utils.text_utils import char_to_index, index_to_char, prepare_text
+from .utils.alphabet import LATIN, get_alphabet
 
 
 class ShiftCipher:
@@ -23,6 +29,26 @@ class ShiftCipher:
     Her karakteri alfabede key kadar kaydırır.
     """
     
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.alphabet = get_alphabet(alphabet)
+    
+    def letter_maps(self, key: int) -> tuple:
+        """
+        Şifrelemenin harf eşlemesi (bkz. pipeline).
+        
+        Args:
+            key: Kaydırma miktarı
+        
+        Returns:
+            Tek elemanlı tuple: i -> (i + key) mod n permütasyonu
+        """
+        size = self.alphabet.size
+        return (tuple((i + key) % size for i in range(size)),)
+    
     def encrypt(self, plaintext: str, key: int) -> str:
         """
         Metni şifreler.
@@ -34,28 +60,16 @@ class ShiftCipher:
         
         Args:
             plaintext: Şifrelenecek metin
-            key: Kaydırma miktarı (0-25 arası, negatif olabilir)
+            key: Kaydırma miktarı (negatif olabilir, mod alfabe boyutu)
         
         Returns:
             Şifreli metin
         """
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
-        # Key'i mod 26'ya normalize et
-        key = key % 26
-        
-        # Her karakteri kaydır
-        ciphertext = []
-        for char in text:
-            # Karakteri indekse çevir
-            index = char_to_index(char)
-            # Key ekle ve mod 26 al
-            new_index = (index + key) % 26
-            # Yeni karakteri al
-            ciphertext.append(index_to_char(new_index))
+        # Metni indeks tamponuna çevir
+        indices = self.alphabet.encode(plaintext)
         
-        return ''.join(ciphertext)
+        # Her indeksi key kadar kaydırıp harfe çevir (mod n tabloda)
+        return self.alphabet.decode(indices, self.alphabet.shift_letter_table(key))
     
     def decrypt(self, ciphertext: str, key: int) -> str:
         """
@@ -3,7 +3,7 @@ Substitution Cipher (Yerine Koyma Şifresi)
 Her karakteri başka bir karakterle değiştirir.
 
 Algoritma:
-1. Key olarak bir permütasyon tablosu kullanılır (26 harf için)
+1. Key olarak bir permütasyon tablosu kullanılır (alfabenin her harfi için, Latin'de 26)
 2. Her karakteri key tablosundaki karşılığıyla değiştir
 3. Decrypt için ters tablo kullanılır
 
@@ -12,39 +12,59 @@ A -> Z, B -> Y, C -> X, ..., Z -> A (ters alfabe)
 
 Örnek key (rastgele):
 A -> M, B -> N, C -> B, D -> V, ..., Z -> Q
+
+Key bir translate tablosuna çevrilir; metnin tamamı tek translate çağrısıyla
+hem değiştirilir hem harfe döner.
 """
 
-from .utils.text_utils import char_to_index, index_to_char, prepare_text
+from functools import lru_cache
+
+from .utils.alphabet import LATIN, get_alphabet
+
+
+@lru_cache(maxsize=256)
+def _tables(alphabet, key: str) -> tuple:
+    """Doğrulanmış key için (şifreleme, çözme) translate tabloları"""
+    mapping = [alphabet.letters.index(char) for char in key]
+    inverse = [0] * alphabet.size
+    for i, target in enumerate(mapping):
+        inverse[target] = i
+    return alphabet.letter_table(mapping), alphabet.letter_table(inverse)
 
 
 class SubstitutionCipher:
     """
     Substitution Cipher implementasyonu.
-    Key olarak 26 karakterlik bir permütasyon string'i kullanır.
+    Key olarak alfabenin permütasyonu olan bir string kullanır.
     """
     
-    def __init__(self):
-        self.alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    def __init__(self, alphabet=LATIN):
+        """
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.alphabet = get_alphabet(alphabet)
     
     def _validate_key(self, key: str) -> str:
         """
         Key'i doğrular ve normalize eder.
         
         Args:
-            key: 26 karakterlik permütasyon string'i
+            key: Alfabe uzunluğunda permütasyon string'i
         
         Returns:
             Normalize edilmiş key
         """
-        # Büyük harfe çevir ve sadece alfabetik karakterleri al
-        key = ''.join(c for c in key.upper() if c.isalpha())
+        # Büyük harfe çevir ve sadece alfabe harflerini al
+        key = self.alphabet.normalize(key)
+        size = self.alphabet.size
         
         # Key uzunluğu kontrolü
-        if len(key) < 26:
-            raise ValueError("Key en az 26 karakter olmalı")
+        if len(key) < size:
+            raise ValueError(f"Key en az {size} karakter olmalı")
         
-        # İlk 26 karakteri al
-        key = key[:26]
+        # İlk n karakteri al
+        key = key[:size]
         
         # Her harfin key'de bir kez geçtiğini kontrol et
         seen = set()
@@ -55,27 +75,18 @@ class SubstitutionCipher:
         
         return key
     
-    def _create_decrypt_key(self, encrypt_key: str) -> str:
+    def letter_maps(self, key: str) -> tuple:
         """
-        Şifreleme key'inden çözme key'ini oluşturur.
-        
-        Algoritma:
-        - Encrypt key: A -> key[0], B -> key[1], ...
-        - Decrypt key: key[0] -> A, key[1] -> B, ...
+        Şifrelemenin harf eşlemesi (bkz. pipeline).
         
         Args:
-            encrypt_key: Şifreleme key'i
+            key: Alfabe uzunluğunda permütasyon string'i
         
         Returns:
-            Çözme key'i
+            Tek elemanlı tuple: i -> key'in i. harfinin indeksi
         """
-        decrypt_key = [''] * 26
-        for i, char in enumerate(encrypt_key):
-            # key[i] karakteri, orijinal alfabedeki i. karaktere karşılık gelir
-            original_index = char_to_index(char)
-            decrypt_key[original_index] = index_to_char(i)
-        
-        return ''.join(decrypt_key)
+        key = self._validate_key(key)
+        return (tuple(self.alphabet.letters.index(char) for char in key),)
     
     def encrypt(self, plaintext: str, key: str) -> str:
         """
@@ -87,7 +98,7 @@ class SubstitutionCipher:
         
         Args:
             plaintext: Şifrelenecek metin
-            key: 26 karakterlik permütasyon string'i (A-Z için mapping)
+            key: Alfabe uzunluğunda permütasyon string'i (Latin'de A-Z için mapping)
         
         Returns:
             Şifreli metin
@@ -95,18 +106,9 @@ class SubstitutionCipher:
         # Key'i doğrula
         key = self._validate_key(key)
         
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
-        # Her karakteri key'e göre değiştir
-        ciphertext = []
-        for char in text:
-            # Karakterin alfabedeki indeksini bul
-            index = char_to_index(char)
-            # Key'deki karşılığını al
-            ciphertext.append(key[index])
-        
-        return ''.join(ciphertext)
+        # Metni indeks tamponuna çevir, tabloyla değiştir
+        encrypt_table, _ = _tables(self.alphabet, key)
+        return self.alphabet.decode(self.alphabet.encode(plaintext), encrypt_table)
     
     def decrypt(self, ciphertext: str, key: str) -> str:
         """
@@ -114,8 +116,8 @@ class SubstitutionCipher:
         
         Adımlar:
         1. Key'i doğrula
-        2. Decrypt key'ini oluştur
-        3. Her karakteri decrypt key'e göre değiştir
+        2. Decrypt tablosunu oluştur (key[i] -> i. harf)
+        3. Her karakteri decrypt tablosuna göre değiştir
         
         Args:
             ciphertext: Şifreli metin
@@ -127,19 +129,6 @@ class SubstitutionCipher:
         # Key'i doğrula
         key = self._validate_key(key)
         
-        # Decrypt key'ini oluştur
-        decrypt_key = self._create_decrypt_key(key)
-        
-        # Metni hazırla
-        text = prepare_text(ciphertext, remove_spaces=True)
-        
-        # Her karakteri decrypt key'e göre değiştir
-        plaintext = []
-        for char in text:
-            # Karakterin alfabedeki indeksini bul
-            index = char_to_index(char)
-            # Decrypt key'deki karşılığını al
-            plaintext.append(decrypt_key[index])
-        
-        return ''.join(plaintext)
-
+        # Ters tabloyla (key[i] -> i. harf) değiştir
+        _, decrypt_table = _tables(self.alphabet, key)
+        return self.alphabet.decode(self.alphabet.encode(ciphertext), decrypt_table)
@@ -1,14 +1,26 @@
 """
 Kriptoloji Yardımcı Modülleri
-Matris ve metin işleme fonksiyonları.
+Matris ve metin işleme fonksiyonları, alfabeler.
 """
 
+from .alphabet import (
+    Alphabet,
+    LATIN,
+    TURKISH,
+    ALPHABETS,
+    get_alphabet
+)
+
 from .matrix_utils import (
     create_matrix,
     matrix_multiply,
     matrix_determinant,
     matrix_inverse,
     mod_inverse,
+    prime_factors,
+    crt_combine,
+    solve_mod_prime,
+    solve_mod,
     text_to_matrix,
     matrix_to_text
 )
@@ -23,11 +35,20 @@ from .text_utils import (
 )
 
 __all__ = [
+    'Alphabet',
+    'LATIN',
+    'TURKISH',
+    'ALPHABETS',
+    'get_alphabet',
     'create_matrix',
     'matrix_multiply',
     'matrix_determinant',
     'matrix_inverse',
     'mod_inverse',
+    'prime_factors',
+    'crt_combine',
+    'solve_mod_prime',
+    'solve_mod',
     'text_to_matrix',
     'matrix_to_text',
     'prepare_text',
@@ -0,0 +1,259 @@
+"""
+Alfabe Soyutlaması
+Şifrelerin üzerinde çalıştığı harf kümesi.
+
+Bir Alphabet şunları taşır:
+- Harf -> indeks tablosu (büyük/küçük harf, katlanan harfler) ve
+  indeks -> harf tablosu
+- Modül: harf sayısı (Latin 26, Türkçe 29)
+- Dolgu harfi (Hill, Columnar, Route, Playfair)
+- Polybius/Playfair karesi: birleştirilen harfler (I/J) ve kare boyutu
+
+Her alfabe bir kez oluşturulur (LATIN, TURKISH) ve tabloları kurulurken
+hesaplanır. Metin tek bir translate çağrısıyla indeks tamponuna (her byte'ı
+0..n-1 arası bir harf indeksi olan bytearray) çevrilir; karakter başına
+isalpha()/ord çağrısı yapılmaz. ASCII metin için bytes.translate, diğer
+metinler için str.translate kullanılır.
+"""
+
+import unicodedata
+
+
+class _CharTable(dict):
+    """
+    str.translate tablosu: harf -> indeks karakteri, diğer karakterler silinir.
+
+    Tabloda olmayan bir karakter ilk görüldüğünde büyük harfe çevrilip NFKD
+    ile ayrıştırılır (é -> E + ´, ß -> SS); alfabedeki parçalarına eşlenir,
+    hiçbiri alfabede değilse silinir. Sonuç tabloya yazılır, yani her
+    karakter için bu işlem bir kez yapılır.
+    """
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        decomposed = unicodedata.normalize('NFKD', char.upper())
+        value = None
+        if decomposed != char:
+            value = ''.join(chr(i) for i in map(self.get, map(ord, decomposed)) if i is not None) or None
+        self[code] = value
+        return value
+
+
+class Alphabet:
+    """
+    Harf kümesi ve önceden hesaplanmış dönüşüm tabloları.
+    """
+
+    def __init__(self, name: str, letters: str, lowercase: str = None, pad: str = 'X',
+                 fold: dict = None, square_merge: dict = None, square_shape: tuple = None):
+        """
+        Args:
+            name: Alfabe adı (analiz modülündeki dil kodlarıyla aynı: 'en', 'tr')
+            letters: Büyük harfler, alfabe sırasıyla (en fazla 128)
+            lowercase: Aynı sırayla küçük harfler (varsayılan: letters.lower())
+            pad: Dolgu harfi
+            fold: Alfabe dışı karakter -> alfabe harfi eşlemesi (NFKD'nin
+                çözemediği durumlar için, örn. ı -> I)
+            square_merge: Karede birleşen harfler, harf -> hücresini paylaştığı harf
+            square_shape: Karenin (satır, sütun) boyutu; None ise kare tanımlı değil
+
+        Raises:
+            ValueError: Harfler tekrarlanıyorsa veya kare boyutu harf sayısına uymuyorsa
+        """
+        lowercase = letters.lower() if lowercase is None else lowercase
+        if len(set(letters)) != len(letters) or len(lowercase) != len(letters):
+            raise ValueError("Alfabe harfleri tekrarsız olmalı ve küçük harf karşılıkları eşleşmeli")
+        if not 2 <= len(letters) <= 128:
+            raise ValueError("Alfabe 2 ile 128 arası harf içermeli")
+
+        self.name = name
+        self.letters = letters
+        self.size = len(letters)
+        self.pad = pad
+        self.pad_index = letters.index(pad)
+        self.ascii = letters.isascii()
+
+        # Harf -> indeks (str.translate)
+        table = _CharTable()
+        for index, (upper, lower) in enumerate(zip(letters, lowercase)):
+            table[ord(upper)] = index
+            table[ord(lower)] = index
+        for char, letter in (fold or {}).items():
+            table[ord(char)] = letters.index(letter)
+        self._char_table = table
+
+        # ASCII metin için aynı tablo bytes.translate biçiminde
+        ascii_map = [table[b] for b in range(128)]
+        self._ascii_table = bytes(v if isinstance(v, int) else 0 for v in ascii_map) + bytes(128)
+        self._ascii_delete = bytes(b for b in range(256) if b >= 128 or not isinstance(ascii_map[b], int))
+
+        identity = range(self.size)
+        self._letter_table = self.letter_table(identity)
+        # Kaydırma tabloları: i -> (i + s) mod n (harf ve indeks çıktılı)
+        self._shift_letters = [self.letter_table(range(s, s + self.size)) for s in identity]
+        self._shift_indices = [self.index_table(range(s, s + self.size)) for s in identity]
+
+        # Kare: birleşen harfler hedef harfin indeksine katlanır
+        merge = square_merge or {}
+        self.square_letters = ''.join(char for char in letters if char not in merge)
+        self.square_table = self.index_table([letters.index(merge.get(char, char)) for char in letters])
+        if square_shape is not None:
+            rows, cols = square_shape
+            if rows * cols != len(self.square_letters) or max(rows, cols) > 9:
+                raise ValueError(f"{rows}x{cols} kare {len(self.square_letters)} harfe uymuyor")
+        self.square_shape = square_shape
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.name!r}, {self.letters!r})"
+
+    def encode(self, text: str) -> bytearray:
+        """
+        Metni harf indeksi tamponuna çevirir, alfabe dışı karakterleri atar.
+
+        Args:
+            text: Herhangi bir metin
+
+        Returns:
+            Her byte'ı 0..n-1 arası bir indeks olan bytearray
+        """
+        if text.isascii():
+            return bytearray(text.encode('ascii')).translate(self._ascii_table, self._ascii_delete)
+        return bytearray(text.translate(self._char_table).encode('latin-1'))
+
+    def decode(self, indices, table=None) -> str:
+        """
+        İndeks tamponunu harflere çevirir (API sınırı).
+
+        Args:
+            indices: 0..n-1 arası indekslerden oluşan bytes, bytearray veya memoryview
+            table: letter_table çıktısı; dönüşüm ve harfe çevirme tek geçişte
+                yapılır (varsayılan: dönüşümsüz)
+
+        Returns:
+            Büyük harfli metin
+        """
+        if table is None:
+            table = self._letter_table
+        if isinstance(indices, memoryview):
+            indices = indices.tobytes()
+        if self.ascii:
+            return indices.translate(table).decode('ascii')
+        return indices.decode('latin-1').translate(table)
+
+    def normalize(self, text: str) -> str:
+        """
+        Metni alfabenin büyük harflerine indirger (key'ler için).
+
+        Args:
+            text: Herhangi bir metin
+
+        Returns:
+            Sadece alfabe harflerinden oluşan metin
+        """
+        return self.decode(self.encode(text))
+
+    def letter_table(self, mapping) -> object:
+        """
+        İndeks -> harf tablosu (decode için).
+
+        Args:
+            mapping: En fazla n elemanlı dizi; i. indeks mapping[i] mod n. harfe gider
+
+        Returns:
+            ASCII alfabelerde 256 byte'lık bytes.translate tablosu, diğerlerinde
+            str.translate için harf tuple'ı
+        """
+        letters = [self.letters[m % self.size] for m in mapping]
+        if self.ascii:
+            return bytes(ord(letters[i]) if i < len(letters) else 0 for i in range(256))
+        return tuple(letters)
+
+    def index_table(self, mapping) -> bytes:
+        """
+        İndeks -> indeks translate tablosu (tampon üzerinde yerinde dönüşüm).
+
+        Args:
+            mapping: En fazla n elemanlı dizi; i. indeks mapping[i] mod n'e gider
+
+        Returns:
+            256 byte'lık tablo
+        """
+        return bytes(mapping[i] % self.size if i < len(mapping) else 0 for i in range(256))
+
+    def shift_letter_table(self, shift: int):
+        """i -> (i + shift) mod n. harf tablosu (letter_table biçiminde)"""
+        return self._shift_letters[shift % self.size]
+
+    def shift_index_table(self, shift: int) -> bytes:
+        """i -> (i + shift) mod n indeks tablosu"""
+        return self._shift_indices[shift % self.size]
+
+    def keyed_square(self, key: str = None) -> list:
+        """
+        Key'li Polybius/Playfair karesi.
+
+        Önce key'in harfleri (birleşen harfler katlanmış, tekrarsız), sonra
+        kalan kare harfleri alfabe sırasıyla yerleştirilir.
+
+        Args:
+            key: Key kelimesi (None veya boş: standart kare)
+
+        Returns:
+            Satır listesi (her satır bir str)
+
+        Raises:
+            ValueError: Alfabe için kare tanımlı değilse
+        """
+        if self.square_shape is None:
+            raise ValueError(f"{self.name} alfabesi için kare tanımlı değil")
+        rows, cols = self.square_shape
+        key_indices = self.encode(key or '').translate(self.square_table)
+        order = dict.fromkeys(self.decode(key_indices) + self.square_letters)
+        letters = ''.join(order)
+        return [letters[r * cols:(r + 1) * cols] for r in range(rows)]
+
+
+# İngilizce (A-Z). Türkçe harfler NFKD ile katlanır (Ç -> C), ı -> I.
+LATIN = Alphabet(
+    'en', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    pad='X',
+    fold={'ı': 'I'},
+    square_merge={'J': 'I'},
+    square_shape=(5, 5),
+)
+
+# Türkçe (29 harf, Q/W/X yok). i <-> İ, ı <-> I. Dolgu harfi en seyrek
+# harf olan J; kare Ğ'yi G ile birleştirip 4x7'dir.
+TURKISH = Alphabet(
+    'tr', 'ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ',
+    lowercase='abcçdefgğhıijklmnoöprsştuüvyz',
+    pad='J',
+    fold={'â': 'A', 'Â': 'A', 'î': 'İ', 'Î': 'İ', 'û': 'U', 'Û': 'U'},
+    square_merge={'Ğ': 'G'},
+    square_shape=(4, 7),
+)
+
+ALPHABETS = {
+    'en': LATIN,
+    'tr': TURKISH,
+}
+
+
+def get_alphabet(alphabet) -> Alphabet:
+    """
+    Alfabe nesnesi veya adından Alphabet.
+
+    Args:
+        alphabet: Alphabet veya ALPHABETS'teki bir ad ('en', 'tr')
+
+    Returns:
+        Alphabet
+
+    Raises:
+        ValueError: Bilinmeyen ad
+    """
+    if isinstance(alphabet, Alphabet):
+        return alphabet
+    if alphabet not in ALPHABETS:
+        raise ValueError(f"Bilinmeyen alfabe: {alphabet}. Geçerli: {list(ALPHABETS)}")
+    return ALPHABETS[alphabet]
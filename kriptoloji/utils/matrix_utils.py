@@ -95,31 +95,36 @@ def matrix_determinant(matrix):
         raise ValueError("Sadece 2x2 ve 3x3 matrisler destekleniyor")
 
 
-def matrix_inverse(matrix):
+def matrix_inverse(matrix, m: int = 26):
     """
-    Matrisin modüler tersini hesaplar (mod 26).
+    Matrisin modüler tersini hesaplar (varsayılan mod 26).
     
-    Algoritma:
+    Algoritma (2x2 ve 3x3):
     1. Determinantı hesapla
-    2. Determinantın mod 26'da tersini bul
+    2. Determinantın mod m'de tersini bul
     3. Adjoint matrisi hesapla
-    4. Adjoint * det_inverse (mod 26)
+    4. Adjoint * det_inverse (mod m)
+    
+    Daha büyük matrisler için A * X = I, m'nin asal çarpanlarına göre (26 için
+    mod 2 ve mod 13) Gauss eliminasyonuyla çözülüp Çin kalan teoremiyle
+    birleştirilir (bkz. solve_mod).
     
     Args:
-        matrix: Kare matris (2x2 veya 3x3)
+        matrix: Kare matris (NxN)
+        m: Modül (alfabe boyutu; Türkçe için 29)
     
     Returns:
-        Ters matris (mod 26)
+        Ters matris (mod m)
     """
     n = len(matrix)
     
     if n == 2:
         # 2x2 matris tersi
         det = matrix_determinant(matrix)
-        det_mod = mod_inverse(det, 26)
+        det_mod = mod_inverse(det, m)
         
         if det_mod is None:
-            raise ValueError("Matrisin modüler tersi yok (determinant mod 26'da tersinir değil)")
+            raise ValueError(f"Matrisin modüler tersi yok (determinant mod {m}'da tersinir değil)")
         
         # Adjoint matris (2x2 için)
         adjoint = [
@@ -127,20 +132,20 @@ def matrix_inverse(matrix):
             [-matrix[1][0], matrix[0][0]]
         ]
         
-        # Ters matris = adjoint * det_inverse (mod 26)
+        # Ters matris = adjoint * det_inverse (mod m)
         inverse = create_matrix(2, 2, 0)
         for i in range(2):
             for j in range(2):
-                inverse[i][j] = (adjoint[i][j] * det_mod) % 26
+                inverse[i][j] = (adjoint[i][j] * det_mod) % m
                 if inverse[i][j] < 0:
-                    inverse[i][j] += 26
+                    inverse[i][j] += m
         
         return inverse
     
     elif n == 3:
         # 3x3 matris tersi
         det = matrix_determinant(matrix)
-        det_mod = mod_inverse(det, 26)
+        det_mod = mod_inverse(det, m)
         
         if det_mod is None:
             raise ValueError("Matrisin modüler tersi yok")
@@ -167,18 +172,25 @@ def matrix_inverse(matrix):
         # Adjoint = cofactor'un transpozu
         adjoint = [[cofactor[j][i] for j in range(3)] for i in range(3)]
         
-        # Ters matris = adjoint * det_inverse (mod 26)
+        # Ters matris = adjoint * det_inverse (mod m)
         inverse = create_matrix(3, 3, 0)
         for i in range(3):
             for j in range(3):
-                inverse[i][j] = (adjoint[i][j] * det_mod) % 26
+                inverse[i][j] = (adjoint[i][j] * det_mod) % m
                 if inverse[i][j] < 0:
-                    inverse[i][j] += 26
+                    inverse[i][j] += m
         
         return inverse
     
     else:
-        raise ValueError("Sadece 2x2 ve 3x3 matrisler destekleniyor")
+        # Daha büyük matrisler: A * X = I denklemi Gauss eliminasyonuyla çözülür
+        if any(len(row) != n for row in matrix):
+            raise ValueError("Matris kare olmalı")
+        identity = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+        try:
+            return solve_mod(matrix, identity, m)
+        except ValueError:
+            raise ValueError("Matrisin modüler tersi yok")
 
 
 def mod_inverse(a: int, m: int):
@@ -260,3 +272,138 @@ def matrix_to_text(matrix):
     
     return ''.join(text)
 
+
+
+def prime_factors(m: int) -> list:
+    """
+    Karesiz (square-free) bir modülün asal çarpanları (26 -> [2, 13]).
+
+    Args:
+        m: Modül
+
+    Returns:
+        Asal çarpanlar listesi
+
+    Raises:
+        ValueError: Modül bir asalın karesine bölünüyorsa
+    """
+    primes = []
+    p = 2
+    while p * p <= m:
+        if m % p == 0:
+            m //= p
+            if m % p == 0:
+                raise ValueError("Modül karesiz olmalı (ör. 26 = 2 * 13)")
+            primes.append(p)
+        p += 1
+    if m > 1:
+        primes.append(m)
+    return primes
+
+
+def crt_combine(residues: list, moduli: list) -> int:
+    """
+    Çin kalan teoremi: x = r_i (mod m_i) denklemlerini birleştirir.
+
+    Args:
+        residues: Kalanlar
+        moduli: Aralarında asal modüller
+
+    Returns:
+        0 <= x < m_1 * m_2 * ... olan tek çözüm
+    """
+    x, m = 0, 1
+    for r, mi in zip(residues, moduli):
+        # x + m*t = r (mod mi) -> t = (r - x) * m^-1 (mod mi)
+        t = ((r - x) * mod_inverse(m, mi)) % mi
+        x += m * t
+        m *= mi
+    return x
+
+
+def solve_mod_prime(A, B, p: int):
+    """
+    A * X = B (mod p) denklemini Gauss eliminasyonuyla çözer (p asal).
+
+    A'nın satır sayısı sütun sayısından fazla olabilir (fazla denklem);
+    eleme sırasında pivot olarak sadece bağımsız satırlar seçilir, diğerleri
+    tutarlılık kontrolü için sıfıra indirgenir.
+
+    Algoritma:
+    1. [A | B] genişletilmiş matrisi oluştur (mod p)
+    2. Her sütun için sıfırdan farklı bir pivot satırı bul, pivotu 1 yap
+    3. Pivot sütununu diğer tüm satırlarda sıfırla
+    4. Pivotsuz sütun varsa çözüm tek değildir; sıfırlanmış satırın sağ tarafı
+       sıfır değilse denklem tutarsızdır
+
+    Args:
+        A: k x n katsayı matrisi (k >= n)
+        B: k x r sağ taraf matrisi
+        p: Asal modül
+
+    Returns:
+        n x r çözüm matrisi X
+
+    Raises:
+        ValueError: Çözüm tek değilse veya denklem tutarsızsa
+    """
+    rows = len(A)
+    n = len(A[0])
+    r = len(B[0])
+    augmented = [[value % p for value in A[i]] + [value % p for value in B[i]] for i in range(rows)]
+
+    pivot_row = 0
+    for col in range(n):
+        # Pivot: bu sütunda sıfırdan farklı ilk satır
+        pivot = next((i for i in range(pivot_row, rows) if augmented[i][col]), None)
+        if pivot is None:
+            raise ValueError(f"Matris mod {p}'de tersinir değil (bağımsız satır yetersiz)")
+        augmented[pivot_row], augmented[pivot] = augmented[pivot], augmented[pivot_row]
+
+        # Pivotu 1 yap
+        row = augmented[pivot_row]
+        inverse = pow(row[col], -1, p)
+        if inverse != 1:
+            row[:] = [(value * inverse) % p for value in row]
+
+        # Diğer satırlarda bu sütunu sıfırla
+        for i in range(rows):
+            factor = augmented[i][col]
+            if i != pivot_row and factor:
+                other = augmented[i]
+                other[:] = [(a - factor * b) % p for a, b in zip(other, row)]
+        pivot_row += 1
+
+    # Pivot olmayan satırlar 0 = 0 olmalı
+    for i in range(pivot_row, rows):
+        if any(augmented[i][n:]):
+            raise ValueError(f"Denklem sistemi mod {p}'de tutarsız")
+
+    return [augmented[i][n:n + r] for i in range(n)]
+
+
+def solve_mod(A, B, m: int = 26):
+    """
+    A * X = B (mod m) denklemini çözer; m karesiz olmalıdır (26 = 2 * 13).
+
+    Z/26 bir cisim olmadığı için (2 ve 13 tersinir değil) eliminasyon doğrudan
+    mod 26'da yapılamaz. Denklem her asal çarpan için ayrı çözülür ve sonuçlar
+    Çin kalan teoremiyle birleştirilir. Her asalda farklı satırlar pivot
+    olabilir; mod 26'da tek başına tersinir bir satır grubu gerekmez.
+
+    Args:
+        A: k x n katsayı matrisi (k >= n)
+        B: k x r sağ taraf matrisi
+        m: Modül (varsayılan: 26)
+
+    Returns:
+        n x r çözüm matrisi X (elemanlar 0..m-1)
+
+    Raises:
+        ValueError: Çözüm tek değilse veya denklem tutarsızsa
+    """
+    primes = prime_factors(m)
+    solutions = [solve_mod_prime(A, B, p) for p in primes]
+    n, r = len(solutions[0]), len(solutions[0][0])
+    return [[crt_combine([solution[i][j] for solution in solutions], primes) for j in range(r)]
+            for i in range(n)]
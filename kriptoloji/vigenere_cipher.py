@@ -7,7 +7,7 @@ Algoritma:
 2. Her karakter için:
    - Plaintext karakteri: P[i]
    - Key karakteri: K[i]
-   - Ciphertext: (P[i] + K[i]) mod 26
+   - Ciphertext: (P[i] + K[i]) mod n (n: alfabe boyutu, Latin için 26)
 
 Örnek (key="KEY"):
 Plaintext:  H E L L O
@@ -17,9 +17,17 @@ Ciphertext: R I B D S
 H(7) + K(10) = 17 -> R
 E(4) + E(4) = 8 -> I
 L(11) + Y(24) = 35 mod 26 = 9 -> J (ama bu örnekte farklı olabilir)
+
+Uygulama: key uzunluğu p ise i, i+p, i+2p, ... konumları aynı kaydırmayı
+alır. Metin tamponunun her adımlı dilimi (tampon[i::p]) kendi kaydırma
+tablosuyla translate edilip yerine yazılır; key metin boyunca tekrarlanmaz.
+Bu yolun sabit maliyeti key harfi başına bir dilim işlemidir; key'e göre
+kısa metinlerde harf başına döngü (encrypt_scalar) daha hızlıdır.
 """
 
-from .utils.text_utils import prepare_text, char_to_index, index_to_char
+from itertools import cycle
+
+from .utils.alphabet import LATIN, get_alphabet
 
 
 class VigenereCipher:
@@ -28,33 +36,87 @@ class VigenereCipher:
     Key kelimesini tekrarlayarak her karakteri ayrı shift ile şifreler.
     """
     
-    def _prepare_key(self, key: str, length: int) -> str:
+    def __init__(self, alphabet=LATIN):
         """
-        Key'i metin uzunluğuna kadar tekrarlar.
+        Args:
+            alphabet: Alphabet veya adı ('en', 'tr'; varsayılan: Latin A-Z)
+        """
+        self.alphabet = get_alphabet(alphabet)
+    
+    def _prepare_key(self, key: str) -> bytearray:
+        """
+        Key'i indekslere çevirir.
         
         Args:
             key: Key kelimesi
-            length: Hedef uzunluk
         
         Returns:
-            Tekrarlanmış key
+            Key harflerinin indeksleri
         """
-        key = prepare_text(key, remove_spaces=True)
-        if len(key) == 0:
+        key_indices = self.alphabet.encode(key)
+        if len(key_indices) == 0:
             raise ValueError("Key boş olamaz")
+        return key_indices
+    
+    def letter_maps(self, key: str) -> tuple:
+        """
+        Şifrelemenin harf eşlemeleri (bkz. pipeline).
+        
+        Args:
+            key: Key kelimesi
+        
+        Returns:
+            Key harfi başına bir permütasyon; i. konumdaki harfe
+            maps[i mod p] uygulanır
+        """
+        size = self.alphabet.size
+        return tuple(tuple((i + k) % size for i in range(size)) for k in self._prepare_key(key))
+    
+    def _apply(self, text: str, key: str, sign: int) -> str:
+        """
+        Her key harfinin kaydırmasını kendi adımlı dilimine uygular.
+        
+        Args:
+            text: Metin
+            key: Key kelimesi
+            sign: 1 şifreleme, -1 çözme
+        
+        Returns:
+            Sonuç metni
+        """
+        alphabet = self.alphabet
+        buffer = alphabet.encode(text)
+        key_indices = self._prepare_key(key)
+        period = len(key_indices)
+        
+        # Dilimler kaydırma tablolarıyla yerinde translate edilir
+        for i, k in enumerate(key_indices[:len(buffer)]):
+            buffer[i::period] = buffer[i::period].translate(alphabet.shift_index_table(sign * k))
         
-        # Key'i uzunluğa kadar tekrarla
-        repeated_key = (key * ((length // len(key)) + 1))[:length]
-        return repeated_key
+        return alphabet.decode(buffer)
+    
+    def _apply_scalar(self, text: str, key: str, sign: int) -> str:
+        """_apply'ın harf başına döngüyle yapılanı (kısa metinler için)"""
+        alphabet = self.alphabet
+        size = alphabet.size
+        shifts = [sign * k for k in self._prepare_key(key)]
+        buffer = alphabet.encode(text)
+        return alphabet.decode(bytes((i + s) % size for i, s in zip(buffer, cycle(shifts))))
+    
+    def path_width(self, key: str) -> int:
+        """
+        Tampon yolunun sabit maliyetinin ölçüsü: key harfi sayısı (dilim sayısı).
+        Yol seçim eşikleri (harf sayısı) bununla çarpılır.
+        """
+        return len(self._prepare_key(key))
     
     def encrypt(self, plaintext: str, key: str) -> str:
         """
         Metni Vigenère Cipher ile şifreler.
         
         Adımlar:
-        1. Metni hazırla
-        2. Key'i metin uzunluğuna kadar tekrarla
-        3. Her karakter için: (plaintext[i] + key[i]) mod 26
+        1. Metni indeks tamponuna çevir
+        2. Key'in i. harfi için i, i+p, ... konumlarına: (plaintext + key[i]) mod n
         
         Args:
             plaintext: Şifrelenecek metin
@@ -63,35 +125,15 @@ class VigenereCipher:
         Returns:
             Şifreli metin
         """
-        # Metni hazırla
-        text = prepare_text(plaintext, remove_spaces=True)
-        
-        # Key'i hazırla
-        key_text = self._prepare_key(key, len(text))
-        
-        # Her karakteri şifrele
-        ciphertext = []
-        for i in range(len(text)):
-            # Karakterleri indekse çevir
-            p_index = char_to_index(text[i])
-            k_index = char_to_index(key_text[i])
-            
-            # Topla ve mod 26 al
-            c_index = (p_index + k_index) % 26
-            
-            # Yeni karakteri al
-            ciphertext.append(index_to_char(c_index))
-        
-        return ''.join(ciphertext)
+        return self._apply(plaintext, key, 1)
     
     def decrypt(self, ciphertext: str, key: str) -> str:
         """
         Şifreli metni Vigenère Cipher ile çözer.
         
         Adımlar:
-        1. Metni hazırla
-        2. Key'i metin uzunluğuna kadar tekrarla
-        3. Her karakter için: (ciphertext[i] - key[i]) mod 26
+        1. Metni indeks tamponuna çevir
+        2. Key'in i. harfi için i, i+p, ... konumlarına: (ciphertext - key[i]) mod n
         
         Args:
             ciphertext: Şifreli metin
@@ -100,26 +142,12 @@ class VigenereCipher:
         Returns:
             Çözülmüş metin
         """
-        # Metni hazırla
-        text = prepare_text(ciphertext, remove_spaces=True)
-        
-        # Key'i hazırla
-        key_text = self._prepare_key(key, len(text))
-        
-        # Her karakteri çöz
-        plaintext = []
-        for i in range(len(text)):
-            # Karakterleri indekse çevir
-            c_index = char_to_index(text[i])
-            k_index = char_to_index(key_text[i])
-            
-            # Çıkar ve mod 26 al
-            p_index = (c_index - k_index) % 26
-            if p_index < 0:
-                p_index += 26
-            
-            # Yeni karakteri al
-            plaintext.append(index_to_char(p_index))
-        
-        return ''.join(plaintext)
-
+        return self._apply(ciphertext, key, -1)
+    
+    def encrypt_scalar(self, plaintext: str, key: str) -> str:
+        """encrypt ile aynı sonuç; harf başına döngü (kısa metinlerde daha hızlı)"""
+        return self._apply_scalar(plaintext, key, 1)
+    
+    def decrypt_scalar(self, ciphertext: str, key: str) -> str:
+        """decrypt ile aynı sonuç; harf başına döngü (kısa metinlerde daha hızlı)"""
+        return self._apply_scalar(ciphertext, key, -1)
@@ -1,35 +1,393 @@
-from flask import Flask
-from flask_socketio import SocketIO
+import os
+
+# Çalışma modu: threading (varsayılan), eventlet veya gevent.
+# eventlet/gevent tek süreçte binlerce bağlantıyı green thread'lerle taşır;
+# monkey patch diğer tüm import'lardan önce yapılmalı.
+ASYNC_MODE = os.getenv("SOCKETIO_ASYNC_MODE", "threading")
+if ASYNC_MODE == "eventlet":
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE == "gevent":
+    from gevent import monkey
+    monkey.patch_all()
+
+import logging
+import threading
+
+from flask import Flask, request
+from flask_socketio import SocketIO, emit, send, join_room
+from socketio.exceptions import ConnectionRefusedError
 from cryptography.fernet import Fernet
 
-# Anahtar oluştur (normalde dosyadan okunur)
-key = Fernet.generate_key()
+from .bus import InMemoryBus, create_bus
+from .frames import pack_tokens, unpack_tokens
+from .resume import Inbox, RecentIds
+from .logs import logger, setup_logging
+from .presence import Presence
+from .session import new_keypair, derive_cipher, decode_public
+
+setup_logging(os.getenv("LOG_LEVEL", "INFO"), os.getenv("LOG_FORMAT", "json"))
+
+# Ortak anahtar (normalde dosyadan okunur): oturum anahtarı olmayan eski
+# istemciler ve düğümler arası bus trafiği için kullanılır.
+# Birden fazla düğüm çalışıyorsa hepsine aynı SOCKET_FERNET_KEY verilmeli.
+key = os.getenv("SOCKET_FERNET_KEY", "").encode() or Fernet.generate_key()
 cipher = Fernet(key)
 
 app = Flask(__name__)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
+
+# Düğümler arası mesaj yolu (bkz. bus.py). Bus mesajları ortak anahtarla
+# şifrelenir: her düğüm kendi rastgele anahtarını üretirse diğer düğümlerin
+# mesajlarını çözemez, bu yüzden çok düğümlü modda anahtar zorunludur
+bus = create_bus(os.getenv("SOCKETIO_MESSAGE_QUEUE"))
+if not isinstance(bus, InMemoryBus) and not os.getenv("SOCKET_FERNET_KEY"):
+    raise SystemExit("SOCKETIO_MESSAGE_QUEUE kullanılırken tüm düğümlere aynı SOCKET_FERNET_KEY verilmeli")
+
+# Kimlik doğrulama:
+#   "none"  (varsayılan) kimlik bağlantının sid'idir; auth içindeki kullanıcı adı
+#           yok sayılır, böylece kimse başka bir kullanıcının odasına giremez
+#   "trust" auth içindeki kullanıcı adına güvenilir; herkes istediği kullanıcının
+#           mesajlarını alabilir, sadece yerel geliştirme ve benchmark içindir
+#   "jwt"   backend'in verdiği token zorunlu
+# SOCKET_PERSIST=true mesajları backend veritabanına yazar. jwt ve persist
+# backend modüllerini kullanır (bkz. store.py)
+AUTH_MODE = os.getenv("SOCKET_AUTH", "none")
+if AUTH_MODE not in ("none", "trust", "jwt"):
+    raise SystemExit(f"Geçersiz SOCKET_AUTH: {AUTH_MODE} (none, trust veya jwt)")
+if AUTH_MODE == "trust":
+    logger.warning("SOCKET_AUTH=trust: kullanıcı adları doğrulanmıyor, üretimde kullanmayın")
+# Yeniden bağlanınca kaçırılan mesajların tekrar gönderimi sadece doğrulanmış kullanıcılara
+RESUME_ENABLED = AUTH_MODE == "jwt"
+PERSIST = os.getenv("SOCKET_PERSIST", "false").lower() == "true"
+store = None
+if AUTH_MODE == "jwt" or PERSIST:
+    from . import store as backend_store
+if PERSIST:
+    store = backend_store.MessageStore(
+        app,
+        batch_size=int(os.getenv("SOCKET_STORE_BATCH_SIZE", "500")),
+        flush_interval=float(os.getenv("SOCKET_STORE_FLUSH_INTERVAL", "0.2")),
+        default_method=os.getenv("SOCKET_STORE_METHOD", "caesar"),
+        default_key=os.getenv("SOCKET_STORE_KEY") or None,
+    )
+
+# Bağlantı (sid) -> kullanıcı adı
+sessions = {}
+# Kullanıcı adı -> bu düğümdeki bağlantıları (sid kümesi)
+online = {}
+# Bağlantı (sid) -> oturum anahtarlı Fernet (bkz. session.py)
+session_ciphers = {}
+# Bağlantı (sid) -> istemcinin mesaj id akışı (auth "stream"; yeniden bağlanınca aynı kalır)
+streams = {}
+# Yeniden bağlanma için son mesajlar ve tekrar gönderim kontrolü (bkz. resume.py)
+# (resume kapalıysa mesaj saklanmaz, sadece seq verilir)
+inbox = Inbox(bus.node_id,
+              size=int(os.getenv("SOCKET_RESUME_BUFFER", "1000")) if RESUME_ENABLED else 0,
+              max_users=int(os.getenv("SOCKET_RESUME_USERS", "10000")),
+              ttl=float(os.getenv("SOCKET_RESUME_TTL", "3600")))
+recent_ids = RecentIds()
+
+# Binary ekli bir paket Socket.IO'da birden fazla frame'dir; farklı handler
+# thread'lerinden aynı bağlantıya yapılan emit'ler araya girerse alıcı
+# ekleri yanlış pakete bağlar. Gönderim sadece kuyruğa yazdığı için kilit kısa sürer.
+binary_emit_lock = threading.Lock()
+# seq ataması ve yerel teslimat birlikte yapılır: bir kullanıcının
+# bağlantıları mesajları seq sırasıyla alır
+delivery_lock = threading.Lock()
+
+
+def user_room(user):
+    # Kullanıcının tüm bağlantıları (cihazları) bu odadadır
+    return f"user:{user}"
+
+
+def remember_contact(user, other):
+    # Presence ve typing sadece ortak konuşması olan kullanıcılara gider
+    presence.remember_contact(user, other)
+
+
+def open_token(sid, token):
+    # Fernet hem bytes (binary frame) hem str (eski istemci) kabul eder
+    return session_ciphers.get(sid, cipher).decrypt(token)
+
+
+def seal(sid, plaintext):
+    # Oturum anahtarlı bağlantıya ham token (binary frame), eski istemciye metin
+    session = session_ciphers.get(sid)
+    if session is None:
+        return cipher.encrypt(plaintext).decode()
+    return session.encrypt(plaintext)
+
+
+def emit_binary(event, data, sid):
+    with binary_emit_lock:
+        socketio.emit(event, data, to=sid)
+
+
+def emit_chats_to(sid, items):
+    # items: [(node, seq, gönderen, düz metin bytes)]. Eski istemciler batch bilmez:
+    # onlara (ve tek mesajda herkese) ayrı "chat" olayları gider (bkz. frames.py)
+    if len(items) == 1 or sid not in session_ciphers:
+        for node, seq, sender, plaintext in items:
+            emit_binary("chat", {"from": sender, "node": node, "seq": seq, "msg": seal(sid, plaintext)}, sid)
+        return
+    emit_binary("chat_batch", {"messages": [{"from": sender, "node": node, "seq": seq}
+                                            for node, seq, sender, _ in items],
+                               "tokens": pack_tokens([seal(sid, p) for _, _, _, p in items])}, sid)
+
+
+def emit_chats(user, items):
+    # Her bağlantının anahtarı farklı: oda yerine bağlantı başına şifrele
+    for sid in online.get(user, ()):
+        emit_chats_to(sid, items)
+
+
+def deliver(user, event, data):
+    # Önce bu düğümdeki bağlantılara, sonra bus üzerinden diğer düğümlere
+    socketio.emit(event, data, to=user_room(user))
+    bus.publish({"user": user, "event": event, "data": data})
+
+
+def publish_presence_node(user, data):
+    # Düğüm bazında bağlantı durumu sadece diğer düğümlerin Presence'ına gider
+    bus.publish({"user": user, "event": "presence_node", "data": data})
+
+
+# Çevrimiçi durum, son görülme ve typing (bkz. presence.py)
+presence = Presence(deliver, publish_presence_node, bus.node_id,
+                    offline_grace=float(os.getenv("SOCKET_OFFLINE_GRACE", "5")),
+                    typing_ttl=float(os.getenv("SOCKET_TYPING_TTL", "6")),
+                    max_users=int(os.getenv("SOCKET_PRESENCE_USERS", "100000")))
+
+
+def deliver_chats(user, items):
+    # items: [(gönderen, düz metin)]; seq bu düğümde atanır ve bus ile taşınır
+    # (düğüm kimliği bus mesajının "origin" alanıdır)
+    with delivery_lock:
+        items = [(*inbox.append(user, sender, plaintext), sender, plaintext) for sender, plaintext in items]
+        emit_chats(user, items)
+    # Bus üzerinde mesajlar ortak anahtarla şifreli, tek batch olarak taşınır
+    tokens = pack_tokens([cipher.encrypt(plaintext) for _, _, _, plaintext in items]).decode()
+    bus.publish({"user": user, "event": "chat_batch",
+                 "data": {"messages": [{"from": sender, "seq": seq} for _, seq, sender, _ in items],
+                          "tokens": tokens}})
+
+
+def on_bus_message(message):
+    # Başka bir düğümde kabul edilen mesajı buradaki bağlantılara teslim et
+    event, data, user = message["event"], message["data"], message["user"]
+    if event == "chat_batch":
+        with delivery_lock:
+            items = []
+            for m, token in zip(data["messages"], unpack_tokens(data["tokens"])):
+                plaintext = cipher.decrypt(token)
+                remember_contact(m["from"], user)
+                node, seq = inbox.append(user, m["from"], plaintext, message["origin"], m["seq"])
+                items.append((node, seq, m["from"], plaintext))
+            emit_chats(user, items)
+    elif event == "presence_node":
+        presence.apply_node(data)
+    else:
+        socketio.emit(event, data, to=user_room(user))
+
+
+bus.start(on_bus_message, socketio.start_background_task)
+socketio.start_background_task(presence.run, socketio.sleep)
+if store is not None:
+    store.start(socketio.start_background_task)
+
+
+def parse_last_seq(value):
+    # {node: seq} (eski istemcilerde tek sayı); geçersiz değerler yok sayılır
+    if isinstance(value, dict):
+        return {str(node): seq for node, seq in value.items()
+                if isinstance(seq, int) and not isinstance(seq, bool)}
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
 
 @app.route("/")
 def index():
     return "Server çalışıyor!"
 
-# Mesaj alıcı
+
+@socketio.on("connect")
+def handle_connect(auth=None):
+    # Kullanıcı adı JWT'den gelir (trust modunda auth'tan); doğrulanmamış bağlantı
+    # sadece kendi sid'iyle adreslenir ve hiçbir kullanıcının odasına girmez
+    auth = auth or {}
+    if AUTH_MODE == "jwt":
+        payload = backend_store.verify_token(auth.get("token") or "")
+        if payload is None:
+            raise ConnectionRefusedError("geçersiz veya süresi dolmuş token")
+        user = payload["username"]
+    elif AUTH_MODE == "trust":
+        user = auth.get("user") or request.sid
+    else:
+        user = request.sid
+
+    # Açık anahtar gönderen istemciyle oturum anahtarı türet
+    if auth.get("pub"):
+        private_key, public_bytes = new_keypair()
+        try:
+            session_ciphers[request.sid] = derive_cipher(private_key, decode_public(auth["pub"]))
+        except ValueError:
+            raise ConnectionRefusedError("geçersiz açık anahtar")
+        emit_binary("session", public_bytes, request.sid)
+
+    sessions[request.sid] = user
+    streams[request.sid] = auth.get("stream")
+    join_room(user_room(user))
+
+    with delivery_lock:
+        online.setdefault(user, set()).add(request.sid)
+        # Yeniden bağlanan istemci: her düğüm için sadece son aldığı seq'ten sonrakiler tekrar gider.
+        # Kimlik doğrulamasız modda kullanıcı adı iddiadan ibarettir; başkasının
+        # kutusu okunabileceği için kaçırılan mesajlar tekrar gönderilmez
+        last_seq = parse_last_seq(auth.get("last_seq")) if RESUME_ENABLED else None
+        if last_seq is not None:
+            missed = inbox.since(user, last_seq)
+            if missed:
+                emit_chats_to(request.sid, missed)
+        emit("resume", {"seq": inbox.last(user)}, to=request.sid)
+        # İlk/son bağlantı kararı ve presence geçişi aynı kilit altında: eş zamanlı
+        # bir kopma ile yeniden bağlanma sırası karışıp kullanıcı çevrimdışı kalmaz
+        if len(online[user]) == 1:
+            presence.connected(user)
+    logger.debug("connect", extra={"sid": request.sid, "user": user})
+
+
+@socketio.on("disconnect")
+def handle_disconnect():
+    session_ciphers.pop(request.sid, None)
+    streams.pop(request.sid, None)
+    user = sessions.pop(request.sid, None)
+    if user is None:
+        return
+
+    # handle_connect ile aynı kilit (bkz. oradaki not)
+    with delivery_lock:
+        sids = online.get(user)
+        if sids is not None:
+            sids.discard(request.sid)
+            if not sids:
+                del online[user]
+                presence.disconnected(user)
+    logger.debug("disconnect", extra={"sid": request.sid, "user": user})
+
+
+def accept_chat(sid, sender, item, token, outbox, replies):
+    # Tek mesajı çözer ve teslimat için outbox'a (alıcı -> [(gönderen, metin)])
+    # ya da sunucu cevabı için replies'a ekler; gönderene gidecek ack'i döner
+    msg_id = item.get("id")
+    recipient = item.get("to")
+
+    try:
+        plaintext = open_token(sid, token)
+    except Exception as e:
+        logger.warning("chat decrypt failed", extra={"sid": sid, "user": sender, "error": repr(e)})
+        return {"id": msg_id, "status": "error", "error": str(e)}
+
+    # Ack'i kaybolup yeniden gönderilen mesaj ikinci kez teslim edilmez
+    stream = streams.get(sid)
+    if stream and msg_id is not None and not recent_ids.add((sender, stream), msg_id):
+        return {"id": msg_id, "status": "duplicate"}
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("chat", extra={"sid": sid, "user": sender, "to": recipient, "size": len(token)})
+
+    if recipient:
+        # Alıcının odasına ilet (bu düğümde ve bus üzerinden diğer düğümlerde)
+        remember_contact(sender, recipient)
+        outbox.setdefault(recipient, []).append((sender, plaintext))
+        # Mesaj sadece kabul edildiği düğümde saklanır; "method"/"key" saklama şifresini seçer
+        if store is not None:
+            store.add(sender, recipient, plaintext.decode(errors="replace"), item.get("method"), item.get("key"))
+        # Alıcı başka bir düğümde olabilir; burada bilinen tek şey mesajın kabul edildiği
+        return {"id": msg_id, "status": "delivered" if recipient in online else "sent"}
+
+    # Alıcı yoksa sadece gönderene cevap ver
+    replies.append((None, None, "server", "Mesaj alındı: ".encode() + plaintext))
+    return {"id": msg_id, "status": "ok"}
+
+
+# Sohbet mesajı: {"id": <client mesaj id>, "msg": <şifreli token>, "to": <alıcı, opsiyonel>}
+# Oturum anahtarlı istemcilerde token ham bytes'tır (binary frame).
+# Alıcıya giden mesajda "node" mesajı kabul eden düğüm, "seq" o düğümün
+# kullanıcı başına sıra numarasıdır (bkz. resume.py)
+@socketio.on("chat")
+def handle_chat(data):
+    sender = sessions.get(request.sid, request.sid)
+    presence.touch(sender)
+    outbox, replies = {}, []
+    ack = accept_chat(request.sid, sender, data, data.get("msg"), outbox, replies)
+
+    for recipient, items in outbox.items():
+        deliver_chats(recipient, items)
+    emit("ack", ack, to=request.sid)
+    if replies:
+        emit_chats_to(request.sid, replies)
+
+
+# Toplu mesaj (bkz. frames.py): tek emit, mesaj başına ack tek "ack_batch" içinde
+@socketio.on("chat_batch")
+def handle_chat_batch(data):
+    sender = sessions.get(request.sid, request.sid)
+    presence.touch(sender)
+    outbox, replies = {}, []
+    acks = [accept_chat(request.sid, sender, item, token, outbox, replies)
+            for item, token in zip(data.get("messages", ()), unpack_tokens(data.get("tokens")))]
+
+    # Aynı alıcıya giden mesajlar tek batch olarak teslim edilir
+    for recipient, items in outbox.items():
+        deliver_chats(recipient, items)
+    emit("ack_batch", {"acks": acks}, to=request.sid)
+    if replies:
+        emit_chats_to(request.sid, replies)
+
+
+# Yazıyor göstergesi: {"to": <kullanıcı>, "active": true/false}. active=false
+# gelmezse gösterge SOCKET_TYPING_TTL sonra kendiliğinden kapanır
+@socketio.on("typing")
+def handle_typing(data):
+    sender = sessions.get(request.sid, request.sid)
+    presence.typing(sender, data.get("to"), bool(data.get("active", True)))
+
+
+# Durum sorgusu: {"users": [...]} -> cevap (ack) olarak sadece kişilerin durumu
+@socketio.on("presence")
+def handle_presence_query(data):
+    sender = sessions.get(request.sid, request.sid)
+    return presence.snapshot(sender, data.get("users", ())[:100])
+
+
+# Eski istemciler için: düz "message" olayı (cevap sadece gönderene)
 @socketio.on("message")
 def handle_message(encrypted_msg):
     try:
         # Gelen mesajı çöz
         decrypted = cipher.decrypt(encrypted_msg.encode()).decode()
-        print(f"Şifreli mesaj geldi: {encrypted_msg}")
-        print(f"Çözülen mesaj: {decrypted}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("message", extra={"sid": request.sid, "size": len(encrypted_msg)})
 
-        # Cevap gönder
+        # Cevap gönder (socketio.send herkese yayın yapardı)
         reply = f"Mesaj alındı: {decrypted}"
         encrypted_reply = cipher.encrypt(reply.encode()).decode()
-        socketio.send(encrypted_reply)
+        send(encrypted_reply, to=request.sid)
+
+    except Exception:
+        logger.exception("message handler failed", extra={"sid": request.sid})
 
-    except Exception as e:
-        print("Hata:", e)
 
 if __name__ == "__main__":
+    host = os.getenv("SOCKET_HOST", "127.0.0.1")
+    port = int(os.getenv("SOCKET_PORT", "5000"))
+    # Anahtar bilinçli olarak log'a değil konsola yazılır
     print("Şifreleme anahtarını paylaş:", key.decode())
-    socketio.run(app, host="127.0.0.1", port=5000)
\ No newline at end of file
+    logger.info("starting", extra={"host": host, "port": port, "async_mode": socketio.async_mode,
+                                   "bus": type(bus).__name__, "node": bus.node_id})
+    # threading modunda Werkzeug geliştirme sunucusu kullanılır
+    socketio.run(app, host=host, port=port, log_output=logger.isEnabledFor(logging.DEBUG),
+                 allow_unsafe_werkzeug=(socketio.async_mode == "threading"))
@@ -0,0 +1,61 @@
+import os
+import socket
+import threading
+
+from .bus import send_frame, recv_frame
+
+# Testler ve tek makinede çoklu süreç için basit mesaj broker'ı.
+# Her düğümden gelen çerçeveyi (frame) bağlı tüm düğümlere olduğu gibi iletir.
+#
+# Kullanım: python -m Server.broker   (BROKER_HOST / BROKER_PORT, varsayılan 127.0.0.1:6000)
+# Sunucular: SOCKETIO_MESSAGE_QUEUE=broker://127.0.0.1:6000 python -m Server
+
+
+class Broker:
+    def __init__(self, host="127.0.0.1", port=6000):
+        self.host = host
+        self.port = port
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def serve_forever(self, ready=None):
+        self._server = socket.create_server((self.host, self.port), reuse_port=False)
+        self.port = self._server.getsockname()[1]
+        if ready is not None:
+            ready.set()
+        while True:
+            conn, _ = self._server.accept()
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                # Her bağlantının yazma kilidi ayrı: yavaş bir düğüm diğerlerini bekletmez
+                self._clients[conn] = threading.Lock()
+            threading.Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+
+    def _serve_client(self, conn):
+        try:
+            while True:
+                frame = recv_frame(conn)
+                with self._lock:
+                    targets = list(self._clients.items())
+                for target, lock in targets:
+                    try:
+                        with lock:
+                            send_frame(target, frame)
+                    except OSError:
+                        self._drop(target)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._drop(conn)
+
+    def _drop(self, conn):
+        with self._lock:
+            self._clients.pop(conn, None)
+        conn.close()
+
+
+if __name__ == "__main__":
+    broker = Broker(os.getenv("BROKER_HOST", "127.0.0.1"), int(os.getenv("BROKER_PORT", "6000")))
+    print(f"Broker dinliyor: {broker.host}:{broker.port}")
+    broker.serve_forever()
@@ -0,0 +1,198 @@
+import json
+import socket
+import struct
+import threading
+import time
+import uuid
+from urllib.parse import urlparse
+
+from .logs import logger
+
+# Süreçler arası mesaj yolu (message bus).
+#
+# Bir düğümde (node) kabul edilen mesaj önce o düğümün kendi bağlantılarına
+# teslim edilir, sonra bus'a yayınlanır; diğer düğümler aynı mesajı kendi
+# yerel bağlantılarına teslim eder. Böylece A düğümüne bağlı gönderen,
+# B düğümüne bağlı alıcıya ulaşır.
+#
+# SOCKETIO_MESSAGE_QUEUE ile seçilir:
+#   (boş) / memory://       -> tek süreç, bus yok (varsayılan)
+#   broker://host:port      -> yerel broker süreci (testler, tek makine): python -m Server.broker
+#   redis://host:port/db    -> Redis pub/sub (production, redis paketi gerekir)
+#
+# Dinleyici hiç durmaz: işlenemeyen mesaj loglanıp atlanır, kopan bağlantı
+# artan beklemeyle yeniden kurulur. Kopukluk sırasında yayınlanan mesajlar
+# diğer düğümlere ulaşmaz (sadece loglanır).
+
+# Her mesajın başına eklenen uzunluk (4 byte, big-endian)
+_HEADER = struct.Struct(">I")
+
+DEFAULT_CHANNEL = "chat-server"
+
+# Yeniden bağlanma beklemesi (saniye): her başarısız denemede ikiye katlanır
+RECONNECT_DELAY = 0.5
+MAX_RECONNECT_DELAY = 30
+
+
+def send_frame(sock, payload):
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("bağlantı kapandı")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_frame(sock):
+    (size,) = _HEADER.unpack(recv_exact(sock, _HEADER.size))
+    return recv_exact(sock, size)
+
+
+class MessageBus:
+    # Tüm bus'ların ortak arayüzü. Mesajlar JSON'a çevrilebilen dict'lerdir;
+    # "origin" alanı yayınlayan düğümü belirtir ve düğüm kendi mesajlarını atlar.
+
+    def __init__(self):
+        # Kısa tutulur: seq ile birlikte istemciye giden her mesajda taşınır (bkz. resume.py)
+        self.node_id = uuid.uuid4().hex[:12]
+        self.handler = None
+
+    def start(self, handler, spawn):
+        # handler(message) her uzak mesaj için çağrılır;
+        # spawn, sunucunun async moduna uygun arka plan görevi başlatır
+        self.handler = handler
+
+    def publish(self, message):
+        pass
+
+    def _dispatch(self, payload):
+        # Tek mesajın hatası (bozuk JSON, başka anahtarla şifrelenmiş token,
+        # handler hatası) dinleyiciyi durdurmamalı
+        try:
+            message = json.loads(payload)
+            if message.get("origin") != self.node_id:
+                self.handler(message)
+        except Exception:
+            logger.exception("bus message dropped", extra={"bus": type(self).__name__, "size": len(payload)})
+
+    def _reconnect_wait(self, delay, error):
+        # Bekler ve bir sonraki bekleme süresini döner
+        logger.warning("bus connection lost", extra={"bus": type(self).__name__, "error": repr(error),
+                                                    "retry_in": delay})
+        time.sleep(delay)
+        return min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def _encode(self, message):
+        message["origin"] = self.node_id
+        return json.dumps(message, separators=(",", ":")).encode()
+
+
+class InMemoryBus(MessageBus):
+    # Tek süreç: yerel teslimat zaten yapıldığı için yayınlanacak bir şey yok
+    pass
+
+
+class BrokerBus(MessageBus):
+    # Server.broker sürecine TCP ile bağlanır; broker her mesajı tüm düğümlere dağıtır
+
+    def __init__(self, host, port):
+        super().__init__()
+        self.address = (host, port)
+        self._sock = None
+        self._send_lock = threading.Lock()
+
+    def start(self, handler, spawn):
+        super().start(handler, spawn)
+        self._connect()
+        spawn(self._listen)
+
+    def _connect(self):
+        sock = socket.create_connection(self.address)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._send_lock:
+            self._sock = sock
+
+    def _listen(self):
+        delay = RECONNECT_DELAY
+        while True:
+            try:
+                if self._sock is None:
+                    self._connect()
+                    logger.info("bus reconnected", extra={"bus": "BrokerBus"})
+                    delay = RECONNECT_DELAY
+                frame = recv_frame(self._sock)
+            except OSError as e:  # ConnectionError dahil
+                with self._send_lock:
+                    if self._sock is not None:
+                        self._sock.close()
+                    self._sock = None
+                delay = self._reconnect_wait(delay, e)
+                continue
+            self._dispatch(frame)
+
+    def publish(self, message):
+        payload = self._encode(message)
+        with self._send_lock:
+            if self._sock is None:
+                logger.warning("bus publish dropped", extra={"bus": "BrokerBus", "error": "not connected"})
+                return
+            try:
+                send_frame(self._sock, payload)
+            except OSError as e:
+                # Dinleyici kopukluğu görüp yeniden bağlanır
+                logger.warning("bus publish dropped", extra={"bus": "BrokerBus", "error": repr(e)})
+
+
+class RedisBus(MessageBus):
+    # Redis (veya Redis uyumlu: KeyDB, Valkey, Dragonfly) pub/sub kanalı
+
+    def __init__(self, url, channel=DEFAULT_CHANNEL):
+        super().__init__()
+        import redis  # Opsiyonel bağımlılık, sadece bu mod için gerekli
+
+        self.channel = channel
+        self._redis = redis.Redis.from_url(url)
+        self._connection_errors = (redis.ConnectionError, redis.TimeoutError, OSError)
+        self._pubsub = None
+
+    def start(self, handler, spawn):
+        super().start(handler, spawn)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        spawn(self._listen)
+
+    def _listen(self):
+        delay = RECONNECT_DELAY
+        while True:
+            try:
+                # listen() kopan bağlantıyı yeniden kurar ve kanala yeniden abone olur
+                for item in self._pubsub.listen():
+                    delay = RECONNECT_DELAY
+                    if item["type"] == "message":
+                        self._dispatch(item["data"])
+            except self._connection_errors as e:
+                delay = self._reconnect_wait(delay, e)
+
+    def publish(self, message):
+        try:
+            self._redis.publish(self.channel, self._encode(message))
+        except self._connection_errors as e:
+            logger.warning("bus publish dropped", extra={"bus": "RedisBus", "error": repr(e)})
+
+
+def create_bus(url):
+    if not url or url.startswith("memory://"):
+        return InMemoryBus()
+
+    parsed = urlparse(url)
+    if parsed.scheme == "broker":
+        return BrokerBus(parsed.hostname or "127.0.0.1", parsed.port or 6000)
+    if parsed.scheme in ("redis", "rediss", "unix"):
+        return RedisBus(url)
+    raise ValueError(f"Desteklenmeyen message queue: {url}")
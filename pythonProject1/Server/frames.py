@@ -0,0 +1,23 @@
+# Toplu (batch) mesaj çerçeveleri.
+#
+# Bir batch tek emit'tir; mesaj üst bilgileri liste, tokenlar ise tek bir
+# binary ek (attachment) olarak gider:
+#   chat_batch (istemci -> sunucu): {"messages": [{"id", "to"}, ...], "tokens": b"tok1\ntok2..."}
+#   chat_batch (sunucu -> istemci): {"messages": [{"from"}, ...],     "tokens": b"..."}
+#   ack_batch  (sunucu -> istemci): {"acks": [{"id", "status"}, ...]}
+# Socket.IO her binary eki ayrı bir WebSocket frame'i olarak yollar; tokenları
+# birleştirmek 1000 mesajlık batch'i 1000 yerine 2 frame'e indirir.
+# Fernet tokenları base64url olduğu için "\n" içermez ve ayraç olarak güvenlidir.
+
+SEPARATOR = b"\n"
+
+
+def pack_tokens(tokens):
+    return SEPARATOR.join(tokens)
+
+
+def unpack_tokens(blob):
+    # Eski (metin) istemcilerden str de gelebilir
+    if isinstance(blob, str):
+        return blob.split(SEPARATOR.decode()) if blob else []
+    return blob.split(SEPARATOR) if blob else []
@@ -0,0 +1,49 @@
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+
+# Sunucu loglarının tamamı bu logger altında
+logger = logging.getLogger("chat_server")
+
+# LogRecord'un standart alanları; geri kalanlar "extra" ile gelen yapısal alanlardır
+_STANDARD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    # Her kayıt tek satır JSON: {"ts", "level", "logger", "msg", ...extra}
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name, value in record.__dict__.items():
+            if name not in _STANDARD_FIELDS:
+                entry[name] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging(level="INFO", fmt="json"):
+    # Handler'lar sadece kuyruğa yazar; konsola yazma ayrı bir thread'de yapılır,
+    # böylece olay işleyicileri (hot path) konsol I/O'sunda beklemez.
+    log_queue = queue.SimpleQueue()
+
+    console = logging.StreamHandler()
+    if fmt == "json":
+        console.setFormatter(JsonFormatter())
+    else:
+        console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    listener = logging.handlers.QueueListener(log_queue, console, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.propagate = False
+    return listener
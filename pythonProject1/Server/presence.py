@@ -0,0 +1,288 @@
+import math
+import time
+import threading
+from array import array
+from collections import OrderedDict
+
+# Çevrimiçi durumu (presence) ve "yazıyor" (typing) göstergeleri.
+#
+# Durum kullanıcı adı başına bir sözlük yerine yoğun (dense) dizilerde tutulur:
+# her kullanıcıya bir kez küçük bir tamsayı id verilir; çevrimiçi bayrağı
+# bytearray'de, son görülme zamanı array('d')'de o id'nin indeksindedir.
+# 100k kullanıcı ~1 MB tutar.
+#
+# Değişiklikler (delta) sadece ortak konuşması olan kullanıcılara gider; bir
+# olayın maliyeti çevrimiçi kullanıcı sayısına değil, kullanıcının kişi
+# sayısına bağlıdır. Süreli işler (yazıyor göstergesinin kendiliğinden
+# kapanması, kısa kopmalarda "offline"ın geciktirilmesi) TimingWheel ile
+# O(1) kurulur/iptal edilir.
+#
+# Birden fazla düğümde durum düğüm bazında tutulur: her kullanıcı için
+# bağlantısı olan düğümlerin kümesi. Bir düğüm kullanıcının ilk bağlantısında
+# ve (offline_grace sonra) son bağlantısı kapanınca bunu bus'a yayınlar
+# ("presence_node"). Kümede en az bir düğüm varsa kullanıcı çevrimiçidir; bir
+# düğüm kendi bağlantısı varken kullanıcıyı asla çevrimdışı görmez.
+# Geçişi kendi olayıyla yapan düğüm kişilere bildirir; olay "announced" ile
+# bunu taşır. Alıcı düğüm, bildirilmemiş bir geçiş görürse ya da bildirilen
+# durum kendi gördüğüyle çelişirse (ör. kullanıcı aynı anda başka düğüme
+# bağlandı) kendi durumunu bildirir. Eş zamanlı olaylarda aynı durum iki kez
+# gidebilir; istemciler için zararsızdır. Kapanmadan çöken düğümün kayıtları
+# ve sonradan katılan düğümün bilmediği eski bağlantılar senkronize edilmez.
+#
+# Bellek sınırı: en fazla `max_users` kullanıcı id'si tutulur. Sınıra gelince
+# en uzun süredir çevrimdışı olan kullanıcının id'si (kişi bağlarıyla birlikte)
+# yeni kullanıcıya verilir; çevrimiçi kullanıcılar atılmaz.
+
+OFFLINE = 0
+ONLINE = 1
+
+
+class TimingWheel:
+    # Dairesel zaman çarkı: her yuva (slot) bir tick'e düşen anahtarları tutar.
+    # Yeniden kurma/iptal sadece son tarihi (deadline) günceller; eski kayıtlar
+    # yuva işlenirken atlanır.
+
+    def __init__(self, tick=0.1, slots=512):
+        self.tick = tick
+        self._slots = [set() for _ in range(slots)]
+        self._deadlines = {}
+        self._current = self._tick_now()
+
+    def _tick_now(self):
+        return int(time.monotonic() / self.tick)
+
+    def schedule(self, key, delay):
+        deadline = self._current + max(1, math.ceil(delay / self.tick))
+        self._deadlines[key] = deadline
+        self._slots[deadline % len(self._slots)].add(key)
+
+    def cancel(self, key):
+        return self._deadlines.pop(key, None) is not None
+
+    def scheduled(self, key):
+        return key in self._deadlines
+
+    def advance(self):
+        # Zamanı gelen anahtarları döner
+        now = self._tick_now()
+        due = []
+        while self._current < now:
+            self._current += 1
+            slot = self._slots[self._current % len(self._slots)]
+            for key in list(slot):
+                deadline = self._deadlines.get(key)
+                if deadline == self._current:
+                    del self._deadlines[key]
+                    due.append(key)
+                    slot.discard(key)
+                elif deadline is None or deadline % len(self._slots) != self._current % len(self._slots):
+                    # İptal edilmiş ya da başka yuvaya taşınmış
+                    slot.discard(key)
+                # Aksi halde aynı yuvada, sonraki turda
+        return due
+
+
+class Presence:
+    def __init__(self, notify, publish=None, node=None, offline_grace=5.0, typing_ttl=6.0, tick=0.1,
+                 max_users=100000):
+        # notify(kullanıcı adı, olay, veri): tek kullanıcıya gönderim (bkz. deliver)
+        # publish(kullanıcı adı, veri): düğüm olayını diğer düğümlere yayınlar (tek düğümde None)
+        self.notify = notify
+        self.publish = publish
+        self.node = node
+        self.offline_grace = offline_grace
+        self.typing_ttl = typing_ttl
+        self.max_users = max_users
+        self.wheel = TimingWheel(tick)
+
+        self._ids = {}
+        self._names = []
+        self._state = bytearray()
+        self._last_seen = array("d")
+        self._contacts = []
+        # Kullanıcının bağlantısı olan düğümler (bu düğüm dahil)
+        self._nodes = []
+        # Çevrimdışı ve bekleyen işi olmayan id'ler, en eskisi başta (yeniden kullanım sırası)
+        self._idle = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _id(self, user):
+        uid = self._ids.get(user)
+        if uid is not None:
+            return uid
+        if len(self._ids) >= self.max_users and self._idle:
+            uid, _ = self._idle.popitem(last=False)
+            self._release(uid)
+            self._names[uid] = user
+            self._state[uid] = OFFLINE
+            self._last_seen[uid] = 0.0
+        else:
+            uid = len(self._names)
+            self._names.append(user)
+            self._state.append(OFFLINE)
+            self._last_seen.append(0.0)
+            self._contacts.append(set())
+            self._nodes.append(set())
+        self._ids[user] = uid
+        self._idle[uid] = None
+        return uid
+
+    def _release(self, uid):
+        # Id yeniden verilmeden önce eski kullanıcının izleri silinir
+        del self._ids[self._names[uid]]
+        for c in self._contacts[uid]:
+            self._contacts[c].discard(uid)
+            self.wheel.cancel(("typing", uid, c))
+            self.wheel.cancel(("typing", c, uid))
+        self._contacts[uid] = set()
+        self._nodes[uid] = set()
+
+    def _set_state(self, uid, state):
+        self._state[uid] = state
+        if state == ONLINE:
+            self._idle.pop(uid, None)
+        else:
+            self._idle[uid] = None
+
+    def _status(self, uid):
+        return {"user": self._names[uid],
+                "status": "online" if self._state[uid] == ONLINE else "offline",
+                "last_seen": round(self._last_seen[uid], 3)}
+
+    def _presence_deltas(self, uid):
+        data = self._status(uid)
+        return [(self._names[c], "presence", data) for c in self._contacts[uid]]
+
+    def _send(self, deltas, node_event=None):
+        # Gönderim kilit dışında: notify ve publish bus/emit yapar
+        for user, event, data in deltas:
+            self.notify(user, event, data)
+        if node_event is not None and self.publish is not None:
+            self.publish(node_event["user"], node_event)
+
+    def _node_event(self, uid, online, announced):
+        return {"user": self._names[uid], "node": self.node, "online": online,
+                "announced": announced, "last_seen": self._last_seen[uid]}
+
+    def remember_contact(self, user, other):
+        with self._lock:
+            a, b = self._id(user), self._id(other)
+            self._contacts[a].add(b)
+            self._contacts[b].add(a)
+            # Yeni kişi bağı olan çevrimdışı kullanıcılar atılma sırasında sona geçer
+            for uid in (a, b):
+                if uid in self._idle:
+                    self._idle.move_to_end(uid)
+
+    def contacts(self, user):
+        with self._lock:
+            uid = self._ids.get(user)
+            return [self._names[c] for c in self._contacts[uid]] if uid is not None else []
+
+    def is_online(self, user):
+        uid = self._ids.get(user)
+        return uid is not None and self._state[uid] == ONLINE
+
+    def connected(self, user):
+        # Kullanıcının bu düğümdeki ilk bağlantısı
+        with self._lock:
+            uid = self._id(user)
+            self._last_seen[uid] = time.time()
+            # Kısa kopma: bekleyen "offline" iptal edilir, kimseye bir şey gitmez
+            # (bu düğüm kümeden henüz çıkarılmadı)
+            if self.wheel.cancel(("offline", uid)):
+                return
+            self._nodes[uid].add(self.node)
+            # Başka bir düğümde zaten çevrimiçiyse kişilere tekrar gitmez
+            announced = self._state[uid] == OFFLINE
+            self._set_state(uid, ONLINE)
+            deltas = self._presence_deltas(uid) if announced else []
+            node_event = self._node_event(uid, True, announced)
+        self._send(deltas, node_event)
+
+    def disconnected(self, user):
+        # Son bağlantı kapandı: yeniden bağlanma için offline_grace kadar beklenir
+        with self._lock:
+            uid = self._id(user)
+            self._last_seen[uid] = time.time()
+            self.wheel.schedule(("offline", uid), self.offline_grace)
+
+    def touch(self, user):
+        uid = self._ids.get(user)
+        if uid is not None:
+            self._last_seen[uid] = time.time()
+
+    def typing(self, user, to, active):
+        # Sadece ortak konuşması olan kullanıcıya ve sadece durum değiştiğinde gider
+        with self._lock:
+            uid, tid = self._ids.get(user), self._ids.get(to)
+            if uid is None or tid is None or tid not in self._contacts[uid]:
+                return
+            self._last_seen[uid] = time.time()
+            key = ("typing", uid, tid)
+            was_typing = self.wheel.scheduled(key)
+            if active:
+                self.wheel.schedule(key, self.typing_ttl)
+            else:
+                self.wheel.cancel(key)
+            if was_typing == active:
+                return
+        self._send([(to, "typing", {"user": user, "active": active})])
+
+    def apply_node(self, data):
+        # Başka bir düğümde kullanıcının ilk bağlantısı açıldı ya da son bağlantısı kapandı
+        with self._lock:
+            uid = self._id(data["user"])
+            nodes = self._nodes[uid]
+            if data["online"]:
+                nodes.add(data["node"])
+            else:
+                nodes.discard(data["node"])
+            self._last_seen[uid] = max(self._last_seen[uid], data.get("last_seen", 0.0))
+            old = self._state[uid]
+            # Bekleyen "offline" varken bu düğüm hâlâ kümede: kullanıcı çevrimiçi kalır
+            state = ONLINE if nodes else OFFLINE
+            self._set_state(uid, state)
+            if data.get("announced"):
+                # Gönderen düğümün kişilere bildirdiği durum burada görülenle çelişiyorsa düzelt
+                stale = (ONLINE if data["online"] else OFFLINE) != state
+            else:
+                # Bildirilmemiş geçiş (ör. iki düğümdeki son bağlantılar aynı anda kapandı)
+                stale = old != state
+            deltas = self._presence_deltas(uid) if stale else []
+        self._send(deltas)
+
+    def snapshot(self, user, others):
+        # İstenen kullanıcılardan sadece kişi olanların durumu
+        with self._lock:
+            uid = self._ids.get(user)
+            if uid is None:
+                return []
+            ids = (self._ids.get(name) for name in others)
+            return [self._status(oid) for oid in ids if oid is not None and oid in self._contacts[uid]]
+
+    def expire(self):
+        # Tick başına bir kez çağrılır; zamanı dolan işleri uygular
+        deltas, node_events = [], []
+        with self._lock:
+            for key in self.wheel.advance():
+                if key[0] == "offline":
+                    uid = key[1]
+                    self._nodes[uid].discard(self.node)
+                    # Başka bir düğümde bağlantısı varsa çevrimiçi kalır
+                    announced = not self._nodes[uid]
+                    if announced:
+                        self._set_state(uid, OFFLINE)
+                        deltas.extend(self._presence_deltas(uid))
+                    node_events.append(self._node_event(uid, False, announced))
+                else:
+                    _, uid, tid = key
+                    deltas.append((self._names[tid], "typing", {"user": self._names[uid], "active": False}))
+        self._send(deltas)
+        for node_event in node_events:
+            self._send((), node_event)
+
+    def run(self, sleep):
+        while True:
+            sleep(self.wheel.tick)
+            self.expire()
@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict, deque
+
+# Yeniden bağlanan istemcinin kaldığı yerden devam etmesi için durum.
+#
+# Inbox: kullanıcıya teslim edilen her mesaj, kabul edildiği düğümün kimliği
+# (node) ve o düğümün kullanıcı başına verdiği artan sıra numarasıyla (seq)
+# işaretlenir; seq'i sadece mesajı kabul eden düğüm verir ve bus ile diğer
+# düğümlere taşınır, bu yüzden iki düğüm aynı (node, seq) çiftini üretemez.
+# İstemci düğüm başına son aldığı seq'i tutar ve yeniden bağlanırken auth
+# içinde gönderir (last_seq: {node: seq}); sunucu her düğüm için sadece
+# ondan sonrakileri tekrar yollar. Bu sadece SOCKET_AUTH=jwt modunda açıktır
+# (bkz. __main__.handle_connect).
+#
+# Bellek sınırı: kullanıcı başına son `size` mesaj, en fazla `max_users`
+# kullanıcı (en uzun süredir mesaj almayan atılır) ve `ttl` saniyeden eski
+# mesajlar atılır. Atılan kullanıcının numarası tekrar 1'den başlamasın diye
+# seq en az milisaniye cinsinden zamandır (saniyede 1000'den az mesajda
+# zamanla birlikte artar).
+#
+# RecentIds: istemcinin gönderdiği mesaj id'leri (stream başına). Ack'i
+# kaybolan mesaj yeniden gönderildiğinde ikinci kez teslim edilmez.
+
+
+class Inbox:
+    def __init__(self, node, size=1000, max_users=10000, ttl=3600, clock=time.time):
+        self.node = node
+        self.size = size
+        self.max_users = max_users
+        self.ttl = ttl
+        self._clock = clock
+        # Kullanıcı -> (mesajlar deque'si [(zaman, node, seq, gönderen, düz metin)],
+        # {node: son seq}); en uzun süredir mesaj almayan başta
+        self._users = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry(self, user, now):
+        entry = self._users.get(user)
+        if entry is None:
+            entry = self._users[user] = (deque(maxlen=self.size), {})
+            if len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(user)
+        messages = entry[0]
+        while messages and messages[0][0] < now - self.ttl:
+            messages.popleft()
+        return entry
+
+    def append(self, user, sender, plaintext, node=None, seq=None):
+        # node/seq verilmezse mesaj bu düğümde kabul edilmiştir ve yeni numara
+        # atanır; bus'tan gelen mesaj kabul edildiği düğümün numarasıyla saklanır.
+        # (node, seq) döner
+        with self._lock:
+            now = self._clock()
+            messages, last = self._entry(user, now)
+            if node is None:
+                node = self.node
+                seq = max(last.get(node, 0) + 1, int(now * 1000))
+            last[node] = max(last.get(node, 0), seq)
+            messages.append((now, node, seq, sender, plaintext))
+        return node, seq
+
+    def last(self, user):
+        # Düğüm başına son seq: {node: seq}
+        with self._lock:
+            entry = self._users.get(user)
+            return dict(entry[1]) if entry is not None else {}
+
+    def since(self, user, last_seq):
+        # last_seq'ten sonraki mesajlar: [(node, seq, gönderen, düz metin)].
+        # last_seq {node: seq} sözlüğüdür; eski istemcilerin tek sayısı tüm
+        # düğümlere uygulanır
+        with self._lock:
+            entry = self._users.get(user)
+            if entry is None:
+                return []
+            oldest = self._clock() - self.ttl
+            if isinstance(last_seq, dict):
+                return [m[1:] for m in entry[0] if m[0] >= oldest and m[2] > last_seq.get(m[1], 0)]
+            return [m[1:] for m in entry[0] if m[0] >= oldest and m[2] > last_seq]
+
+
+class RecentIds:
+    def __init__(self, size=10000, max_streams=10000):
+        self.size = size
+        self.max_streams = max_streams
+        self._streams = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, stream, msg_id):
+        # İlk kez görülen id için True, tekrar için False
+        with self._lock:
+            entry = self._streams.get(stream)
+            if entry is None:
+                entry = self._streams[stream] = (deque(), set())
+                if len(self._streams) > self.max_streams:
+                    self._streams.popitem(last=False)
+            else:
+                self._streams.move_to_end(stream)
+
+            order, seen = entry
+            if msg_id in seen:
+                return False
+            order.append(msg_id)
+            seen.add(msg_id)
+            if len(order) > self.size:
+                seen.discard(order.popleft())
+            return True
@@ -0,0 +1,40 @@
+import base64
+
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+# Bağlantı başına oturum anahtarı (session key) el sıkışması.
+#
+# İstemci bağlanırken auth içinde X25519 açık anahtarını gönderir:
+#   auth = {"user": ..., "pub": <base64 açık anahtar>}
+# Sunucu kendi anahtar çiftini üretir, "session" olayıyla açık anahtarını
+# (ham bytes) gönderir; iki taraf da aynı ortak sırrı HKDF'ten geçirip
+# o bağlantıya özel Fernet anahtarını türetir. Fernet nesnesi bir kez
+# kurulur ve bağlantı boyunca tekrar kullanılır.
+
+_INFO = b"chat-server session v1"
+
+
+def new_keypair():
+    # (özel anahtar, 32 byte ham açık anahtar)
+    private_key = X25519PrivateKey.generate()
+    public_bytes = private_key.public_key().public_bytes(serialization.Encoding.Raw,
+                                                         serialization.PublicFormat.Raw)
+    return private_key, public_bytes
+
+
+def derive_cipher(private_key, peer_public):
+    shared = private_key.exchange(X25519PublicKey.from_public_bytes(peer_public))
+    key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_INFO).derive(shared)
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def encode_public(public_bytes):
+    # auth sözlüğü JSON ile taşındığı için açık anahtar base64 metin olarak gider
+    return base64.b64encode(public_bytes).decode()
+
+
+def decode_public(text):
+    return base64.b64decode(text)
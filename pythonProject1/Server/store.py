@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+import queue
+
+from .logs import logger
+
+# Socket sunucusunu backend'in kalıcılık ve kimlik doğrulama katmanına bağlar.
+#
+# - JWT: istemci bağlanırken auth = {"token": <POST /api/auth/login token'ı>}
+#   gönderir; backend'in verify_token'ı ile doğrulanır (aynı JWT_SECRET).
+# - Kalıcılık: kabul edilen mesajlar backend'in message_service'i ile
+#   "messages" tablosuna yazılır; REST ve socket istemcileri aynı geçmişi görür.
+#   Her mesaj için ayrı commit yerine yazıcı görev mesajları biriktirir ve
+#   flush_interval'da bir (veya batch_size dolunca) tek transaction ile yazar.
+#
+# Backend modülleri düz import kullandığı için backend/ dizini sys.path'e eklenir;
+# veritabanı ayarları backend'in Config'inden (DATABASE_URL, JWT_SECRET) gelir.
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from auth import verify_token  # noqa: E402
+from config import Config  # noqa: E402
+from database import db, init_db  # noqa: E402
+from models.user import User  # noqa: E402
+from services.message_service import create_messages  # noqa: E402
+
+
+class MessageStore:
+    def __init__(self, app, batch_size=500, flush_interval=0.2, default_method="caesar", default_key=None):
+        app.config.setdefault("SQLALCHEMY_DATABASE_URI", Config.SQLALCHEMY_DATABASE_URI)
+        app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False)
+        init_db(app)
+
+        self.app = app
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.default_method = default_method
+        self.default_key = default_key
+        self._queue = queue.Queue()
+        # Kullanıcı adı -> id (kullanıcı adları değişmez; bilinmeyenler önbelleğe girmez)
+        self._user_ids = {}
+
+    def start(self, spawn):
+        spawn(self._run)
+
+    def add(self, sender, recipient, plaintext, method=None, key=None):
+        # Mesaj hangi klasik şifreyle saklanacağını taşımıyorsa varsayılan kullanılır
+        if not method:
+            method, key = self.default_method, self.default_key
+        self._queue.put((sender, recipient, plaintext, method, key))
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _user_ids_for(self, names):
+        # Batch'teki bilinmeyen kullanıcılar tek sorguda çözülür
+        missing = [name for name in names if name not in self._user_ids]
+        if missing:
+            for user_id, username in db.session.query(User.id, User.username).filter(User.username.in_(missing)):
+                self._user_ids[username] = user_id
+        return self._user_ids
+
+    def _write(self, batch):
+        started = time.perf_counter()
+        with self.app.app_context():
+            try:
+                ids = self._user_ids_for({name for sender, recipient, *_ in batch for name in (sender, recipient)})
+                records = [(ids[sender], ids[recipient], plaintext, method, key)
+                           for sender, recipient, plaintext, method, key in batch
+                           if sender in ids and recipient in ids]
+                created, failed = create_messages(records)
+            except Exception:
+                db.session.rollback()
+                logger.exception("message store write failed", extra={"batch": len(batch)})
+                return
+            finally:
+                db.session.remove()
+
+        for record, error in failed:
+            logger.warning("message not stored", extra={"method": record[3], "error": error})
+        logger.debug("messages stored", extra={"batch": len(batch), "stored": len(created),
+                                               "skipped": len(batch) - len(records),
+                                               "ms": round((time.perf_counter() - started) * 1000, 2)})
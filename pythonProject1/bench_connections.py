@@ -0,0 +1,189 @@
+import sys
+import json
+import math
+import time
+import asyncio
+import argparse
+
+import socketio
+from cryptography.fernet import Fernet
+
+from Server.session import new_keypair, derive_cipher, encode_public
+
+# Bağlantı ölçekleme benchmark'ı: tek sunucu sürecinin kaç boşta ve aktif
+# istemciyi taşıyabildiğini ölçer.
+#
+# Kullanım (önce sunucuyu başlat):
+#   SOCKET_AUTH=trust SOCKETIO_ASYNC_MODE=eventlet LOG_LEVEL=WARNING python -m Server
+#   python bench_connections.py --idle 2000 --active 100 --rate 5 --duration 20 --server-pid <pid>
+# Varsayılan olarak her istemci oturum anahtarı ve binary frame kullanır;
+# --key <sunucunun bastığı anahtar> eski (ortak anahtar, metin frame) protokolü ölçer.
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    rank = max(0, math.ceil(len(values) * pct / 100.0) - 1)
+    return values[rank]
+
+
+def summary_ms(values):
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(max(values) * 1000, 3) if values else 0.0,
+    }
+
+
+def server_rss_mb(pid):
+    # Linux: /proc/<pid>/status içindeki VmRSS (kB)
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
+
+
+class BenchClient:
+    def __init__(self, url, name, cipher):
+        self.url = url
+        self.name = name
+        self.cipher = cipher
+        self.legacy = cipher is not None
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.pending = {}
+        self.latencies = []
+        self.next_id = 0
+        self.sio.on("ack", self.on_ack)
+        self.sio.on("session", self.on_session)
+        self._private_key = None
+        self._session_ready = asyncio.Event()
+
+    async def on_session(self, server_public):
+        self.cipher = derive_cipher(self._private_key, server_public)
+        self._session_ready.set()
+
+    async def on_ack(self, data):
+        sent = self.pending.pop(data.get("id"), None)
+        if sent is not None:
+            self.latencies.append(time.perf_counter() - sent)
+
+    async def connect(self):
+        if self.legacy:
+            await self.sio.connect(self.url, auth={"user": self.name}, transports=["websocket"])
+            return
+        self._private_key, public_bytes = new_keypair()
+        await self.sio.connect(self.url, auth={"user": self.name, "pub": encode_public(public_bytes)},
+                               transports=["websocket"])
+        await asyncio.wait_for(self._session_ready.wait(), timeout=10)
+
+    async def send(self, text):
+        self.next_id += 1
+        token = self.cipher.encrypt(text.encode())
+        if self.legacy:
+            token = token.decode()
+        self.pending[self.next_id] = time.perf_counter()
+        await self.sio.emit("chat", {"id": self.next_id, "msg": token})
+
+    async def run_active(self, rate, duration):
+        interval = 1.0 / rate
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            await self.send("benchmark mesajı")
+            await asyncio.sleep(interval)
+
+
+async def connect_all(clients, concurrency):
+    # Aynı anda en fazla `concurrency` bağlantı kurulumu
+    semaphore = asyncio.Semaphore(concurrency)
+    connect_times = []
+    failures = 0
+
+    async def connect_one(client):
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await client.connect()
+                connect_times.append(time.perf_counter() - start)
+            except Exception:
+                failures += 1
+
+    await asyncio.gather(*(connect_one(c) for c in clients))
+    return connect_times, failures
+
+
+async def run(args):
+    cipher = Fernet(args.key.encode()) if args.key else None
+    result = {"config": vars(args).copy()}
+    result["config"]["protocol"] = "shared-key" if result["config"].pop("key") else "session"
+
+    idle = [BenchClient(args.url, f"idle{i}", cipher) for i in range(args.idle)]
+    active = [BenchClient(args.url, f"active{i}", cipher) for i in range(args.active)]
+
+    started = time.perf_counter()
+    idle_times, idle_failures = await connect_all(idle, args.connect_concurrency)
+    result["idle"] = {
+        "requested": args.idle,
+        "connected": len(idle_times),
+        "failed": idle_failures,
+        "seconds": round(time.perf_counter() - started, 3),
+        "connect": summary_ms(idle_times),
+    }
+    if args.server_pid:
+        result["idle"]["server_rss_mb"] = server_rss_mb(args.server_pid)
+
+    active_times, active_failures = await connect_all(active, args.connect_concurrency)
+    connected_active = [c for c in active if c.sio.connected]
+
+    started = time.perf_counter()
+    await asyncio.gather(*(c.run_active(args.rate, args.duration) for c in connected_active))
+    # Son ack'ler için kısa bekleme
+    await asyncio.sleep(1.0)
+    elapsed = time.perf_counter() - started
+
+    latencies = [lat for c in connected_active for lat in c.latencies]
+    sent = sum(c.next_id for c in connected_active)
+    result["active"] = {
+        "requested": args.active,
+        "connected": len(active_times),
+        "failed": active_failures,
+        "messages_sent": sent,
+        "acks": len(latencies),
+        "lost": sent - len(latencies),
+        "throughput_msg_s": round(len(latencies) / elapsed, 2),
+        "ack_latency": summary_ms(latencies),
+    }
+    if args.server_pid:
+        result["active"]["server_rss_mb"] = server_rss_mb(args.server_pid)
+
+    await asyncio.gather(*(c.sio.disconnect() for c in idle + active if c.sio.connected),
+                         return_exceptions=True)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Socket.IO connection scaling benchmark")
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--key", help="Eski protokol: sunucunun bastığı ortak Fernet anahtarı")
+    parser.add_argument("--idle", type=int, default=1000, help="Boşta bekleyen istemci sayısı")
+    parser.add_argument("--active", type=int, default=50, help="Mesaj gönderen istemci sayısı")
+    parser.add_argument("--rate", type=float, default=5.0, help="Aktif istemci başına mesaj/saniye")
+    parser.add_argument("--duration", type=float, default=10.0, help="Aktif faz süresi (saniye)")
+    parser.add_argument("--connect-concurrency", type=int, default=100)
+    parser.add_argument("--server-pid", type=int, help="Sunucu RSS ölçümü için (Linux)")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
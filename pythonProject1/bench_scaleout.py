@@ -0,0 +1,185 @@
+import os
+import sys
+import json
+import math
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+
+import socketio
+from cryptography.fernet import Fernet
+
+# Çoklu düğüm (scale-out) doğrulaması ve gecikme ölçümü.
+#
+# Bir broker ve iki sunucu süreci başlatır (A ve B), ardından:
+#   alice (A) -> carol (A)  aynı düğüm
+#   alice (A) -> bob   (B)  düğümler arası (bus üzerinden)
+# mesajlarının hepsinin teslim edildiğini doğrular ve bus'ın eklediği
+# gecikmeyi raporlar. Başarısız teslimatta çıkış kodu 1'dir.
+#
+# Kullanım: python bench_scaleout.py --messages 500
+#           python bench_scaleout.py --queue redis://localhost:6379/0   (broker yerine Redis)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, timeout=15.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"port {port} açılmadı")
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[max(0, math.ceil(len(values) * pct / 100.0) - 1)]
+
+
+def summary_ms(values):
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+    }
+
+
+class Cluster:
+    def __init__(self, queue_url, async_mode):
+        self.queue_url = queue_url
+        self.async_mode = async_mode
+        self.key = Fernet.generate_key().decode()
+        self.processes = []
+        self.ports = []
+
+    def _spawn(self, args, env):
+        full_env = dict(os.environ, **env)
+        proc = subprocess.Popen([sys.executable, "-W", "ignore", "-m"] + args, cwd=HERE, env=full_env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.processes.append(proc)
+        return proc
+
+    def start(self, nodes=2):
+        queue_url = self.queue_url
+        if not queue_url:
+            broker_port = free_port()
+            self._spawn(["Server.broker"], {"BROKER_PORT": str(broker_port)})
+            wait_for_port(broker_port)
+            queue_url = f"broker://127.0.0.1:{broker_port}"
+
+        for _ in range(nodes):
+            port = free_port()
+            self._spawn(["Server"], {
+                "SOCKET_PORT": str(port),
+                "SOCKET_FERNET_KEY": self.key,
+                # İstemciler kullanıcı adıyla bağlanır (doğrulamasız, sadece ölçüm için)
+                "SOCKET_AUTH": "trust",
+                "SOCKETIO_MESSAGE_QUEUE": queue_url,
+                "SOCKETIO_ASYNC_MODE": self.async_mode,
+                "LOG_LEVEL": "WARNING",
+            })
+            self.ports.append(port)
+        for port in self.ports:
+            wait_for_port(port)
+        return [f"http://127.0.0.1:{port}" for port in self.ports]
+
+    def stop(self):
+        for proc in self.processes:
+            proc.terminate()
+        for proc in self.processes:
+            proc.wait(timeout=10)
+
+
+class Peer:
+    def __init__(self, url, name, cipher):
+        self.url = url
+        self.name = name
+        self.cipher = cipher
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.received = {}
+        self.sio.on("chat", self.on_chat)
+
+    async def on_chat(self, data):
+        # Mesaj metni gönderim sırasını taşır: "<tag>:<n>"
+        text = self.cipher.decrypt(data["msg"].encode()).decode()
+        self.received[text] = time.perf_counter()
+
+    async def connect(self):
+        await self.sio.connect(self.url, auth={"user": self.name}, transports=["websocket"])
+
+
+async def measure(sender, recipient, tag, count, interval):
+    sent = {}
+    for n in range(count):
+        text = f"{tag}:{n}"
+        sent[text] = time.perf_counter()
+        token = sender.cipher.encrypt(text.encode()).decode()
+        await sender.sio.emit("chat", {"id": n, "msg": token, "to": recipient.name})
+        await asyncio.sleep(interval)
+
+    deadline = time.perf_counter() + 5.0
+    while len([t for t in sent if t in recipient.received]) < count and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+
+    latencies = [recipient.received[t] - sent[t] for t in sent if t in recipient.received]
+    return {"sent": count, "delivered": len(latencies), "latency": summary_ms(latencies)}
+
+
+async def run(urls, key, count, interval):
+    cipher = Fernet(key.encode())
+    alice = Peer(urls[0], "alice", cipher)
+    carol = Peer(urls[0], "carol", cipher)
+    bob = Peer(urls[1], "bob", cipher)
+    for peer in (alice, carol, bob):
+        await peer.connect()
+    await asyncio.sleep(0.5)
+
+    same_node = await measure(alice, carol, "same", count, interval)
+    cross_node = await measure(alice, bob, "cross", count, interval)
+
+    for peer in (alice, carol, bob):
+        await peer.sio.disconnect()
+
+    added = {
+        name: round(cross_node["latency"][name] - same_node["latency"][name], 3)
+        for name in ("p50_ms", "p95_ms", "p99_ms")
+    }
+    return {"same_node": same_node, "cross_node": cross_node, "added_latency_ms": added}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Socket.IO scale-out delivery/latency check")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.002, help="Mesajlar arası bekleme (saniye)")
+    parser.add_argument("--queue", help="Broker yerine kullanılacak message queue (örn. redis://...)")
+    parser.add_argument("--async-mode", default="threading")
+    args = parser.parse_args(argv)
+
+    cluster = Cluster(args.queue, args.async_mode)
+    try:
+        urls = cluster.start()
+        result = asyncio.run(run(urls, cluster.key, args.messages, args.interval))
+    finally:
+        cluster.stop()
+
+    print(json.dumps(result, indent=2))
+    ok = all(result[k]["delivered"] == result[k]["sent"] for k in ("same_node", "cross_node"))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+from bench_scaleout import Cluster
+from chat_client import ChatClient
+
+# Mesaj throughput benchmark'ı: batch boyutuna göre saniyedeki mesaj sayısı.
+#
+# Bir sunucu süreci başlatır; alice bob'a N mesaj gönderir ve tüm ack'ler
+# ile bob'a teslimatlar tamamlanana kadar geçen süre ölçülür. Karşılaştırma
+# için "sequential" satırı her mesajın ack'ini bekleyen eski davranıştır.
+#
+# Kullanım: python bench_throughput.py --messages 20000 --batch-sizes 1,10,100,1000
+
+
+async def run_case(url, count, batch_size, window, flush_interval):
+    received = 0
+    done = asyncio.Event()
+
+    def on_message(sender, text):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    alice = ChatClient(url, "alice", batch_size=batch_size, window=window, flush_interval=flush_interval)
+    bob = ChatClient(url, "bob", on_message=on_message)
+    await alice.connect()
+    await bob.connect()
+
+    started = time.perf_counter()
+    futures = []
+    for n in range(count):
+        future = await alice.send(f"benchmark mesajı {n}", to="bob")
+        if window == 1:
+            await alice.flush()
+            await future
+        futures.append(future)
+    await alice.drain()
+    try:
+        await asyncio.wait_for(done.wait(), timeout=30)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.perf_counter() - started
+
+    statuses = [f.result() for f in futures]
+    await alice.close()
+    await bob.close()
+    return {
+        "batch_size": batch_size,
+        "window": window,
+        "messages": count,
+        "acked": len(statuses) - statuses.count("error"),
+        "delivered": received,
+        "seconds": round(elapsed, 3),
+        "msg_per_s": round(received / elapsed, 1),
+    }
+
+
+async def run(url, args):
+    results = []
+    if args.sequential:
+        results.append(dict(await run_case(url, min(args.messages, 2000), 1, 1, 0), mode="sequential"))
+    for batch_size in args.batch_sizes:
+        results.append(dict(await run_case(url, args.messages, batch_size, args.window, args.flush_interval),
+                            mode="pipelined"))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Socket.IO batched message throughput benchmark")
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--batch-sizes", type=lambda v: [int(x) for x in v.split(",")], default=[1, 10, 100, 1000])
+    parser.add_argument("--window", type=int, default=5000, help="Ack bekleyen en fazla mesaj")
+    parser.add_argument("--flush-interval", type=float, default=0.005)
+    parser.add_argument("--no-sequential", dest="sequential", action="store_false")
+    parser.add_argument("--async-mode", default="threading")
+    args = parser.parse_args(argv)
+
+    cluster = Cluster("memory://", args.async_mode)
+    try:
+        (url,) = cluster.start(nodes=1)
+        results = asyncio.run(run(url, args))
+    finally:
+        cluster.stop()
+
+    print(json.dumps(results, indent=2))
+    return 0 if all(r["delivered"] == r["messages"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+import uuid
+import asyncio
+
+import socketio
+
+from Server.frames import pack_tokens, unpack_tokens
+from Server.session import new_keypair, derive_cipher, encode_public
+
+# asyncio sohbet istemcisi: oturum anahtarı, toplu gönderim, pipelining ve
+# kesintiden sonra kaldığı yerden devam.
+#
+# send() mesajı tampona ekler ve hemen döner; tampon batch_size'a ulaşınca
+# ya da flush_interval dolunca tek "chat_batch" emit'i olarak gider. Ack
+# beklenmeden gönderime devam edilir; cevabı beklenmeyen en fazla `window`
+# mesaj olabilir (pencere dolunca send() bekler). Her send() mesajın
+# ack durumunu ("delivered", "sent", "ok", "duplicate", "error") veren bir Future döner.
+#
+# Bağlantı koparsa istemci üstel bekleme (exponential backoff) ile yeniden
+# bağlanır. Bu sürede send() ile gelen mesajlar bellekte bekler (kuyruk
+# sınırı da `window`'dur) ve bağlantı kurulunca ack'i gelmemiş tüm mesajlarla
+# birlikte gönderilir; sunucu aynı id'yi ikinci kez teslim etmez ("duplicate").
+# Gelen mesajlarda sunucunun verdiği (node, seq) izlenir; yeniden bağlanırken
+# düğüm başına son seq bildirilir ve sadece kaçırılan mesajlar tekrar gelir
+# (sunucu SOCKET_AUTH=jwt ile çalışıyorsa; doğrulamasız modda tekrar gönderim yok).
+#
+# SOCKET_AUTH=jwt ile çalışan sunucuya token (POST /api/auth/login) verilir;
+# kullanıcı adı token'dan gelir. `user` sadece SOCKET_AUTH=trust sunucusunda
+# kimlik olarak kullanılır; varsayılan modda kimlik bağlantının sid'idir. send(..., method=, key=) mesajın backend
+# geçmişinde hangi klasik şifreyle saklanacağını seçer (bkz. Server/store.py).
+#
+#   client = ChatClient("http://127.0.0.1:5000", "alice", on_message=print)
+#   await client.connect()
+#   futures = [await client.send(f"mesaj {i}", to="bob") for i in range(1000)]
+#   statuses = await asyncio.gather(*futures)
+#   await client.close()
+
+
+class ChatClient:
+    def __init__(self, url, user, token=None, on_message=None, on_presence=None, on_typing=None,
+                 batch_size=100, window=1000, flush_interval=0.005,
+                 reconnect_delay=0.5, reconnect_delay_max=30):
+        self.url = url
+        self.user = user
+        self.token = token
+        self.on_message = on_message
+        self.on_presence = on_presence
+        self.on_typing = on_typing
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sio = socketio.AsyncClient(reconnection=True, reconnection_delay=reconnect_delay,
+                                        reconnection_delay_max=reconnect_delay_max,
+                                        randomization_factor=0.5)
+        self.cipher = None
+        # Düğüm başına sunucunun bu kullanıcıya verdiği son seq: {node: seq}
+        # (yeniden bağlanırken bildirilir; ilk bağlantıdan önce None)
+        self.last_seq = None
+        # Mesaj id'leri bu akışa aittir; yeniden bağlanınca da aynı kalır
+        self.stream = uuid.uuid4().hex
+
+        self._private_key = None
+        self._session_ready = asyncio.Event()
+        self._window = asyncio.Semaphore(window)
+        self._next_id = 0
+        self._pending = {}
+        # Ack'i gelmemiş mesajlar: id -> (üst bilgi, düz metin). Düz metin tutulur,
+        # çünkü yeniden bağlanınca oturum anahtarı değişir
+        self._unacked = {}
+        # Henüz gönderilmemiş id'ler
+        self._buffer = []
+        self._flush_task = None
+        # Binary ekli paketin frame'leri araya girmesin diye gönderimler sıralı
+        self._emit_lock = asyncio.Lock()
+
+        self.sio.on("session", self._on_session)
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("resume", self._on_resume)
+        self.sio.on("disconnect", self._on_disconnect)
+        self.sio.on("ack", self._on_ack)
+        self.sio.on("ack_batch", self._on_ack_batch)
+        self.sio.on("chat", self._on_chat)
+        self.sio.on("chat_batch", self._on_chat_batch)
+        self.sio.on("presence", self._on_presence)
+        self.sio.on("typing", self._on_typing)
+
+    async def connect(self):
+        # auth bir fonksiyon: her (yeniden) bağlanma denemesinde güncel last_seq gider
+        await self.sio.connect(self.url, auth=self._auth, transports=["websocket"], retry=True)
+        await asyncio.wait_for(self._session_ready.wait(), timeout=10)
+
+    async def send(self, text, to=None, method=None, key=None):
+        await self._window.acquire()
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        item = {"id": self._next_id, "to": to}
+        if method:
+            item.update(method=method, key=key)
+        self._unacked[self._next_id] = (item, text.encode())
+        self._buffer.append(self._next_id)
+
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+        return future
+
+    async def flush(self):
+        if self._flush_task is not None and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+        self._flush_task = None
+        # Bağlantı yoksa mesajlar kuyrukta kalır; oturum kurulunca gönderilir
+        if not self._buffer or self.cipher is None:
+            return
+        ids, self._buffer = self._buffer, []
+        batch = [self._unacked[i] for i in ids if i in self._unacked]
+        try:
+            async with self._emit_lock:
+                await self.sio.emit("chat_batch", {
+                    "messages": [item for item, _ in batch],
+                    "tokens": pack_tokens([self.cipher.encrypt(plaintext) for _, plaintext in batch]),
+                })
+        except socketio.exceptions.SocketIOError:
+            # Bağlantı hazır değil ya da koptu; mesajlar bir sonraki bağlantıda gider
+            self._buffer = ids + self._buffer
+
+    async def typing(self, to, active=True):
+        # Sunucu göstergeyi bir süre sonra kendisi kapatır; yazmaya devam ederken tekrar çağrılır
+        await self.sio.emit("typing", {"to": to, "active": active})
+
+    async def presence_of(self, users):
+        # Sadece ortak konuşması olan kullanıcıların durumu döner
+        return await self.sio.call("presence", {"users": list(users)})
+
+    async def drain(self):
+        # Tampondaki mesajları gönder ve tüm ack'leri bekle
+        await self.flush()
+        if self._pending:
+            await asyncio.gather(*self._pending.values())
+
+    async def close(self):
+        await self.drain()
+        await self.sio.disconnect()
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _auth(self):
+        # Her bağlantıda yeni anahtar çifti: oturum anahtarı bağlantıya özeldir
+        self._private_key, public_bytes = new_keypair()
+        auth = {"user": self.user, "pub": encode_public(public_bytes),
+                "stream": self.stream, "last_seq": self.last_seq}
+        if self.token:
+            auth["token"] = self.token
+        return auth
+
+    def _resolve(self, ack):
+        future = self._pending.pop(ack.get("id"), None)
+        if future is not None:
+            self._unacked.pop(ack["id"], None)
+            self._window.release()
+            if not future.done():
+                future.set_result(ack["status"])
+
+    def _accept_seq(self, node, seq):
+        # Tekrar gelen (zaten alınmış) mesajları atla
+        if seq is None:
+            return True
+        if self.last_seq is None:
+            self.last_seq = {}
+        if seq <= self.last_seq.get(node, 0):
+            return False
+        self.last_seq[node] = seq
+        return True
+
+    async def _on_session(self, server_public):
+        self.cipher = derive_cipher(self._private_key, server_public)
+        self._session_ready.set()
+        # Ack'i gelmemiş her şey (kopmadan önce gönderilenler dahil) sırayla yeniden gider
+        self._buffer = list(self._unacked)
+
+    async def _on_connect(self):
+        # "session" bağlantı tamamlanmadan gelir; gönderim bağlantıdan sonra
+        if self._buffer:
+            await self.flush()
+
+    async def _on_resume(self, data):
+        # İlk bağlantıda başlangıç noktası; bilinmeyen düğümlerin numarası da benimsenir
+        # (düğüm yeniden başlarsa kimliği değişir, seq'i geriye gitmez)
+        if self.last_seq is None:
+            self.last_seq = {}
+        for node, seq in data["seq"].items():
+            self.last_seq.setdefault(node, seq)
+
+    async def _on_disconnect(self, *args):
+        self.cipher = None
+        self._session_ready.clear()
+
+    async def _on_ack(self, data):
+        self._resolve(data)
+
+    async def _on_ack_batch(self, data):
+        for ack in data["acks"]:
+            self._resolve(ack)
+
+    async def _on_chat(self, data):
+        if self._accept_seq(data.get("node"), data.get("seq")) and self.on_message is not None:
+            self.on_message(data["from"], self.cipher.decrypt(data["msg"]).decode())
+
+    async def _on_chat_batch(self, data):
+        for message, token in zip(data["messages"], unpack_tokens(data["tokens"])):
+            if self._accept_seq(message.get("node"), message.get("seq")) and self.on_message is not None:
+                self.on_message(message["from"], self.cipher.decrypt(token).decode())
+
+    async def _on_presence(self, data):
+        if self.on_presence is not None:
+            self.on_presence(data["user"], data["status"])
+
+    async def _on_typing(self, data):
+        if self.on_typing is not None:
+            self.on_typing(data["user"], data["active"])
@@ -1,27 +1,40 @@
+import os
+import sys
+import asyncio
 
-import socketio
-from cryptography.fernet import Fernet
+from chat_client import ChatClient
 
-# Buraya server çalıştırılırken bastığı anahtarı yapıştır
-key = b"7J2ZDx4BRNJYS_erwh4yRDvw37mZhKZJlY1sQcD7qs8="
-cipher = Fernet(key)
+# Oturum anahtarı bağlantı sırasında X25519 ile türetilir (bkz. Server/session.py);
+# artık sunucunun bastığı anahtarı buraya yapıştırmak gerekmez.
+#
+# Kullanım: python client.py <kullanıcı> [alıcı] [mesaj sayısı]
+# JWT ile çalışan sunucu için: CHAT_TOKEN=<login token'ı> python client.py ...
+user = sys.argv[1] if len(sys.argv) > 1 else "client"
+recipient = sys.argv[2] if len(sys.argv) > 2 else None
+count = int(sys.argv[3]) if len(sys.argv) > 3 else 1
 
-sio = socketio.Client()
 
-@sio.event
-def connect():
+def on_message(sender, text):
+    print(f"{sender}:", text)
+
+
+def on_presence(other, status):
+    print(f"{other} -> {status}")
+
+
+async def main():
+    client = ChatClient("http://127.0.0.1:5000", user, token=os.getenv("CHAT_TOKEN"),
+                        on_message=on_message, on_presence=on_presence)
+    await client.connect()
     print("Server'a bağlandı")
 
-@sio.on("message")
-def on_message(data):
-    decrypted = cipher.decrypt(data.encode()).decode()
-    print("Server cevabı:", decrypted)
+    # Mesajlar ack beklenmeden toplu gönderilir; durumlar sonradan toplanır
+    futures = [await client.send(f"Selam, burası {user}! ({i + 1})", to=recipient) for i in range(count)]
+    await client.flush()
+    for i, status in enumerate(await asyncio.gather(*futures), 1):
+        print(f"Mesaj {i}: {status}")
 
-sio.connect("http://127.0.0.1:5000")
+    await client.sio.wait()
 
-# Mesaj gönder
-msg = "Selam, burası client!"
-encrypted_msg = cipher.encrypt(msg.encode()).decode()
-sio.send(encrypted_msg)
 
-sio.wait()
+asyncio.run(main())
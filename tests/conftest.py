@@ -0,0 +1,37 @@
+"""
+Test path setup
+
+The backend (flat imports from backend/), the socket server (the Server
+package in pythonProject1/) and kriptoloji (repo root) are importable
+the same way their own entry points import them.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for path in (ROOT, os.path.join(ROOT, 'backend'), os.path.join(ROOT, 'pythonProject1')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+ENGLISH_TEXT = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of "
+    "foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of light, "
+    "it was the season of darkness, it was the spring of hope, it was the winter of despair, we had "
+    "everything before us, we had nothing before us, we were all going direct to heaven, we were all "
+    "going direct the other way."
+)
+
+
+@pytest.fixture
+def english_text():
+    """English plaintext long enough for the frequency-based solvers (319 letters)"""
+    return ENGLISH_TEXT
+
+
+@pytest.fixture
+def english_letters():
+    """english_text as the ciphers normalize it: upper-case A-Z only"""
+    return ''.join(c for c in ENGLISH_TEXT.upper() if 'A' <= c <= 'Z')
@@ -0,0 +1,78 @@
+"""Alphabet: indeks tabloları, harf katlama ve Türkçe alfabeyle şifreleme"""
+import random
+
+import pytest
+
+from kriptoloji import (
+    Alphabet, LATIN, TURKISH, get_alphabet,
+    ShiftCipher, CaesarCipher, SubstitutionCipher, VigenereCipher, RailFenceCipher, RouteCipher,
+    ColumnarTransposition, PolybiusCipher, HillCipher,
+)
+
+TURKISH_TEXT = 'Pijamalı hasta yağız şoföre çabucak güvendi. İyi ki ÖZLEM ışığı söndürmedi!'
+
+TURKISH_CASES = [
+    (ShiftCipher, (5,)),
+    (CaesarCipher, (3,)),
+    (SubstitutionCipher, ('ZYVÜUTŞSRPÖONMLKJİIHĞGFEDÇCBA',)),
+    (VigenereCipher, ('GÜNEŞ',)),
+    (RailFenceCipher, (4,)),
+    (RouteCipher, (6, 11, 'spiral_ccw')),
+    (ColumnarTransposition, ('ÇİÇEK',)),
+    (PolybiusCipher, ('ANAHTAR',)),
+    (HillCipher, ([[3, 3], [2, 5]],)),
+]
+
+
+def test_latin_folds_accents_and_drops_the_rest():
+    assert LATIN.normalize('Çağrı, ışık; café Straße 42') == 'CAGRIISIKCAFESTRASSE'
+    assert list(LATIN.encode('aZ')) == [0, 25]
+
+
+def test_turkish_case_and_letters():
+    # i <-> İ, ı <-> I; Q/W/X Türkçe alfabede yok
+    assert TURKISH.normalize('istanbul ırmak') == 'İSTANBULIRMAK'
+    assert TURKISH.normalize('Quartz wax') == 'UARTZA'
+    assert TURKISH.size == 29
+    assert TURKISH.decode(TURKISH.encode('abcçdefgğhıijklmnoöprsştuüvyz')) == TURKISH.letters
+
+
+def test_get_alphabet():
+    assert get_alphabet('tr') is TURKISH
+    assert get_alphabet(LATIN) is LATIN
+    with pytest.raises(ValueError):
+        get_alphabet('de')
+
+
+def test_custom_alphabet():
+    greek = Alphabet('el', 'ΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ', pad='Ω')
+
+    assert greek.normalize('αβγ ω!') == 'ΑΒΓΩ'
+    assert ShiftCipher(greek).encrypt('αβγ', 1) == 'ΒΓΔ'
+
+
+@pytest.mark.parametrize('cls, args', TURKISH_CASES, ids=[cls.__name__ for cls, _ in TURKISH_CASES])
+def test_turkish_round_trip(cls, args):
+    cipher = cls(alphabet=TURKISH)
+    letters = TURKISH.normalize(TURKISH_TEXT)
+    if cls is PolybiusCipher:
+        # 4x7 karede Ğ, G ile aynı hücrededir
+        letters = letters.replace('Ğ', 'G')
+
+    encrypted = cipher.encrypt(TURKISH_TEXT, *args)
+
+    assert encrypted != letters
+    assert cipher.decrypt(encrypted, *args) == letters
+
+
+def test_turkish_alphabet_by_name():
+    assert ShiftCipher('tr').encrypt('ZA', 1) == ShiftCipher(TURKISH).encrypt('ZA', 1) == 'AB'
+
+
+def test_turkish_round_trip_random_lengths():
+    rng = random.Random(48)
+    letters = TURKISH.letters.replace('J', '')
+    cipher = VigenereCipher(alphabet=TURKISH)
+    for length in range(1, 60):
+        text = ''.join(rng.choice(letters) for _ in range(length))
+        assert cipher.decrypt(cipher.encrypt(text, 'ŞİFRE'), 'ŞİFRE') == text
@@ -0,0 +1,99 @@
+"""
+Şifrelerin indeks tamponu üzerindeki uygulamaları: baseline (matris/karakter
+döngüsü) sürümünün ürettiği sabit çıktılarla karşılaştırma ve gidiş-dönüş
+"""
+import random
+
+import pytest
+
+from kriptoloji import (
+    ShiftCipher, CaesarCipher, SubstitutionCipher, PlayfairCipher, VigenereCipher, RailFenceCipher,
+    RouteCipher, ColumnarTransposition, PolybiusCipher, PigpenCipher, HillCipher,
+)
+
+PLAINTEXT = 'Meet me at the old mill, 10 PM!'
+
+# (sınıf, key argümanları, encrypt, decrypt(encrypt)); baseline sürümün çıktıları
+GOLDEN = [
+    (ShiftCipher, (7,), 'TLLATLHAAOLVSKTPSSWT', 'MEETMEATTHEOLDMILLPM'),
+    (CaesarCipher, (3,), 'PHHWPHDWWKHROGPLOOSP', 'MEETMEATTHEOLDMILLPM'),
+    (SubstitutionCipher, ('QWERTYUIOPASDFGHJKLZXCVBNM',), 'DTTZDTQZZITGSRDOSSHD', 'MEETMEATTHEOLDMILLPM'),
+    (PlayfairCipher, ('MONARCHY',), 'CLKLCLRSPDFMTCAESUPQAU', 'MEETMEATTHEOLDMILXLPM'),
+    (VigenereCipher, ('LEMON',), 'XIQHZPEFHUPSXRZTPXDZ', 'MEETMEATTHEOLDMILLPM'),
+    (RailFenceCipher, (3,), 'MMTLLETETHODILMEAEMP', 'MEETMEATTHEOLDMILLPM'),
+    (RouteCipher, (4, 5, 'spiral_cw'), 'MEETMHMMPLLIEEATTDLO', 'MEETMEATTHEOLDMILLPM'),
+    (ColumnarTransposition, ('ZEBRAS',), 'MELXETMXETDMTHIXEOLXMALP', 'MEETMEATTHEOLDMILLPM'),
+    (PolybiusCipher, ('POLYBIUS',), '4232325142322451513532121331422113131142', 'MEETMEATTHEOLDMILLPM'),
+    (PigpenCipher, (), 'X1|X1D|X1D|S4L|X1|X1D|S1D|S4L|S4L|X4D|X1D|X3|S4|S4D|X1|S1|S4|S4|X4|X1',
+     'MEETMEATTHEOLDMILLPM'),
+    (HillCipher, ([[3, 3], [2, 5]],), 'WSRZWSFRAVCAQLIMOZDM', 'MEETMEATTHEOLDMILLPM'),
+    (HillCipher, ([[6, 24, 1], [13, 16, 10], [20, 17, 15]],), 'QAEQLUHAKWJCUZJLASLTR', 'MEETMEATTHEOLDMILLPM'),
+]
+
+# Gidiş-dönüşte kayıpsız olanlar (Playfair çift harf arasına X ekler);
+# metinlerde J (Polybius'ta I ile birleşir) ve X (dolgu) yok
+ROUND_TRIP = [
+    (ShiftCipher, (13,)),
+    (CaesarCipher, (3,)),
+    (SubstitutionCipher, ('ZYXWVUTSRQPONMLKJIHGFEDCBA',)),
+    (VigenereCipher, ('LEMON',)),
+    (RailFenceCipher, (2,)),
+    (RailFenceCipher, (7,)),
+    (ColumnarTransposition, ('ZEBRAS',)),
+    (PolybiusCipher, ('KEY',)),
+    (PigpenCipher, ()),
+    (HillCipher, ([[3, 3], [2, 5]],)),
+    (HillCipher, ([[6, 24, 1], [13, 16, 10], [20, 17, 15]],)),
+]
+
+ROUTES = ('spiral_cw', 'spiral_ccw', 'column_down', 'column_up', 'row_right', 'row_left')
+
+# Baseline'ın 4x5 ızgaradaki okuma sırası
+ROUTE_GOLDEN = {
+    'spiral_cw': 'WEAREODXXXXXVDISCERE',
+    'spiral_ccw': 'WDVXXXXXDOERAEIERECS',
+    'column_down': 'WDVXEIEXASRXRCEXEODX',
+    'column_up': 'XVDWXEIEXRSAXECRXDOE',
+    'row_right': 'WEAREDISCOVEREDXXXXX',
+    'row_left': 'ERAEWOCSIDDEREVXXXXX',
+}
+
+
+def _texts(count=40, letters='ABCDEFGHIKLMNOPQRSTUVWYZ', seed=47):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(letters) for _ in range(length)) for length in range(1, count + 1)]
+
+
+@pytest.mark.parametrize('cls, args, encrypted, decrypted', GOLDEN,
+                         ids=[f'{case[0].__name__}-{i}' for i, case in enumerate(GOLDEN)])
+def test_matches_baseline(cls, args, encrypted, decrypted):
+    cipher = cls()
+
+    assert cipher.encrypt(PLAINTEXT, *args) == encrypted
+    assert cipher.decrypt(encrypted, *args) == decrypted
+
+
+@pytest.mark.parametrize('cls, args', ROUND_TRIP, ids=[f'{cls.__name__}-{i}' for i, (cls, _) in enumerate(ROUND_TRIP)])
+def test_round_trip(cls, args):
+    cipher = cls()
+    for text in _texts():
+        assert cipher.decrypt(cipher.encrypt(text, *args), *args) == text
+
+
+@pytest.mark.parametrize('route', ROUTES)
+def test_route_matches_baseline(route):
+    assert RouteCipher().encrypt('WE ARE DISCOVERED', 4, 5, route) == ROUTE_GOLDEN[route]
+
+
+@pytest.mark.parametrize('route', ROUTES)
+@pytest.mark.parametrize('rows, cols', [(1, 6), (3, 4), (4, 4), (5, 3), (6, 7)])
+def test_route_round_trip(route, rows, cols):
+    # Baseline'da spiral_ccw, column_* ve row_left çözümü şifrelemeyi tersine çevirmiyordu
+    cipher = RouteCipher()
+    for text in _texts(rows * cols):
+        assert cipher.decrypt(cipher.encrypt(text, rows, cols, route), rows, cols, route) == text
+
+
+def test_non_letters_are_dropped():
+    assert ShiftCipher().encrypt('a-b c!1', 1) == 'BCD'
+    assert VigenereCipher().decrypt('x i q', 'LEMON') == 'MEE'
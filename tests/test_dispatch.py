@@ -0,0 +1,78 @@
+"""
+Size-adaptive dispatch: the scalar paths give the vector paths' results,
+and crypto_service picks the path by input length
+"""
+import random
+
+import pytest
+
+from kriptoloji import LATIN, TURKISH, VigenereCipher, RailFenceCipher
+from kriptoloji.bench.calibrate import SCALAR_CIPHERS, calibrate
+from metrics import CIPHER_PATH
+from services import crypto_service
+from services.crypto_service import encrypt_text, decrypt_text, set_scalar_thresholds
+
+CASES = [
+    (VigenereCipher, ['A', 'KEY', 'LEMON', 'THEQUICKBROWNFOX']),
+    (RailFenceCipher, [2, 3, 5, 8]),
+]
+
+
+@pytest.fixture
+def thresholds():
+    """Restore the active thresholds after a test replaces them"""
+    saved = {method: dict(ops) for method, ops in crypto_service.SCALAR_THRESHOLDS.items()}
+    yield
+    set_scalar_thresholds(saved)
+
+
+@pytest.mark.parametrize('alphabet', [LATIN, TURKISH], ids=['en', 'tr'])
+@pytest.mark.parametrize('cls, keys', CASES, ids=[cls.__name__ for cls, _ in CASES])
+def test_scalar_matches_vector(cls, keys, alphabet):
+    cipher = cls(alphabet)
+    rng = random.Random(50)
+    for length in range(0, 70):
+        text = ''.join(rng.choice(alphabet.letters + ' .,') for _ in range(length))
+        for key in keys:
+            if isinstance(key, str):
+                key = alphabet.normalize(key) or alphabet.letters[0]
+            assert cipher.encrypt_scalar(text, key) == cipher.encrypt(text, key)
+            assert cipher.decrypt_scalar(text, key) == cipher.decrypt(text, key)
+
+
+def test_rail_fence_scalar_validates_rails():
+    with pytest.raises(ValueError):
+        RailFenceCipher().encrypt_scalar('ABC', 1)
+
+
+def _paths(method):
+    values = CIPHER_PATH.values()
+    return {path: values.get((method, 'encrypt', path), 0) for path in ('scalar', 'vector')}
+
+
+@pytest.mark.parametrize('method, key, width', [('vigenere', 'LEMON', 5), ('rail_fence', '4', 4)])
+def test_dispatch_by_length(thresholds, method, key, width):
+    set_scalar_thresholds({method: {'encrypt': 3.0, 'decrypt': 3.0}})
+    short, long = 'A' * (3 * width - 1), 'A' * (3 * width)
+
+    before = _paths(method)
+    assert decrypt_text(encrypt_text(short, method, key), method, key) == short
+    assert decrypt_text(encrypt_text(long, method, key), method, key) == long
+    after = _paths(method)
+
+    assert after['scalar'] - before['scalar'] == 1
+    assert after['vector'] - before['vector'] == 1
+
+
+def test_unknown_scalar_method_rejected(thresholds):
+    with pytest.raises(ValueError):
+        set_scalar_thresholds({'playfair': {'encrypt': 2.0, 'decrypt': 2.0}})
+
+
+def test_calibration_covers_scalar_ciphers():
+    assert set(SCALAR_CIPHERS) == {'vigenere', 'rail_fence'}
+
+    profile = calibrate(['rail_fence'], min_time=0.0005, max_repeats=2)
+
+    assert set(profile['thresholds']['rail_fence']) == {'encrypt', 'decrypt'}
+    assert all(value > 0 for value in profile['thresholds']['rail_fence'].values())
@@ -0,0 +1,35 @@
+"""Bilinen plaintext ile Hill anahtarı (mod 2 ve mod 13 eleme, CRT)"""
+import pytest
+
+from kriptoloji import HillCipher, ShiftCipher
+from kriptoloji.analysis import recover_hill_key
+
+KEYS = [
+    [[3, 3], [2, 5]],
+    [[6, 24, 1], [13, 16, 10], [20, 17, 15]],
+    [[7, 18, 17, 4], [11, 19, 15, 20], [18, 2, 19, 0], [15, 8, 17, 7]],
+]
+
+
+@pytest.mark.parametrize('key', KEYS, ids=['2x2', '3x3', '4x4'])
+def test_recovers_key_from_crib(english_text, english_letters, key):
+    ciphertext = HillCipher().encrypt(english_text, key)
+    n = len(key)
+
+    # Birkaç blok fazlası bağımlı blokları telafi eder
+    assert recover_hill_key(english_letters[:4 * n * n], ciphertext, n) == key
+
+
+def test_too_short_crib_raises(english_text):
+    ciphertext = HillCipher().encrypt(english_text, KEYS[1])
+
+    with pytest.raises(ValueError):
+        recover_hill_key('ITWASTHE', ciphertext, 3)
+
+
+def test_inconsistent_pair_raises(english_text, english_letters):
+    ciphertext = ShiftCipher().encrypt(english_text, 5)
+
+    # Shift toplamadır (p + 5), 1x1 Hill çarpmadır (k * p): tutarlı anahtar yok
+    with pytest.raises(ValueError):
+        recover_hill_key(english_letters[:40], ciphertext, 1)
@@ -0,0 +1,52 @@
+"""Şifre türü tahmini"""
+import pytest
+
+from kriptoloji import (
+    VigenereCipher, CaesarCipher, ShiftCipher, PlayfairCipher, HillCipher, RailFenceCipher,
+    ColumnarTransposition, SubstitutionCipher, PolybiusCipher, RouteCipher, PigpenCipher,
+)
+from kriptoloji.analysis import identify_cipher, METHODS
+from kriptoloji.analysis.identify import TRANSPOSITIONS
+
+SAMPLES = {
+    'vigenere': (VigenereCipher, ('LANTERN',)),
+    'caesar': (CaesarCipher, (3,)),
+    'shift': (ShiftCipher, (11,)),
+    'playfair': (PlayfairCipher, ('MONARCHY',)),
+    'hill': (HillCipher, ([[6, 24, 1], [13, 16, 10], [20, 17, 15]],)),
+    'rail_fence': (RailFenceCipher, (5,)),
+    'columnar_transposition': (ColumnarTransposition, ('ZEBRAS',)),
+    'substitution': (SubstitutionCipher, ('QWERTYUIOPASDFGHJKLZXCVBNM',)),
+    'polybius': (PolybiusCipher, ('KEY',)),
+    'route': (RouteCipher, (16, 20, 'spiral_cw')),
+    'pigpen': (PigpenCipher, ()),
+}
+
+# Harf istatistiğiyle ayırt edilemeyen gruplar: doğru yöntem grubun içinde olmalı
+GROUPS = {method: TRANSPOSITIONS for method in TRANSPOSITIONS}
+GROUPS.update({'caesar': ('caesar', 'shift'), 'shift': ('caesar', 'shift')})
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_identifies_method(english_text, method):
+    cls, args = SAMPLES[method]
+    ciphertext = cls().encrypt(english_text, *args)
+    group = GROUPS.get(method, (method,))
+
+    ranked = identify_cipher(ciphertext, top=len(group))
+
+    assert method in [name for name, _ in ranked]
+    assert ranked[0][0] in group
+
+
+def test_probabilities_sum_to_one(english_text):
+    ranked, features = identify_cipher(VigenereCipher().encrypt(english_text, 'KEY'), return_features=True)
+
+    assert sorted(name for name, _ in ranked) == sorted(METHODS)
+    assert sum(p for _, p in ranked) == pytest.approx(1.0)
+    assert isinstance(features, dict) and features
+
+
+def test_empty_text_raises():
+    with pytest.raises(ValueError):
+        identify_cipher('')
@@ -0,0 +1,54 @@
+"""
+Sharded metrics: per-thread shards merge on scrape, and the shards of
+exited threads are folded into the base totals instead of piling up
+"""
+import gc
+import threading
+
+import pytest
+
+from metrics import Counter, Histogram
+
+
+def _run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The thread-local holders are released with their threads
+    gc.collect()
+
+
+def test_counter_merges_thread_shards():
+    counter = Counter('test_total', 'test', ('route',))
+    counter.inc('/a')
+
+    _run_threads(lambda: counter.inc('/a', amount=2), 8)
+
+    assert counter.values() == {('/a',): 17}
+
+
+def test_exited_thread_shards_are_retired():
+    counter = Counter('test_retired_total', 'test', ('route',))
+
+    _run_threads(lambda: counter.inc('/b'), 50)
+
+    assert counter._shards == []
+    assert counter.values() == {('/b',): 50}
+    assert counter.expose()[-1] == 'test_retired_total{route="/b"} 50'
+
+
+def test_histogram_totals_survive_retirement():
+    histogram = Histogram('test_seconds', 'test', buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+
+    _run_threads(lambda: histogram.observe(0.5), 4)
+
+    assert histogram._shards != []  # the main thread's shard stays live
+    assert histogram.values()[()] == pytest.approx([1, 4, 0, 2.05])
+    # A retired state is never mutated by later merges
+    snapshot = histogram.values()
+    histogram.observe(5.0)
+    assert snapshot[()] == pytest.approx([1, 4, 0, 2.05])
+    assert histogram.values()[()] == pytest.approx([1, 4, 1, 7.05])
@@ -0,0 +1,83 @@
+"""
+Birleştirilmiş şifre hattı: aşamaları tek tek uygulamakla karşılaştırma
+(farklı uzunluklar, dolgulu aşamalar, Türkçe alfabe)
+"""
+import random
+
+import pytest
+
+from kriptoloji import (
+    CipherPipeline, TURKISH, ShiftCipher, CaesarCipher, SubstitutionCipher, VigenereCipher,
+    RailFenceCipher, RouteCipher, ColumnarTransposition, PlayfairCipher, HillCipher, PolybiusCipher,
+    PigpenCipher,
+)
+
+PIPELINES = {
+    'letters': [(SubstitutionCipher(), 'QWERTYUIOPASDFGHJKLZXCVBNM'), (ShiftCipher(), 3), (VigenereCipher(), 'LEMON'),
+                (CaesarCipher(), 3)],
+    'positions': [(ColumnarTransposition(), 'ZEBRA'), (RailFenceCipher(), 3), (RouteCipher(), 5, 6, 'spiral_ccw')],
+    'mixed': [(SubstitutionCipher(), 'QWERTYUIOPASDFGHJKLZXCVBNM'), (ShiftCipher(), 3),
+              (ColumnarTransposition(), 'ZEBRA'), (RailFenceCipher(), 3)],
+    'rail_only': [(RailFenceCipher(), 4), (RailFenceCipher(), 3)],
+    'vigenere_rail': [(VigenereCipher(), 'KEY'), (RailFenceCipher(), 5), (VigenereCipher(), 'LONGERKEY')],
+    'hill_between': [(ShiftCipher(), 5), (RouteCipher(), 4, 9, 'column_up'), (HillCipher(), [[3, 3], [2, 5]]),
+                     (RailFenceCipher(), 3)],
+    'playfair_last': [(ColumnarTransposition(), 'KEY'), (PlayfairCipher(), 'MONARCHY')],
+    'polybius_last': [(VigenereCipher(), 'KEY'), (RailFenceCipher(), 3), (PolybiusCipher(), 'KEY')],
+    'pigpen_last': [(ShiftCipher(), 7), (ColumnarTransposition(), 'ZEBRAS'), (PigpenCipher(), None)],
+    'turkish': [(SubstitutionCipher(TURKISH), 'ZYVÜUTŞSRPÖONMLKJİIHĞGFEDÇCBA'), (ShiftCipher(TURKISH), 4),
+                (ColumnarTransposition(TURKISH), 'ÇİÇEK'), (RailFenceCipher(TURKISH), 3)],
+}
+
+
+def _sequential(stages, text, decrypt):
+    for cipher, *args in (reversed(stages) if decrypt else stages):
+        text = cipher.decrypt(text, *args) if decrypt else cipher.encrypt(text, *args)
+    return text
+
+
+def _texts(alphabet_letters, seed):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(alphabet_letters) for _ in range(length)) for length in list(range(0, 40)) + [97, 300]]
+
+
+@pytest.mark.parametrize('name', PIPELINES)
+def test_matches_sequential_stages(name):
+    stages = PIPELINES[name]
+    pipeline = CipherPipeline(stages)
+    letters = 'ABCÇDEFGĞHIİKLMNOÖPRSŞTUÜVYZ' if name == 'turkish' else 'ABCDEFGHIKLMNOPQRSTUVWYZ'
+
+    for text in _texts(letters, seed=49):
+        encrypted = pipeline.encrypt(text)
+        assert encrypted == _sequential(stages, text, decrypt=False)
+        assert pipeline.decrypt(encrypted) == _sequential(stages, encrypted, decrypt=True)
+
+
+def test_compatible_stages_are_fused():
+    assert CipherPipeline(PIPELINES['letters']).passes == 1
+    assert CipherPipeline(PIPELINES['positions']).passes == 1
+    assert CipherPipeline(PIPELINES['mixed']).passes == 2
+    assert CipherPipeline(PIPELINES['hill_between']).passes == 4
+
+
+def test_invalid_pipelines_raise():
+    with pytest.raises(ValueError):
+        CipherPipeline([])
+    with pytest.raises(ValueError):
+        CipherPipeline([(PolybiusCipher(), 'KEY'), (ShiftCipher(), 3)])
+    with pytest.raises(ValueError):
+        CipherPipeline([(ShiftCipher(), 3), (ShiftCipher(TURKISH), 3)])
+    with pytest.raises(ValueError):
+        CipherPipeline([(RailFenceCipher(), 1)])
+
+
+def test_backend_pipeline_spec_round_trip(english_text, english_letters):
+    from services.crypto_service import encrypt_text, decrypt_text
+
+    method = 'substitution+shift+columnar_transposition+rail_fence'
+    key = '["QWERTYUIOPASDFGHJKLZXCVBNM", "3", "ZEBRA", "3"]'
+
+    encrypted = encrypt_text(english_text, method, key)
+
+    assert encrypted == _sequential(PIPELINES['mixed'], english_text, decrypt=False)
+    assert decrypt_text(encrypted, method, key).rstrip('X') == english_letters
@@ -0,0 +1,138 @@
+"""
+İki düğümlü presence: düğüm olayları bus yerine bir kuyrukla taşınır,
+notify ise (kullanıcı odasına emit gibi) iki düğüm için ortak listedir
+"""
+import time
+
+from Server.presence import Presence
+
+
+class Cluster:
+    def __init__(self, names=("a", "b")):
+        self.sent = []
+        self.queue = []
+        self.nodes = {}
+        for name in names:
+            self.nodes[name] = Presence(self.notify, self.publisher(name), name,
+                                        offline_grace=0.01, tick=0.005)
+
+    def notify(self, user, event, data):
+        self.sent.append((user, event, data["user"], data.get("status")))
+
+    def publisher(self, source):
+        def publish(user, data):
+            self.queue.extend((name, data) for name in self.nodes if name != source)
+        return publish
+
+    def deliver(self):
+        # Bus: bekleyen düğüm olayları diğer düğümlere uygulanır
+        while self.queue:
+            name, data = self.queue.pop(0)
+            self.nodes[name].apply_node(data)
+
+    def contact(self, user, other):
+        for node in self.nodes.values():
+            node.remember_contact(user, other)
+
+    def expire(self):
+        time.sleep(0.03)
+        for node in self.nodes.values():
+            node.expire()
+
+    def presence(self, user):
+        return [status for _, event, name, status in self.sent if event == "presence" and name == user]
+
+
+def test_first_connection_is_announced_once():
+    cluster = Cluster()
+    cluster.contact("alice", "bob")
+
+    cluster.nodes["a"].connected("alice")
+    cluster.deliver()
+
+    assert cluster.presence("alice") == ["online"]
+    assert cluster.nodes["b"].is_online("alice")
+
+
+def test_user_stays_online_while_another_node_has_a_connection():
+    cluster = Cluster()
+    cluster.contact("alice", "bob")
+    cluster.nodes["a"].connected("alice")
+    cluster.deliver()
+    cluster.nodes["b"].connected("alice")
+    cluster.deliver()
+
+    cluster.nodes["a"].disconnected("alice")
+    cluster.expire()
+    cluster.deliver()
+
+    assert cluster.presence("alice") == ["online"]
+    assert cluster.nodes["a"].is_online("alice") and cluster.nodes["b"].is_online("alice")
+
+    cluster.nodes["b"].disconnected("alice")
+    cluster.expire()
+    cluster.deliver()
+
+    assert cluster.presence("alice") == ["online", "offline"]
+    assert not cluster.nodes["a"].is_online("alice") and not cluster.nodes["b"].is_online("alice")
+
+
+def test_reconnect_within_grace_sends_nothing():
+    cluster = Cluster()
+    cluster.contact("alice", "bob")
+    cluster.nodes["a"].connected("alice")
+    cluster.deliver()
+
+    cluster.nodes["a"].disconnected("alice")
+    cluster.nodes["a"].connected("alice")
+    cluster.expire()
+    cluster.deliver()
+
+    assert cluster.presence("alice") == ["online"]
+    assert cluster.nodes["b"].is_online("alice")
+
+
+def test_simultaneous_last_disconnects_end_offline():
+    cluster = Cluster()
+    cluster.contact("alice", "bob")
+    cluster.nodes["a"].connected("alice")
+    cluster.deliver()
+    cluster.nodes["b"].connected("alice")
+    cluster.deliver()
+
+    # İki düğüm de diğerinin olayını görmeden son bağlantıyı kapatır
+    cluster.nodes["a"].disconnected("alice")
+    cluster.nodes["b"].disconnected("alice")
+    cluster.expire()
+    assert cluster.presence("alice") == ["online"]
+    cluster.deliver()
+
+    # Bildirilmemiş geçiş iki düğümde de görülür (aynı durum iki kez gidebilir)
+    assert set(cluster.presence("alice")[1:]) == {"offline"}
+    assert not cluster.nodes["a"].is_online("alice") and not cluster.nodes["b"].is_online("alice")
+
+
+def test_connect_racing_remote_offline_is_corrected():
+    cluster = Cluster()
+    cluster.contact("alice", "bob")
+    cluster.nodes["a"].connected("alice")
+    cluster.deliver()
+
+    # a "offline" bildirirken alice b'ye bağlanır; olaylar çaprazlanır
+    cluster.nodes["a"].disconnected("alice")
+    cluster.expire()
+    cluster.nodes["b"].connected("alice")
+    cluster.deliver()
+
+    assert cluster.presence("alice")[-1] == "online"
+    assert cluster.nodes["a"].is_online("alice") and cluster.nodes["b"].is_online("alice")
+
+
+def test_idle_ids_are_reused_at_the_limit():
+    presence = Presence(lambda *args: None, max_users=3)
+    for i in range(10):
+        presence.remember_contact(f"u{i}", "hub")
+    presence.connected("hub")
+
+    assert len(presence._names) == 3
+    assert presence.is_online("hub")
@@ -0,0 +1,34 @@
+"""Shift/Caesar kaba kuvvet çözümü ve ki-kare sıralaması"""
+import pytest
+
+from kriptoloji import ShiftCipher, CaesarCipher
+from kriptoloji.analysis import brute_force_shift, rank_shifts, shift_decrypt, to_indices, letter_counts, get_frequencies
+
+
+@pytest.mark.parametrize('shift', [1, 11, 25])
+def test_brute_force_recovers_shift(english_text, english_letters, shift):
+    ciphertext = ShiftCipher().encrypt(english_text, shift)
+
+    candidates = brute_force_shift(ciphertext, top=3)
+
+    assert len(candidates) == 3
+    assert candidates[0][:2] == (shift, english_letters)
+    assert candidates[0][2] < candidates[1][2]
+
+
+def test_caesar_is_shift_three(english_text, english_letters):
+    assert brute_force_shift(CaesarCipher().encrypt(english_text, 3), top=1)[0][:2] == (3, english_letters)
+
+
+def test_shift_decrypt_matches_cipher(english_letters):
+    ciphertext = ShiftCipher().encrypt(english_letters, 7)
+    indices = to_indices(ciphertext)
+
+    assert shift_decrypt(indices, 7) == ShiftCipher().decrypt(ciphertext, 7)
+    ranked = rank_shifts(letter_counts(indices), get_frequencies('en'))
+    assert sorted(shift for shift, _ in ranked) == list(range(26))
+
+
+def test_no_letters_raises():
+    with pytest.raises(ValueError):
+        brute_force_shift('123 !?')
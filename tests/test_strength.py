@@ -0,0 +1,44 @@
+"""
+Strength estimate on send: key profile plus one pass over the ciphertext
+"""
+import pytest
+
+from services.crypto_service import encrypt_text
+from services.strength_service import estimate_strength
+
+
+def _estimate(method, key, text):
+    return estimate_strength(method, key, encrypt_text(text, method, key))
+
+
+def test_rail_fence_keyspace_follows_message_length(english_text):
+    short = _estimate('rail_fence', '3', 'ATTACK AT DAWN')
+    huge_key = _estimate('rail_fence', '1000', english_text)
+
+    # 12 letters: rails 2..11 change the text
+    assert short['keyspace_bits'] == pytest.approx(3.3)
+    # The rail count itself is not the keyspace
+    assert huge_key['keyspace_bits'] == _estimate('rail_fence', '3', english_text)['keyspace_bits']
+    assert huge_key['rating'] == 'weak'
+
+
+def test_rail_fence_stage_adds_no_keyspace():
+    piped = _estimate('rail_fence+caesar', '["5", "3"]', 'ATTACK AT DAWN')
+
+    assert piped['keyspace_bits'] == _estimate('caesar', '3', 'ATTACK AT DAWN')['keyspace_bits']
+
+
+def test_vigenere_period_and_letters(english_text):
+    result = _estimate('vigenere', 'KEYKEY', english_text)
+
+    assert result['keyspace_bits'] == pytest.approx(14.1)
+    assert result['letters'] == 319
+    assert result['letters_per_period'] == pytest.approx(106.3)
+    assert 'Key repeats itself: effective period is 3' in result['warnings']
+
+
+def test_substitution_keeps_letter_statistics(english_text):
+    result = _estimate('substitution', 'QWERTYUIOPASDFGHJKLZXCVBNM', english_text)
+
+    assert result['rating'] == 'weak'
+    assert 'Ciphertext keeps the letter statistics of the plaintext' in result['warnings']
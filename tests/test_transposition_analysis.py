@@ -0,0 +1,49 @@
+"""Columnar transposition ve rail fence anahtar araması"""
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from kriptoloji import ColumnarTransposition, RailFenceCipher
+from kriptoloji.analysis import search_columnar, search_rail_fence, rail_fence_decrypt, to_indices, from_indices
+
+
+@pytest.mark.parametrize('key', ['ZEBRAS', 'KEY', 'GERMAN'])
+def test_columnar_recovers_order(english_text, english_letters, key):
+    ciphertext = ColumnarTransposition().encrypt(english_text, key)
+
+    found, plaintext, _ = search_columnar(ciphertext, max_columns=8, workers=1)[0]
+
+    assert plaintext == english_letters
+    # Bulunan key aynı sütun sırasıdır (harfleri farklı olabilir)
+    assert ColumnarTransposition().encrypt(english_text, found) == ciphertext
+
+
+def test_columnar_shared_executor_matches_single_process(english_text):
+    ciphertext = ColumnarTransposition().encrypt(english_text, 'CRYPTOGA')
+    single = search_columnar(ciphertext, max_columns=8, workers=1, top=3)
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        pooled = search_columnar(ciphertext, max_columns=8, workers=2, top=3, executor=pool)
+
+    assert pooled == single
+
+
+def test_columnar_without_dividing_width_raises():
+    # 7 harf: 2..3 sütunla tam bölünmez
+    with pytest.raises(ValueError):
+        search_columnar('ABCDEFG', workers=1)
+
+
+@pytest.mark.parametrize('rails', [2, 3, 5, 9])
+def test_rail_fence_recovers_rails(english_text, english_letters, rails):
+    ciphertext = RailFenceCipher().encrypt(english_text, rails)
+
+    assert search_rail_fence(ciphertext)[0][:2] == (rails, english_letters)
+
+
+def test_rail_fence_decrypt_matches_cipher():
+    for length in range(0, 30):
+        text = 'ABCDEFGHIJKLMNOPQRSTUVWXYZABCD'[:length]
+        for rails in range(2, 7):
+            ciphertext = RailFenceCipher().encrypt(text, rails)
+            assert from_indices(rail_fence_decrypt(to_indices(ciphertext), rails)) == text
@@ -0,0 +1,34 @@
+"""Vigenère anahtar bulma: IoC ile periyot, sütun ki-kare ile anahtar harfleri"""
+import pytest
+
+from kriptoloji import VigenereCipher
+from kriptoloji.analysis import solve_vigenere, rank_periods, to_indices
+
+
+@pytest.mark.parametrize('key', ['KEY', 'LANTERN', 'CRYPTOGRAM'])
+def test_recovers_key(english_text, english_letters, key):
+    ciphertext = VigenereCipher().encrypt(english_text, key)
+
+    candidates = solve_vigenere(ciphertext)
+
+    assert candidates[0][:2] == (key, english_letters)
+
+
+def test_repeated_key_reduces_to_its_period(english_text):
+    ciphertext = VigenereCipher().encrypt(english_text, 'ABCABC')
+
+    assert solve_vigenere(ciphertext)[0][0] == 'ABC'
+
+
+def test_true_period_ranks_high(english_text):
+    indices = to_indices(VigenereCipher().encrypt(english_text, 'LANTERN'))
+
+    periods = [period for period, _ in rank_periods(indices, 20)]
+
+    # 7'nin katları da aynı IoC'yi verir
+    assert periods[0] % 7 == 0
+
+
+def test_invalid_max_period_raises(english_text):
+    with pytest.raises(ValueError):
+        solve_vigenere(english_text, max_period=0)